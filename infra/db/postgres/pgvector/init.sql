@@ -1,2 +1,34 @@
 -- Enable pgvector extension for vector similarity operations
 CREATE EXTENSION IF NOT EXISTS vector;
+
+-- Collected items written by scripts/collectors/pg_sink.py (COPY + upsert)
+CREATE TABLE IF NOT EXISTS collected_items (
+    id TEXT PRIMARY KEY,
+    source TEXT NOT NULL,
+    category TEXT,
+    platform TEXT,
+    title TEXT,
+    content TEXT,
+    url TEXT,
+    author TEXT,
+    author_id TEXT,
+    published_at TEXT,
+    published_ts BIGINT,
+    collected_at TIMESTAMPTZ,
+    content_hash TEXT,
+    extra JSONB,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+CREATE INDEX IF NOT EXISTS collected_items_content_hash ON collected_items (content_hash);
+CREATE INDEX IF NOT EXISTS collected_items_published_ts ON collected_items USING brin (published_ts);
+
+-- Title+content embeddings keyed by content hash (scripts/collectors/embedding.py).
+-- This table holds the default 256-d hashing embedder; every other model gets its own
+-- item_embeddings_<model>_<dim> table and HNSW index, created on first use.
+CREATE TABLE IF NOT EXISTS item_embeddings (
+    content_hash TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    embedding vector(256) NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+CREATE INDEX IF NOT EXISTS item_embeddings_hnsw ON item_embeddings USING hnsw (embedding vector_cosine_ops);
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+기사 본문 보강 단계 벤치마크 (로컬 crawl-worker 대역)
+
+로컬 crawl-worker 대역 서버(tests/crawl_worker_stand_in.py)를 띄우고
+collectors.article.ArticleEnricher로 합성 항목의 본문을 가져옵니다.
+서버는 요청마다 --delay만큼 지연하고, 전체/호스트별 최대 동시 요청 수를 기록합니다.
+동시성 한도/캐시/실패 재시도 검증은 scripts/tests/test_article_enrichment.py에 있습니다.
+
+  1회차: 모든 URL을 crawl-worker에서 가져옴 (동시성 제한/호스트 공정성 확인)
+  2회차: 같은 항목을 다시 보강 → content_hash 캐시 적중, 실패했던 URL만 다시 요청
+
+사용법:
+  python scripts/bench/bench_article_enrichment.py
+  python scripts/bench/bench_article_enrichment.py --items 500 --hosts 5 --concurrency 16 --per-host 4
+  python scripts/bench/bench_article_enrichment.py --serve 8001   # 대역 서버만 실행
+"""
+
+import argparse
+import os
+import sys
+import time
+from typing import List
+
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, SCRIPTS_DIR)
+
+from collectors.article import ARTICLE_FIELD, ArticleCache, ArticleEnricher, CrawlWorkerClient  # noqa: E402
+from collectors.records import CollectedItem  # noqa: E402
+from tests.crawl_worker_stand_in import start_stand_in  # noqa: E402
+
+
+def synthetic_items(count: int, hosts: int) -> List[CollectedItem]:
+    items = []
+    for i in range(count):
+        # 첫 호스트에 절반을 몰아 공정성 확인
+        host = 0 if i % 2 == 0 else 1 + i % max(1, hosts - 1)
+        items.append(CollectedItem(
+            id=f"{i:016x}",
+            source="bench",
+            title=f"국민연금 기사 {i}",
+            content=f"요약 {i}",
+            url=f"https://news{host}.example.com/article/{i}",
+        ))
+    return items
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="기사 본문 보강 벤치마크")
+    parser.add_argument("--items", type=int, default=200)
+    parser.add_argument("--hosts", type=int, default=4)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--per-host", type=int, default=2)
+    parser.add_argument("--delay", type=float, default=0.05, help="대역 서버의 요청당 지연 (초)")
+    parser.add_argument("--serve", type=int, default=None, help="대역 서버만 해당 포트로 실행")
+    args = parser.parse_args()
+
+    if args.serve:
+        server, _ = start_stand_in(args.serve, args.delay)
+        print(f"crawl-worker 대역: http://127.0.0.1:{args.serve} (Ctrl+C로 종료)")
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            server.shutdown()
+        return 0
+
+    server, state = start_stand_in(0, args.delay)
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    enricher = ArticleEnricher(
+        CrawlWorkerClient(base_url, pool_size=args.concurrency),
+        ArticleCache(":memory:"),
+        max_concurrency=args.concurrency,
+        per_host=args.per_host
+    )
+    items = synthetic_items(args.items, args.hosts)
+    items[-1]['url'] = "https://news1.example.com/missing"
+
+    start = time.perf_counter()
+    enricher(items)
+    first = time.perf_counter() - start
+    first_requests = state.requests
+    print(f"1회차: {args.items}건 {first:.2f}s (순차 예상 {args.items * args.delay:.2f}s), 요청 {first_requests}건, "
+          f"수집 {enricher.fetched} / 실패 {enricher.failed}")
+    print(f"  최대 동시 요청 {state.max_active} (한도 {args.concurrency}), "
+          f"호스트별 최대 {dict(state.max_by_host)} (한도 {args.per_host})")
+
+    again = [CollectedItem.from_dict({**item.to_dict(), ARTICLE_FIELD: None}) for item in items]
+    start = time.perf_counter()
+    enricher(again)
+    print(f"2회차: {time.perf_counter() - start:.3f}s, 추가 요청 {state.requests - first_requests}건, "
+          f"캐시 적중 {enricher.cached}건")
+
+    enricher.close()
+    server.shutdown()
+    ok = state.max_active <= args.concurrency and max(state.max_by_host.values()) <= args.per_host
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""Benchmark cleanup_docs: line-by-line cleaning of every file vs the byte-level prefilter.
+
+Builds a synthetic documentation corpus (Korean prose, tables, fenced code, a few large
+generated references above the mmap threshold; a small share of files with emoji,
+trailing whitespace or irregular headings) and checks it in dry-run mode, without the
+clean-file cache, three ways:
+
+  legacy     readlines() + clean_lines() with a per-line re.sub (before the prefilter)
+  full       check_file(prefilter=False)
+  prefilter  check_file(prefilter=True): only files the byte scan flags are cleaned
+
+All three must report the same set of files needing changes.
+
+Usage:
+  python scripts/bench/bench_cleanup_docs.py
+  python scripts/bench/bench_cleanup_docs.py --files 5000 --dirty 0.02
+  python scripts/bench/bench_cleanup_docs.py --repo     # this repository's docs
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, List, Sequence, Set, Tuple
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+import cleanup_docs as cd  # noqa: E402
+
+PROSE = [
+    "이 문서는 수집기 서비스의 배포 절차와 운영 시 주의사항을 설명합니다.",
+    "요청은 게이트웨이를 거쳐 분석 서비스로 전달되며, 결과는 캐시에 저장됩니다.",
+    "The collector retries failed fetches with exponential backoff and records metrics.",
+    "설정 값은 환경 변수로 주입하며 기본값은 아래 표를 참고하세요 (요청 → 응답 — 재시도).",
+]
+TABLE = ["| 항목 | 설명 | 기본값 |", "|------|------|--------|", "| TIMEOUT | 요청 제한 시간 | 30s |"]
+CODE = ["```python", "def handler(event):", "    return {'status': 200}", "```"]
+DIRT = ["## ✅ 완료된 작업", "설명 문장 끝 공백   ", "###제목 간격", "🚀 배포 안내"]
+
+
+# --- legacy cleaner (cleanup_docs.py before the prefilter) -----------------------------
+
+def legacy_clean_lines(lines: List[str]) -> bool:
+    changed = False
+    in_code = False
+    for line in lines:
+        fence_match = cd.FENCE_RE.match(line)
+        if fence_match:
+            if fence_match.group(1) in line[fence_match.end():]:
+                continue
+            in_code = not in_code
+            continue
+        if not in_code:
+            new_line = cd.EMOJI_RE.sub("", line)
+            m = cd.HEADING_RE.match(new_line)
+            if m:
+                new_line = f"{m.group('hashes')} {new_line[m.end():].lstrip()}"
+            new_line = re.sub(r"[ \t]+$", "", new_line)
+            if new_line != line:
+                changed = True
+    return changed
+
+
+def legacy_check(paths: Sequence[str]) -> Set[str]:
+    flagged = set()
+    for path in paths:
+        with open(path, "r", encoding="utf-8", errors="ignore") as f:
+            if legacy_clean_lines(f.readlines()):
+                flagged.add(path)
+    return flagged
+
+
+def check(paths: Sequence[str], prefilter: bool) -> Set[str]:
+    return {path for path in paths if cd.check_file(path, dry_run=True, update_revision=False, prefilter=prefilter)[0]}
+
+
+# --- synthetic corpus -----------------------------------------------------------------
+
+def make_doc(rng: random.Random, sections: int, dirty: bool) -> str:
+    lines = ["# 서비스 문서", ""]
+    for s in range(sections):
+        lines += [f"## {s + 1}. 개요", ""]
+        lines += rng.choices(PROSE, k=rng.randint(3, 8)) + [""]
+        if s % 2 == 0:
+            lines += TABLE + [""]
+        if s % 3 == 0:
+            lines += CODE + [""]
+    if dirty:
+        lines.insert(rng.randrange(2, len(lines)), rng.choice(DIRT))
+    return "\n".join(lines) + "\n"
+
+
+def build_corpus(root: Path, files: int, dirty: float, large: int, seed: int = 7) -> Tuple[List[str], int]:
+    rng = random.Random(seed)
+    paths = []
+    total = 0
+    for i in range(files):
+        sections = 1000 if i < large else rng.randint(2, 12)
+        text = make_doc(rng, sections, rng.random() < dirty)
+        path = root / f"area{i % 8}" / f"doc{i}.md"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = text.encode("utf-8")
+        path.write_bytes(data)
+        paths.append(str(path))
+        total += len(data)
+    return paths, total
+
+
+def timed(fn: Callable[[], Set[str]], repeat: int) -> Tuple[float, Set[str]]:
+    best = float("inf")
+    result: Set[str] = set()
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def report(paths: Sequence[str], repeat: int) -> int:
+    legacy_time, legacy = timed(lambda: legacy_check(paths), repeat)
+    print(f"  legacy     {legacy_time * 1000:9.1f} ms  flagged {len(legacy):>6}")
+    status = 0
+    for name, prefilter in (("full", False), ("prefilter", True)):
+        new_time, new = timed(lambda: check(paths, prefilter), repeat)
+        print(f"  {name:<10} {new_time * 1000:9.1f} ms  flagged {len(new):>6}  ({legacy_time / new_time:.1f}x faster)")
+        if new != legacy:
+            print(f"  MISMATCH ({name}): {sorted(legacy ^ new)[:10]}")
+            status = 1
+    with_bytes = [p for p in paths if cd.needs_cleaning(Path(p).read_bytes())]
+    print(f"  files sent to the line cleaner by the prefilter: {len(with_bytes)} / {len(paths)}")
+    if not status:
+        print("  results identical")
+    return status
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="cleanup_docs prefilter benchmark")
+    parser.add_argument("--files", type=int, default=3000, help="documents in the synthetic corpus")
+    parser.add_argument("--dirty", type=float, default=0.05, help="share of documents that need cleaning")
+    parser.add_argument("--large", type=int, default=10, help="documents above the mmap threshold")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--repo", action="store_true", help="benchmark on this repository's docs")
+    args = parser.parse_args(argv)
+
+    if args.repo:
+        root = str(SCRIPTS_DIR.parent)
+        paths = list(cd.iter_doc_files(root))
+        print(f"Repository: {root} ({len(paths)} files)")
+        return report(paths, args.repeat)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths, total = build_corpus(Path(tmp), args.files, args.dirty, args.large)
+        print(f"Synthetic corpus: {len(paths):,} files, {total / 1e6:.1f} MB")
+        return report(paths, args.repeat)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
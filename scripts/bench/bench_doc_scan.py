@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""Benchmark wiki doc discovery: legacy os.walk + rglob/glob passes vs one pruned listing.
+
+Builds a synthetic repository shaped like this one (a large node_modules tree next to
+docs/ directories, READMEs at every depth, top-level markdown) and times both discovery
+implementations on it, checking that they find exactly the same files. With --repo the
+git-index backend (git ls-files) is timed as well.
+
+Usage:
+  python scripts/bench/bench_doc_scan.py
+  python scripts/bench/bench_doc_scan.py --vendor-files 50000
+  python scripts/bench/bench_doc_scan.py --repo        # scan this repository instead
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Sequence, Set, Tuple
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+import generate_wiki_docs as gwd  # noqa: E402
+
+README_GLOBS = ["README.md", "README-*.md", "**/README.md", "**/README-*.md"]
+
+
+# --- legacy discovery (generate_wiki_docs.py before the single-pass walker) -----------
+
+def legacy_should_exclude(path: Path) -> bool:
+    return any(part in gwd.EXCLUDED_DIR_NAMES for part in path.parts)
+
+
+def legacy_discover(root: Path) -> Tuple[Set[Path], Set[Path]]:
+    base_dirs = [root / "docs", root / "DOCUMENTS", root / ".windsurf/workflows"]
+    doc_dirs = {p for p in base_dirs if p.exists()}
+    for dirpath, dirnames, _ in os.walk(root):
+        current = Path(dirpath)
+        if legacy_should_exclude(current):
+            dirnames[:] = []
+            continue
+        for name in list(dirnames):
+            if name in gwd.EXCLUDED_DIR_NAMES:
+                dirnames.remove(name)
+        for name in dirnames:
+            if name.lower() == "docs":
+                doc_dirs.add(current / name)
+
+    def allowed(file: Path) -> bool:
+        return not file.suffix or file.suffix.lower() in gwd.ALLOWED_EXTS
+
+    files = set()
+    for directory in doc_dirs:
+        for file in directory.rglob("*"):
+            if file.is_file() and not legacy_should_exclude(file.relative_to(root)) and allowed(file):
+                files.add(file)
+    for pattern in README_GLOBS:
+        for file in root.glob(pattern):
+            if file.is_file() and not legacy_should_exclude(file.relative_to(root)) and allowed(file):
+                files.add(file)
+    for child in root.iterdir():
+        if child.is_dir() and not legacy_should_exclude(child.relative_to(root)):
+            for file in child.glob("*.md"):
+                if file.is_file():
+                    files.add(file)
+    # copy_doc_assets walked every doc dir a second time
+    assets = set()
+    for directory in doc_dirs:
+        for file in directory.rglob("*"):
+            if file.is_file() and not legacy_should_exclude(file.relative_to(root)) and allowed(file):
+                assets.add(file)
+    return files, assets
+
+
+def single_pass(root: Path, backend: str = "walk") -> Tuple[Set[Path], Set[Path]]:
+    scan = gwd.scan_docs(root, backend=backend)
+    return set(scan.doc_files), set(scan.asset_files)
+
+
+# --- synthetic tree -------------------------------------------------------------------
+
+def touch(path: Path, text: str = "x\n") -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+def build_tree(root: Path, vendor_files: int, doc_files: int) -> int:
+    count = 0
+    # vendored dependencies: deep package trees, each with its own README.md and docs/
+    packages = max(1, vendor_files // 25)
+    for p in range(packages):
+        pkg = root / "FRONTEND-DASHBOARD" / "node_modules" / f"pkg{p}"
+        touch(pkg / "README.md")
+        touch(pkg / "docs" / "api.md")
+        for f in range(23):
+            touch(pkg / "lib" / f"sub{f % 3}" / f"mod{f}.js")
+        count += 25
+    for name in ("__pycache__", ".git", "venv"):
+        for f in range(200):
+            touch(root / "services" / name / f"f{f}.pyc")
+            count += 1
+    # real documentation
+    for d in range(doc_files):
+        area = ("docs", "DOCUMENTS", f"services/svc{d % 20}/docs")[d % 3]
+        touch(root / area / f"section{d % 10}" / f"page{d}.md")
+        if d % 7 == 0:
+            touch(root / area / f"section{d % 10}" / f"diagram{d}.png")
+        count += 1
+    for s in range(20):
+        touch(root / "services" / f"svc{s}" / "README.md")
+        touch(root / "services" / f"svc{s}" / "src" / "main.py")
+        touch(root / f"TOP{s}" / f"notes{s}.md")
+        count += 3
+    touch(root / "README.md")
+    touch(root / "README-ko.md")
+    return count + 2
+
+
+def timed(fn: Callable[[Path], Tuple[Set[Path], Set[Path]]], root: Path, repeat: int) -> Tuple[float, Tuple[Set[Path], Set[Path]]]:
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(root)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def report(root: Path, repeat: int, backends: Sequence[str]) -> int:
+    legacy_time, legacy = timed(legacy_discover, root, repeat)
+    print(f"  legacy  {legacy_time * 1000:9.1f} ms  docs {len(legacy[0]):>6}  assets {len(legacy[1]):>6}")
+    status = 0
+    for backend in backends:
+        new_time, new = timed(lambda r: single_pass(r, backend), root, repeat)
+        print(f"  {backend:<7} {new_time * 1000:9.1f} ms  docs {len(new[0]):>6}  assets {len(new[1]):>6}  "
+              f"({legacy_time / new_time:.1f}x faster)")
+        if new != legacy:
+            mismatched = sorted(str(p) for p in (legacy[0] ^ new[0]) | (legacy[1] ^ new[1]))[:10]
+            print(f"  MISMATCH ({backend}): {mismatched}")
+            status = 1
+    if not status:
+        print("  results identical")
+    return status
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Wiki doc discovery benchmark")
+    parser.add_argument("--vendor-files", type=int, default=12000, help="files under node_modules")
+    parser.add_argument("--doc-files", type=int, default=1000, help="documentation files")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--repo", action="store_true", help="benchmark on this repository")
+    args = parser.parse_args(argv)
+
+    if args.repo:
+        print(f"Repository: {gwd.REPO_ROOT}")
+        return report(gwd.REPO_ROOT, args.repeat, ("walk", "git"))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        total = build_tree(root, args.vendor_files, args.doc_files)
+        print(f"Synthetic tree: {total:,} files")
+        return report(root, args.repeat, ("walk",))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
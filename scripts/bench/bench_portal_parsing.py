@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+네이버/다음 검색 결과 파싱 마이크로 벤치마크
+
+저장된 픽스처 페이지(fixtures/*.html)로 기존 방식(전체 페이지 str 디코딩 + html.parser)과
+collectors.portal_parser 백엔드를 비교합니다. 모든 백엔드의 추출 결과가 같은지도 확인합니다.
+
+사용법:
+  python scripts/bench/bench_portal_parsing.py
+  python scripts/bench/bench_portal_parsing.py --repeat 50
+"""
+
+import argparse
+import os
+import sys
+import time
+from typing import Callable, List
+
+from bs4 import BeautifulSoup
+
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, SCRIPTS_DIR)
+
+from collectors import portal_parser  # noqa: E402
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+def baseline_naver(content: bytes) -> List[tuple]:
+    """기존 scrape_naver_news 방식"""
+    soup = BeautifulSoup(content.decode("utf-8"), 'html.parser')
+    titles = []
+    for item in soup.select('.list_news .news_area')[:10]:
+        title_elem = item.select_one('.news_tit')
+        if title_elem:
+            titles.append((title_elem.get('title', ''), title_elem.get('href', '')))
+    return titles
+
+
+def baseline_daum(content: bytes) -> List[tuple]:
+    """기존 scrape_daum_news 방식"""
+    soup = BeautifulSoup(content.decode("utf-8"), 'html.parser')
+    titles = []
+    for item in soup.select('.list_news .cont_inner')[:10]:
+        title_elem = item.select_one('.tit_main')
+        link = title_elem.find('a') if title_elem else None
+        if link:
+            titles.append((link.text.strip(), link.get('href', '')))
+    return titles
+
+
+def timed(fn: Callable[[], list], repeat: int) -> float:
+    fn()  # warm-up
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - started) / repeat * 1000
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description="portal search page parsing benchmark")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    backends = ["bs4"] + (["selectolax"] if portal_parser.HTMLParser is not None else [])
+    cases = [
+        ("naver_search.html", baseline_naver, portal_parser.parse_naver_results),
+        ("daum_search.html", baseline_daum, portal_parser.parse_daum_results),
+    ]
+
+    print(f"bs4 tree builder: {portal_parser.BS4_FEATURES}, repeat={args.repeat}")
+    for fixture, baseline, parse in cases:
+        with open(os.path.join(FIXTURES_DIR, fixture), "rb") as f:
+            content = f.read()
+        expected = baseline(content)
+        base_ms = timed(lambda: baseline(content), args.repeat)
+        print(f"\n{fixture} ({len(content) / 1024:.0f} KB, {len(expected)} items)")
+        print(f"  {'baseline (str + html.parser)':<32} {base_ms:8.2f} ms")
+        for backend in backends:
+            got = [(r['title'], r['url']) for r in parse(content, backend=backend)]
+            if got != expected:
+                print(f"  {backend}: 결과 불일치 {got[:2]} != {expected[:2]}")
+                return 1
+            ms = timed(lambda: parse(content, backend=backend), args.repeat)
+            print(f"  {backend:<32} {ms:8.2f} ms  ({base_ms / ms:.1f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
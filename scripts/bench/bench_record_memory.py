@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+수집 레코드 표현별 메모리 벤치마크
+
+JSON 줄을 한 건씩 파싱해(네트워크/파티션에서 읽는 상황과 동일) 다음 표현으로 보관할 때의
+레코드당 메모리와 100만 건 환산 메모리를 tracemalloc으로 측정합니다.
+
+  dict         기존 방식 (레코드마다 키 테이블 + 반복 문자열 사본)
+  record       collectors.records.CollectedItem (__slots__ + 반복 문자열 intern)
+  batch        collectors.records.RecordBatch (컬럼형)
+
+사용법:
+  python scripts/bench/bench_record_memory.py
+  python scripts/bench/bench_record_memory.py --count 1000000
+"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Iterator
+
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, SCRIPTS_DIR)
+
+from collectors.records import CollectedItem, RecordBatch  # noqa: E402
+
+SOURCES = [
+    ("naver_news", "news", "naver"), ("daum_news", "news", "daum"), ("nps_official", "official", "nps"),
+    ("reddit_korea", "social", "reddit"), ("연합뉴스 경제", "news", "rss"), ("한국경제", "news", "rss"),
+]
+AUTHORS = [f"언론사{i}" for i in range(200)]
+
+
+def synthetic_lines(count: int) -> Iterator[str]:
+    for i in range(count):
+        source, category, platform = SOURCES[i % len(SOURCES)]
+        author = AUTHORS[(i * 7) % len(AUTHORS)]
+        yield json.dumps({
+            "id": f"{i:016x}",
+            "source": source,
+            "category": category,
+            "platform": platform,
+            "title": f"국민연금 개혁안 관련 보도 {i}",
+            "content": f"국민연금 보험료율 조정과 소득대체율 논의 {i} " * 3,
+            "url": f"https://news.example.com/article/{i}",
+            "author": author,
+            "author_id": f"{hash(author) & 0xffffffffffffffff:016x}",
+            "published_at": "2024-01-15T00:30:00+00:00",
+            "published_ts": 1705278600 + i,
+            "collected_at": "2024-01-15T10:00:00",
+        }, ensure_ascii=False)
+
+
+def build_dicts(count: int) -> Any:
+    return [json.loads(line) for line in synthetic_lines(count)]
+
+
+def build_records(count: int) -> Any:
+    return [CollectedItem.from_dict(json.loads(line)) for line in synthetic_lines(count)]
+
+
+def build_batch(count: int) -> Any:
+    batch = RecordBatch()
+    for line in synthetic_lines(count):
+        batch.append(CollectedItem.from_dict(json.loads(line)))
+    return batch
+
+
+def measure(build: Callable[[int], Any], count: int):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    data = build(count)
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del data
+    return current, elapsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="수집 레코드 메모리 벤치마크")
+    parser.add_argument("--count", type=int, default=100_000, help="생성할 레코드 수")
+    args = parser.parse_args()
+
+    print(f"레코드 {args.count:,}건 (100만 건 환산 포함)")
+    baseline = None
+    for name, build in [("dict", build_dicts), ("record", build_records), ("batch", build_batch)]:
+        used, elapsed = measure(build, args.count)
+        per_record = used / args.count
+        baseline = baseline or used
+        print(f"  {name:<7} {per_record:8.0f} B/건  {per_record * 1_000_000 / 2**20:8.1f} MiB/100만건  "
+              f"({used / baseline:5.1%} of dict, 생성 {elapsed:.1f}s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
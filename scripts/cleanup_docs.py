@@ -19,19 +19,48 @@ Usage:
 
 Options:
   --root <path>        Root directory to scan (default: repository root inferred from this script)
-  --dry-run            Do not write changes; only show summary
+  --dry-run            Do not write changes (documents or the clean-file cache); only show summary
   --verbose            Print per-file details
   --update-revision    Append a simple revision row if a "개정 이력" table exists (safe best-effort)
+  --since <rev>        Only clean files changed since the git revision (e.g. in pre-commit/CI)
+  --file-backend       git (tracked + unignored files, one `git ls-files` call), walk, or auto
+  --jobs <n>           Worker processes for files that need cleaning (default: CPU count)
+  --cache <path>       Clean-file cache (default: <root>/.cleanup_docs_cache.json)
+  --no-cache           Read and check every file
+  --no-prefilter       Run the line-by-line cleaner on every file (skips the byte scan)
+
+Before any line processing a file's raw bytes are scanned (mmap for large files) for
+anything the cleaner could change: UTF-8 sequences of the emoji ranges, spaces/tabs before
+a line break, and heading markers not followed by exactly one space. Files without any of
+these skip the line-by-line cleaner entirely.
+
+Files found clean are recorded with (size, mtime_ns, sha256) in the cache; on later runs
+a file whose size and mtime are unchanged is skipped without being read, and one whose
+mtime changed but content hash did not is skipped after hashing. Cleaned files are only
+written when their bytes actually change.
 
 """
 
 from __future__ import annotations
 import argparse
+import hashlib
+import io
+import json
+import mmap
 import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import Iterable, List, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from doctools.gitfiles import ChangeSet, add_enumeration_arguments, list_files, resolve_changes
+
+CACHE_NAME = ".cleanup_docs_cache.json"
+# Bump when clean_lines() changes, so files recorded as clean are checked again
+CLEANER_VERSION = 1
+# Below this many files to check the pool start-up costs more than it saves
+POOL_THRESHOLD = 16
 
 # Target file extensions
 DOC_EXTS = {".md", ".markdown", ".rst", ".txt"}
@@ -67,6 +96,28 @@ FENCE_RE = re.compile(r"^\s*(```|~~~)")
 # Markdown heading marker at line start
 HEADING_RE = re.compile(r"^(?P<hashes>#{1,6})(?P<space>\s*)")
 
+# Trailing spaces/tabs (lines keep their newline, which `$` matches before)
+TRAILING_WS_RE = re.compile(r"[ \t]+$")
+
+# Byte-level prefilter: a file without a hit is left unchanged by clean_lines().
+# It errs on the side of a hit (e.g. it ignores code fences); hits get the full check.
+# Patterns start with a literal or a small byte class so the regex engine can skip ahead.
+EMOJI_BYTES_RE = re.compile(
+    rb"[\xe2\xef\xf0](?:(?<=\xf0)\x9f[\x8c-\xab]"   # U+1F300-U+1FAFF
+    rb"|(?<=\xe2)(?:[\x98-\x9e]|\x80\x8d)"          # U+2600-U+27BF, U+200D
+    rb"|(?<=\xef)\xb8\x8f)"                          # U+FE0F
+)
+TRAILING_WS_BYTES = (b" \n", b"\t\n", b" \r", b"\t\r")
+# Unicode whitespace that `\s` strips after a heading marker (NBSP, NEL, U+2000-200A, ...)
+_UNICODE_SPACE_BYTES = rb"\xc2[\x85\xa0]|\xe1\x9a\x80|\xe2\x80[\x80-\x8a\xa8\xa9\xaf]|\xe2\x81\x9f|\xe3\x80\x80"
+# At line start: 7+ hashes, or 1-6 hashes not followed by one space and a non-space character
+HEADING_BYTES_RE = re.compile(
+    rb"#(?<![^\r\n]#)(?:#{6}|#{0,5}(?!#)(?! (?![\s\x1c-\x1f]|" + _UNICODE_SPACE_BYTES + rb")))"
+)
+# Files at least this large are scanned through mmap instead of being read into memory
+MMAP_THRESHOLD = 256 * 1024
+_HASH_CHUNK = 1 << 20
+
 # Table detection for revision updates
 REVISION_HEADER_RE = re.compile(r"^##\s*개정\s*이력\s*$")
 TABLE_SEPARATOR_RE = re.compile(r"^\|\s*-+")
@@ -79,16 +130,19 @@ def should_exclude_dir(path_parts: Iterable[str]) -> bool:
     return False
 
 
-def iter_doc_files(root: str) -> Iterable[str]:
-    for dirpath, dirnames, filenames in os.walk(root):
-        # Prune excluded directories in-place for efficiency
-        dirnames[:] = [d for d in dirnames if d not in EXCLUDED_DIRS]
-        if should_exclude_dir(os.path.relpath(dirpath, root).split(os.sep)):
-            continue
-        for fn in filenames:
-            ext = os.path.splitext(fn)[1].lower()
-            if ext in DOC_EXTS:
-                yield os.path.join(dirpath, fn)
+def is_doc_file(rel: str) -> bool:
+    return os.path.splitext(rel)[1].lower() in DOC_EXTS
+
+
+def iter_doc_files(root: str, backend: str = "auto", changes: Optional[ChangeSet] = None) -> Iterable[str]:
+    if changes is not None:
+        # Changed-since mode: only what git reports, never a full listing
+        rels = sorted(rel for rel in changes.changed if not should_exclude_dir(rel.split("/")[:-1]))
+    else:
+        rels = list_files(root, EXCLUDED_DIRS, backend=backend)
+    for rel in rels:
+        if is_doc_file(rel):
+            yield os.path.join(root, *rel.split("/"))
 
 
 def clean_lines(lines: List[str]) -> Tuple[List[str], bool]:
@@ -126,7 +180,7 @@ def clean_lines(lines: List[str]) -> Tuple[List[str], bool]:
                 new_line = f"{hashes} {rest.lstrip()}"
 
             # Remove trailing whitespace
-            new_line = re.sub(r"[ \t]+$", "", new_line)
+            new_line = TRAILING_WS_RE.sub("", new_line)
 
             if new_line != line_out:
                 changed = True
@@ -177,8 +231,61 @@ def maybe_update_revision(lines: List[str]) -> Tuple[List[str], bool]:
 
 
 def process_file(path: str, dry_run: bool, verbose: bool, update_revision: bool) -> Tuple[bool, int]:
-    with open(path, "r", encoding="utf-8", errors="ignore") as f:
-        orig = f.readlines()
+    changed, line_count, _ = check_file(path, dry_run=dry_run, update_revision=update_revision)
+    if verbose and changed:
+        print(f"✔ Updated: {path}")
+    return changed, line_count
+
+
+def needs_cleaning(data) -> bool:
+    """Byte-level prefilter over bytes or an mmap: False means clean_lines() changes nothing."""
+    if any(data.find(seq) != -1 for seq in TRAILING_WS_BYTES) or data[-1:] in (b" ", b"\t"):
+        return True
+    if HEADING_BYTES_RE.search(data) or EMOJI_BYTES_RE.search(data):
+        return True
+    with memoryview(data) as view:
+        try:
+            # Invalid UTF-8 is dropped when decoding, which can expose e.g. trailing whitespace
+            str(view, "utf-8")
+        except UnicodeDecodeError:
+            return True
+    return False
+
+
+def _clean_entry(path: str, data) -> dict:
+    stat = os.stat(path)
+    with memoryview(data) as view:
+        digest = hashlib.sha256(view).hexdigest()
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": digest}
+
+
+def _count_lines(data) -> int:
+    count = 0
+    for start in range(0, len(data), _HASH_CHUNK):
+        count += data[start:start + _HASH_CHUNK].count(b"\n")
+    return count + (1 if len(data) and data[-1:] != b"\n" else 0)
+
+
+def check_file(path: str, dry_run: bool, update_revision: bool,
+               prefilter: bool = True) -> Tuple[bool, int, Optional[dict]]:
+    """Clean one file; returns (changed, line count, cache entry if the file is now clean)."""
+    data = None
+    if prefilter:
+        if os.path.getsize(path) >= MMAP_THRESHOLD:
+            with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                if not needs_cleaning(mapped):
+                    return False, _count_lines(mapped), _clean_entry(path, mapped)
+        else:
+            with open(path, "rb") as f:
+                data = f.read()
+            if not needs_cleaning(data):
+                return False, _count_lines(data), _clean_entry(path, data)
+
+    if data is None:
+        with open(path, "rb") as f:
+            data = f.read()
+    # Same decoding and newline handling as reading the file in text mode
+    orig = io.StringIO(data.decode("utf-8", errors="ignore"), newline=None).readlines()
 
     cleaned, changed = clean_lines(orig)
 
@@ -187,13 +294,73 @@ def process_file(path: str, dry_run: bool, verbose: bool, update_revision: bool)
         cleaned, rev_changed = maybe_update_revision(cleaned)
         changed = changed or rev_changed
 
-    if changed and not dry_run:
-        with open(path, "w", encoding="utf-8") as f:
-            f.writelines(cleaned)
+    entry: Optional[dict] = None
+    if changed:
+        new_data = "".join(cleaned).encode("utf-8")
+        if new_data == data:
+            changed = False
+        elif not dry_run:
+            with open(path, "wb") as f:
+                f.write(new_data)
+            data = new_data
+    if not changed or not dry_run:
+        stat = os.stat(path)
+        entry = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": hashlib.sha256(data).hexdigest()}
+    return changed, len(orig), entry
+
+
+def _check_task(task: Tuple[str, bool, bool, bool]) -> Tuple[str, bool, int, Optional[dict]]:
+    path, dry_run, update_revision, prefilter = task
+    return (path, *check_file(path, dry_run=dry_run, update_revision=update_revision, prefilter=prefilter))
+
+
+class CleanCache:
+    """repo-relative path -> {size, mtime_ns, sha256} of files known to need no cleaning."""
+
+    def __init__(self, path: Optional[str]):
+        self.path = path
+        self.entries: Dict[str, dict] = {}
+        if path:
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                if data.get("version") == CLEANER_VERSION:
+                    self.entries = data.get("files", {})
+            except (OSError, ValueError, AttributeError):
+                self.entries = {}
+
+    def is_clean(self, rel: str, path: str) -> bool:
+        entry = self.entries.get(rel)
+        if entry is None:
+            return False
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return False
+        if entry["size"] != stat.st_size:
+            return False
+        if entry["mtime_ns"] == stat.st_mtime_ns:
+            return True
+        # Touched (checkout, rebase) but possibly identical: hashing is still cheaper than cleaning
+        with open(path, "rb") as f:
+            if hashlib.sha256(f.read()).hexdigest() != entry["sha256"]:
+                return False
+        self.entries[rel] = {**entry, "mtime_ns": stat.st_mtime_ns}
+        return True
+
+    def record(self, rel: str, entry: Optional[dict]) -> None:
+        if entry is None:
+            self.entries.pop(rel, None)
+        else:
+            self.entries[rel] = entry
 
-    if verbose and changed:
-        print(f"✔ Updated: {path}")
-    return changed, len(orig)
+    def save(self) -> None:
+        if not self.path:
+            return
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"version": CLEANER_VERSION, "files": dict(sorted(self.entries.items()))}, f, indent=0)
+        os.replace(tmp, self.path)
 
 
 def main(argv: List[str]) -> int:
@@ -202,22 +369,50 @@ def main(argv: List[str]) -> int:
     parser.add_argument("--dry-run", action="store_true", help="Only show what would change")
     parser.add_argument("--verbose", action="store_true", help="Print per-file updates")
     parser.add_argument("--update-revision", action="store_true", help="Append a row to existing '개정 이력' table if present")
+    parser.add_argument("--jobs", type=int, default=None, help="Worker processes for files to check (default: CPU count)")
+    parser.add_argument("--cache", default=None, help=f"Clean-file cache path (default: <root>/{CACHE_NAME})")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore and do not update the clean-file cache")
+    parser.add_argument("--no-prefilter", action="store_true", help="Run the line-by-line cleaner on every file checked")
+    add_enumeration_arguments(parser)
     args = parser.parse_args(argv)
 
     script_dir = os.path.dirname(os.path.abspath(__file__))
     repo_root = os.path.abspath(os.path.join(script_dir, "..")) if not args.root else os.path.abspath(args.root)
 
+    changes = resolve_changes(repo_root, args.since)
+    cache = CleanCache(None if args.no_cache else os.path.abspath(args.cache or os.path.join(repo_root, CACHE_NAME)))
+
     total_files = 0
     changed_files = 0
+    cached_files = 0
 
-    for fp in iter_doc_files(repo_root):
+    pending: List[str] = []
+    for fp in iter_doc_files(repo_root, backend=args.file_backend, changes=changes):
         total_files += 1
-        changed, _ = process_file(fp, dry_run=args.dry_run, verbose=args.verbose, update_revision=args.update_revision)
+        if cache.is_clean(os.path.relpath(fp, repo_root), fp):
+            cached_files += 1
+        else:
+            pending.append(fp)
+
+    tasks = [(fp, args.dry_run, args.update_revision, not args.no_prefilter) for fp in pending]
+    jobs = max(1, min(args.jobs or os.cpu_count() or 1, len(tasks)))
+    if jobs == 1 or len(tasks) < POOL_THRESHOLD:
+        results = list(map(_check_task, tasks))
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(_check_task, tasks, chunksize=max(1, len(tasks) // (jobs * 4))))
+    for fp, changed, _, entry in results:
+        cache.record(os.path.relpath(fp, repo_root), entry)
         if changed:
             changed_files += 1
+            if args.verbose:
+                print(f"✔ Updated: {fp}")
+    if not args.dry_run:
+        cache.save()
 
     print("---")
     print(f"Scanned files: {total_files}")
+    print(f"Skipped (cached clean): {cached_files}")
     print(f"Changed files: {changed_files}{' (dry-run)' if args.dry_run else ''}")
     if args.dry_run:
         print("Run without --dry-run to apply changes.")
@@ -4,13 +4,23 @@
 국민연금 관련 실제 데이터를 다양한 소스에서 수집합니다.
 """
 
-import requests
-import json
+import argparse
 import time
-from datetime import datetime, timedelta
-from typing import List, Dict, Any
-import feedparser
-import hashlib
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Any, Iterable
+import os
+
+from collectors.article import add_article_arguments
+from collectors.embedding import add_embedding_arguments
+from collectors.feed_parser import fetch_feed_items
+from collectors.pg_sink import add_sink_arguments
+from collectors.pipeline import Source, make_item_id, make_user_id, run_source, text_contains
+from collectors.ratelimit import HeaderRateLimiter
+from collectors.records import CollectedItem, RecordBatch
+from collectors.runner import CollectionResult, add_pipeline_arguments, run_collection
+from collectors.stats import CollectionStats
+from collectors.transport import add_transport_arguments, configure_transport, get_transport
+from collectors.watermark import WatermarkStore, shared_store
 
 # 데이터 수집 소스 설정
 DATA_SOURCES = {
@@ -43,7 +53,9 @@ DATA_SOURCES = {
     ],
     "reddit": {
         "subreddits": ["korea", "hanguk", "Korean", "Living_in_Korea"],
-        "keywords": ["국민연금", "연금", "pension", "retirement", "노후"]
+        "keywords": ["국민연금", "연금", "pension", "retirement", "노후"],
+        "page_size": 100,  # Reddit listing 최대값
+        "max_pages": 10    # 실행당 서브레딧별 최대 페이지 (백필 시 --reddit-max-pages로 조정)
     },
     "news_comments": [
         {
@@ -59,189 +71,292 @@ DATA_SOURCES = {
     ]
 }
 
+# 교차 소스 중복 제거 인덱스 (실행 간 유지)
+DEDUP_INDEX_PATH = os.environ.get(
+    "COLLECTOR_DEDUP_INDEX",
+    "/home/nodove/workspace/Capstone/data/dedup_index.sqlite3"
+)
+
+# Reddit 서브레딧별 워터마크 (마지막으로 본 최신 글)
+REDDIT_STATE_PATH = os.environ.get(
+    "COLLECTOR_REDDIT_STATE",
+    "/home/nodove/workspace/Capstone/data/reddit_watermarks.json"
+)
+REDDIT_WATERMARKS = WatermarkStore(REDDIT_STATE_PATH)
+
+# RSS 피드별 워터마크 (마지막으로 본 최신 항목). scrape_real_data.py와 파일을 공유하지만
+# 필터가 달라 키에 수집기 이름을 붙임 (feed_watermark_key)
+FEED_STATE_PATH = os.environ.get(
+    "COLLECTOR_FEED_STATE",
+    "/home/nodove/workspace/Capstone/data/feed_watermarks.json"
+)
+FEED_WATERMARKS = shared_store(FEED_STATE_PATH)
+
+# 게시일(UTC) 기준 일자 파티션 저장 위치: <dir>/dt=YYYY-MM-DD/*.jsonl
+PARTITION_DIR = os.environ.get(
+    "COLLECTOR_PARTITION_DIR",
+    "/home/nodove/workspace/Capstone/data/partitions"
+)
+# 모든 서브레딧이 같은 API 할당량을 공유
+REDDIT_RATE_LIMITER = HeaderRateLimiter()
+
+RSS_KEYWORDS = ['연금', '국민연금', '노후', '퇴직', 'pension', '은퇴']
+
 def generate_user_id(author: str, platform: str) -> str:
     """사용자 ID 생성"""
-    return hashlib.md5(f"{platform}:{author}".encode()).hexdigest()[:16]
+    return make_user_id(author, platform)
+
+def parse_rss_entry(entry: Dict[str, Any], feed_info: Dict[str, Any]) -> Iterable[CollectedItem]:
+    """스트리밍 파서가 반환한 피드 항목 하나를 레코드로 변환"""
+    author = entry['author'] or entry['feed_title'] or 'Unknown'
+    yield CollectedItem(
+        id=make_item_id(entry['link'] or ''),
+        source=feed_info['name'],
+        category=feed_info['category'],
+        platform="rss",
+        title=entry['title'] or '',
+        content=(entry['summary'] or '')[:500],
+        url=entry['link'] or '',
+        author=author,
+        author_id=generate_user_id(author, "rss"),
+        published_at=entry['published'] or datetime.now().isoformat(),
+        collected_at=datetime.now().isoformat()
+    )
+
+def feed_watermark_key(url: str) -> str:
+    return f"collect_real_data:{url}"
 
-def collect_rss_feeds() -> List[Dict[str, Any]]:
-    """RSS 피드에서 데이터 수집"""
+def commit_feed_watermark(feed_info: Dict[str, Any]) -> None:
+    """수집한 항목을 저장한 뒤 보류 중인 피드 워터마크 확정"""
+    FEED_WATERMARKS.commit([feed_watermark_key(feed_info['url'])])
+
+def rss_source(feed_info: Dict[str, Any]) -> Source:
+    """RSS 피드 하나 (국민연금 관련 항목만, 피드당 최대 20개, 이전 실행에서 본 항목에서 중단)"""
+    def fetch():
+        print(f"\n📡 수집 중: {feed_info['name']}")
+        print(f"   URL: {feed_info['url']}")
+        yield from fetch_feed_items(get_transport(), feed_info['url'], limit=20, watermarks=FEED_WATERMARKS,
+                                    key=feed_watermark_key(feed_info['url']))
+    
+    return Source(
+        name=feed_info['name'],
+        fetch=fetch,
+        parse=lambda entry: parse_rss_entry(entry, feed_info),
+        filter=text_contains(*RSS_KEYWORDS),
+        commit=lambda: commit_feed_watermark(feed_info)
+    )
+
+def collect_rss_feed(feed_info: Dict[str, Any]) -> List[CollectedItem]:
+    """RSS 피드 하나에서 데이터 수집 (저장 후 commit_feed_watermark() 호출 필요)"""
+    return run_source(rss_source(feed_info))
+
+def collect_rss_feeds() -> List[CollectedItem]:
+    """RSS 피드에서 데이터 수집 (저장 후 commit_feed_watermark() 호출 필요)"""
     collected_data = []
     
     for feed_info in DATA_SOURCES["rss_feeds"]:
-        print(f"\n📡 수집 중: {feed_info['name']}")
-        print(f"   URL: {feed_info['url']}")
-        
         try:
-            feed = feedparser.parse(feed_info['url'])
-            
-            if not feed.entries:
-                print(f"   ⚠️ 항목이 없습니다")
-                continue
-                
-            for entry in feed.entries[:20]:  # 각 피드에서 최대 20개
-                # 국민연금 관련 항목만 필터링
-                if any(keyword in (entry.get('title', '') + entry.get('summary', '')).lower() 
-                       for keyword in ['연금', '국민연금', '노후', '퇴직', 'pension', '은퇴']):
-                    
-                    data = {
-                        "id": hashlib.md5(entry.get('link', '').encode()).hexdigest()[:16],
-                        "source": feed_info['name'],
-                        "category": feed_info['category'],
-                        "platform": "rss",
-                        "title": entry.get('title', ''),
-                        "content": entry.get('summary', '')[:500],
-                        "url": entry.get('link', ''),
-                        "author": entry.get('author', feed.feed.get('title', 'Unknown')),
-                        "author_id": generate_user_id(
-                            entry.get('author', feed.feed.get('title', 'Unknown')), 
-                            "rss"
-                        ),
-                        "published_at": entry.get('published', datetime.now().isoformat()),
-                        "collected_at": datetime.now().isoformat()
-                    }
-                    collected_data.append(data)
-                    print(f"   ✅ 수집: {data['title'][:50]}...")
-                    
+            collected_data.extend(collect_rss_feed(feed_info))
         except Exception as e:
             print(f"   ❌ 오류: {str(e)}")
             continue
     
     return collected_data
 
-def collect_reddit_data() -> List[Dict[str, Any]]:
-    """Reddit에서 데이터 수집 (공개 API)"""
-    collected_data = []
+def fetch_subreddit_pages(subreddit: str, max_pages: int = None, since: float = None) -> Iterable[List[Dict[str, Any]]]:
+    """서브레딧 검색 결과를 페이지 단위로 반환 (공개 API, after 커서 페이지네이션)
+    
+    - 이전 실행의 워터마크(마지막으로 본 최신 글)에 도달하면 중단
+    - since(UTC epoch)보다 오래된 글에 도달하면 중단 (백필 범위)
+    - 요청 간격은 X-Ratelimit-* 헤더로 조절
+    - 새 워터마크는 보류만 하고, 호출자가 항목을 저장한 뒤 commit_subreddit_watermark()로 확정
+    """
+    reddit_config = DATA_SOURCES["reddit"]
+    max_pages = max_pages or reddit_config["max_pages"]
     headers = {'User-Agent': 'PensionSentimentBot/1.0'}
+    watermark = REDDIT_WATERMARKS.get(subreddit)
+    newest = None
+    after = None
+    stop_reason = "max_pages"
+    post_count = 0
     
-    for subreddit in DATA_SOURCES["reddit"]["subreddits"]:
-        print(f"\n🤖 Reddit 수집: r/{subreddit}")
+    print(f"\n🤖 Reddit 수집: r/{subreddit}")
+    
+    for page in range(max_pages):
+        # Reddit의 공개 JSON API 사용
+        url = f"https://www.reddit.com/r/{subreddit}/search.json"
+        params = {
+            "q": "pension OR 연금",
+            "limit": reddit_config["page_size"],
+            "sort": "new",
+            "restrict_sr": "on"
+        }
+        if after:
+            params["after"] = after
         
-        try:
-            # Reddit의 공개 JSON API 사용
-            url = f"https://www.reddit.com/r/{subreddit}/search.json?q=pension+OR+연금&limit=25&sort=new"
-            response = requests.get(url, headers=headers, timeout=10)
-            
-            if response.status_code != 200:
-                print(f"   ⚠️ 접근 실패: {response.status_code}")
-                continue
-                
-            data = response.json()
-            posts = data.get('data', {}).get('children', [])
+        REDDIT_RATE_LIMITER.wait()
+        response = get_transport().get(url, headers=headers, params=params)
+        REDDIT_RATE_LIMITER.update(response.headers, response.status_code)
+        
+        if response.status_code != 200:
+            print(f"   ⚠️ 접근 실패: {response.status_code}")
+            stop_reason = f"http_{response.status_code}"
+            break
             
-            for post in posts:
-                post_data = post['data']
-                
-                collected_item = {
-                    "id": post_data['id'],
-                    "source": f"reddit_{subreddit}",
-                    "category": "social",
-                    "platform": "reddit",
-                    "title": post_data.get('title', ''),
-                    "content": post_data.get('selftext', '')[:1000],
-                    "url": f"https://reddit.com{post_data.get('permalink', '')}",
-                    "author": post_data.get('author', 'Unknown'),
-                    "author_id": generate_user_id(post_data.get('author', 'Unknown'), "reddit"),
-                    "score": post_data.get('score', 0),
-                    "num_comments": post_data.get('num_comments', 0),
-                    "published_at": datetime.fromtimestamp(post_data.get('created_utc', 0)).isoformat(),
-                    "collected_at": datetime.now().isoformat()
-                }
-                collected_data.append(collected_item)
-                print(f"   ✅ 수집: {collected_item['title'][:50]}...")
-                
-            time.sleep(2)  # Rate limiting
+        data = response.json()
+        posts = []
+        
+        for post in data.get('data', {}).get('children', []):
+            post_data = post['data']
+            created_utc = post_data.get('created_utc', 0)
             
+            if watermark and (post_data['id'] == watermark['id'] or created_utc < watermark['ts']):
+                stop_reason = "watermark"
+                break
+            if since and created_utc < since:
+                stop_reason = "since"
+                break
+            if newest is None:
+                newest = (post_data['id'], created_utc)
+            posts.append(post_data)
+        else:
+            after = data.get('data', {}).get('after')
+            if not after:
+                stop_reason = "end"
+        
+        post_count += len(posts)
+        if posts:
+            yield posts
+        if stop_reason != "max_pages":
+            break
+    
+    # 이전 워터마크까지 이어서 읽었을 때만 이동 (중간 구간이 비면 다음 실행이 다시 읽도록 유지)
+    complete = watermark is None or stop_reason in ("watermark", "since", "end")
+    if not complete:
+        print(f"   ⚠️ 이전 워터마크에 도달하지 못해 워터마크를 유지합니다 (종료: {stop_reason})")
+        REDDIT_WATERMARKS.discard(subreddit)
+    elif newest:
+        # 항목이 저장된 뒤 commit_subreddit_watermark()로 확정
+        REDDIT_WATERMARKS.stage(subreddit, newest[0], newest[1])
+    print(f"   📄 r/{subreddit}: {page + 1}페이지, {post_count}개 (종료: {stop_reason}, "
+          f"남은 할당량: {REDDIT_RATE_LIMITER.remaining})")
+
+def parse_reddit_posts(posts: List[Dict[str, Any]], subreddit: str) -> Iterable[CollectedItem]:
+    """검색 결과 페이지 하나를 레코드로 변환"""
+    for post_data in posts:
+        created_utc = post_data.get('created_utc', 0)
+        yield CollectedItem(
+            id=post_data['id'],
+            source=f"reddit_{subreddit}",
+            category="social",
+            platform="reddit",
+            title=post_data.get('title', ''),
+            content=post_data.get('selftext', '')[:1000],
+            url=f"https://reddit.com{post_data.get('permalink', '')}",
+            author=post_data.get('author', 'Unknown'),
+            author_id=generate_user_id(post_data.get('author', 'Unknown'), "reddit"),
+            published_at=datetime.fromtimestamp(created_utc, tz=timezone.utc).isoformat(),
+            published_ts=int(created_utc),
+            collected_at=datetime.now().isoformat(),
+            extra={
+                "score": post_data.get('score', 0),
+                "num_comments": post_data.get('num_comments', 0)
+            }
+        )
+
+def commit_subreddit_watermark(subreddit: str) -> None:
+    """수집한 항목을 저장한 뒤 보류 중인 워터마크 확정"""
+    REDDIT_WATERMARKS.commit([subreddit])
+
+def reddit_source(subreddit: str, max_pages: int = None, since: float = None) -> Source:
+    """서브레딧 하나 (검색 쿼리로 이미 관련 글만 반환되므로 필터 없음)"""
+    return Source(
+        name=f"reddit_{subreddit}",
+        fetch=lambda: fetch_subreddit_pages(subreddit, max_pages=max_pages, since=since),
+        parse=lambda posts: parse_reddit_posts(posts, subreddit),
+        commit=lambda: commit_subreddit_watermark(subreddit)
+    )
+
+def collect_subreddit(subreddit: str, max_pages: int = None, since: float = None) -> List[CollectedItem]:
+    """서브레딧 하나에서 데이터 수집 (저장 후 commit_subreddit_watermark() 호출 필요)"""
+    return run_source(reddit_source(subreddit, max_pages=max_pages, since=since))
+
+def collect_reddit_data(max_pages: int = None, since: float = None) -> List[CollectedItem]:
+    """Reddit에서 데이터 수집 (공개 API, 저장 후 commit_subreddit_watermark() 호출 필요)"""
+    collected_data = []
+    
+    for subreddit in DATA_SOURCES["reddit"]["subreddits"]:
+        try:
+            collected_data.extend(collect_subreddit(subreddit, max_pages=max_pages, since=since))
         except Exception as e:
             print(f"   ❌ 오류: {str(e)}")
             continue
     
     return collected_data
 
+def build_sources(reddit_max_pages: int = None, since: float = None) -> List[Source]:
+    """RSS 피드 + 서브레딧 소스 목록"""
+    sources = [rss_source(feed_info) for feed_info in DATA_SOURCES["rss_feeds"]]
+    sources.extend(
+        reddit_source(subreddit, max_pages=reddit_max_pages, since=since)
+        for subreddit in DATA_SOURCES["reddit"]["subreddits"]
+    )
+    return sources
+
 def generate_sample_comments() -> List[Dict[str, Any]]:
     """샘플 댓글 생성은 정책상 비활성화 (REAL DATA ONLY)."""
     return []
 
-def analyze_collected_data(data: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """수집된 데이터 분석"""
-    analysis = {
-        "total_count": len(data),
-        "by_platform": {},
-        "by_category": {},
-        "by_author": {},
-        "time_range": {
-            "earliest": None,
-            "latest": None
-        },
-        "top_authors": []
-    }
-    
-    # 플랫폼별 집계
-    for item in data:
-        platform = item.get('platform', 'unknown')
-        analysis['by_platform'][platform] = analysis['by_platform'].get(platform, 0) + 1
-        
-        category = item.get('category', 'unknown')
-        analysis['by_category'][category] = analysis['by_category'].get(category, 0) + 1
-        
-        author = item.get('author', 'Unknown')
-        if author not in analysis['by_author']:
-            analysis['by_author'][author] = {
-                'count': 0,
-                'author_id': item.get('author_id'),
-                'posts': []
-            }
-        analysis['by_author'][author]['count'] += 1
-        analysis['by_author'][author]['posts'].append(item['id'])
-    
-    # Top authors
-    sorted_authors = sorted(analysis['by_author'].items(), key=lambda x: x[1]['count'], reverse=True)
-    analysis['top_authors'] = [
-        {
-            'name': author,
-            'id': info['author_id'],
-            'post_count': info['count']
-        }
-        for author, info in sorted_authors[:10]
-    ]
-    
-    # 시간 범위
-    dates = [item.get('published_at', '') for item in data if item.get('published_at')]
-    if dates:
-        analysis['time_range']['earliest'] = min(dates)
-        analysis['time_range']['latest'] = max(dates)
-    
-    return analysis
+def analyze_collected_data(data: Iterable[Any]) -> Dict[str, Any]:
+    """수집된 데이터 분석 (컬럼형 배치 집계)"""
+    batch = data if isinstance(data, RecordBatch) else RecordBatch.from_records(data)
+    return CollectionStats().add_batch(batch).summary()
 
-def main():
+def parse_args(argv: List[str] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="국민연금 관련 실제 데이터 수집")
+    parser.add_argument("--reddit-max-pages", type=int, default=None,
+                        help="서브레딧별 최대 페이지 수 (기본: DATA_SOURCES 설정)")
+    parser.add_argument("--reddit-backfill-days", type=float, default=None,
+                        help="워터마크가 없을 때 거슬러 올라갈 최대 일수")
+    parser.add_argument("--parquet", action="store_true",
+                        help="수집 결과를 Parquet로도 저장 (pyarrow 필요)")
+    add_pipeline_arguments(parser)
+    add_transport_arguments(parser)
+    add_sink_arguments(parser)
+    add_embedding_arguments(parser)
+    add_article_arguments(parser)
+    return parser.parse_args(argv)
+
+def main(argv: List[str] = None) -> CollectionResult:
     """메인 실행 함수"""
+    args = parse_args(argv)
+    configure_transport(args.http_cache, args.http_cache_dir, pool_size=max(16, args.fetch_workers * 2))
     print("=" * 60)
     print("🚀 국민연금 관련 실제 데이터 수집 시작")
     print("=" * 60)
     
-    all_data = []
-    
-    # 1. RSS 피드 수집
-    print("\n[1/3] RSS 피드 수집 중...")
-    rss_data = collect_rss_feeds()
-    all_data.extend(rss_data)
-    print(f"✅ RSS 수집 완료: {len(rss_data)}개")
+    # RSS 피드 + Reddit (댓글 데이터 수집은 REAL DATA ONLY 정책으로 비활성화)
+    since = None
+    if args.reddit_backfill_days:
+        since = time.time() - args.reddit_backfill_days * 86400
+    sources = build_sources(reddit_max_pages=args.reddit_max_pages, since=since)
+    print(f"\n소스 {len(sources)}개 수집 중 (fetch 워커 {args.fetch_workers}개)...")
     
-    # 2. Reddit 데이터 수집
-    print("\n[2/3] Reddit 데이터 수집 중...")
-    reddit_data = collect_reddit_data()
-    all_data.extend(reddit_data)
-    print(f"✅ Reddit 수집 완료: {len(reddit_data)}개")
-    
-    # 3. 댓글 데이터 수집 (비활성화) - 실제 소스 API 연동 필요 시 별도 구현
-    print("\n[3/3] 댓글 데이터 수집은 비활성화되어 있습니다 (REAL DATA ONLY 정책)")
+    output_file = f"/home/nodove/workspace/Capstone/data/collected_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    result = run_collection(
+        sources, args, output_file,
+        dedup_index_path=DEDUP_INDEX_PATH,
+        partition_dir=PARTITION_DIR,
+        partition_name="collect_real_data",
+        parquet=args.parquet
+    )
+    analysis = result.stats.summary()
     
     # 분석 결과
     print("\n" + "=" * 60)
     print("📊 수집 결과 분석")
     print("=" * 60)
     
-    analysis = analyze_collected_data(all_data)
-    
     print(f"\n총 수집 데이터: {analysis['total_count']}개")
     
     print("\n플랫폼별 분포:")
@@ -256,22 +371,6 @@ def main():
     for i, author in enumerate(analysis['top_authors'], 1):
         print(f"  {i}. {author['name']}: {author['post_count']}개 (ID: {author['id']})")
     
-    # 데이터 저장
-    output_file = f"/home/nodove/workspace/Capstone/data/collected_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-    
-    import os
-    os.makedirs(os.path.dirname(output_file), exist_ok=True)
-    
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump({
-            'metadata': {
-                'collected_at': datetime.now().isoformat(),
-                'total_count': len(all_data),
-                'analysis': analysis
-            },
-            'data': all_data
-        }, f, ensure_ascii=False, indent=2)
-    
     print(f"\n💾 데이터 저장 완료: {output_file}")
     
     # 샘플 출력
@@ -279,14 +378,14 @@ def main():
     print("📝 샘플 데이터 (처음 5개)")
     print("=" * 60)
     
-    for i, item in enumerate(all_data[:5], 1):
+    for i, item in enumerate(result.samples, 1):
         print(f"\n[{i}] {item.get('title', item.get('content', ''))[:100]}...")
         print(f"   작성자: {item['author']} (ID: {item['author_id']})")
         print(f"   출처: {item['source']} | 플랫폼: {item['platform']}")
         print(f"   URL: {item.get('url', 'N/A')}")
     
-    return all_data
+    return result
 
 if __name__ == "__main__":
-    collected_data = main()
-    print(f"\n✨ 완료! 총 {len(collected_data)}개의 데이터를 수집했습니다.")
+    result = main()
+    print(f"\n✨ 완료! 총 {result.total_count}개의 데이터를 수집했습니다.")
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+상시 실행 수집 데몬
+collect_real_data.py의 DATA_SOURCES와 RealDataScraper.scrape_* 메서드로 소스 레지스트리를 만들고,
+소스별 폴링 주기/지터/적응형 백오프에 따라 동시에 수집합니다.
+
+새 항목(교차 소스 중복 제거 후)은 게시일 기준 일자 파티션(<output-dir>/dt=YYYY-MM-DD/collected.jsonl)에 추가되고,
+실행 상태는 상태 파일(--status-file)과 선택적 HTTP 엔드포인트(--status-port)로 확인할 수 있습니다.
+
+사용법:
+  python scripts/collector_daemon.py
+  python scripts/collector_daemon.py --status-port 8089 --workers 6
+  python scripts/collector_daemon.py --once
+"""
+
+import argparse
+import os
+import sys
+import threading
+from typing import Any, Dict, List, Optional
+
+import collect_real_data
+from collectors.article import ArticleEnricher, add_article_arguments, default_cache_path, enricher_from_args
+from collectors.dedup import DedupIndex, deduplicate
+from collectors.embedding import EmbeddingStage, add_embedding_arguments, stage_from_args
+from collectors.partition import PartitionedJsonlWriter
+from collectors.pg_sink import PostgresSink, add_sink_arguments, sink_from_args
+from collectors.scheduler import CollectorScheduler, SourceSpec
+from collectors.timestamps import normalize_items
+from collectors.transport import add_transport_arguments, configure_transport, get_transport
+from scrape_real_data import FEED_SCRAPERS, RealDataScraper, commit_feed_watermark
+
+DEFAULT_OUTPUT_DIR = "/home/nodove/workspace/Capstone/data/daemon"
+
+# 소스 종류별 폴링 주기 (초): (기본, 최소, 최대)
+SOURCE_INTERVALS = {
+    "rss": (900, 300, 3600),
+    "reddit": (600, 180, 3600),
+    "portal": (300, 120, 1800),
+    "official": (1800, 600, 7200),
+}
+
+# scrape_* 메서드 중 실제 요청을 보내지 않는 항목
+SKIPPED_SCRAPE_METHODS = {"scrape_news_comments_from_api"}
+
+
+def _spec(name: str, fetch, kind: str, commit=None) -> SourceSpec:
+    interval, min_interval, max_interval = SOURCE_INTERVALS[kind]
+    return SourceSpec(
+        name=name,
+        fetch=fetch,
+        interval=interval,
+        min_interval=min_interval,
+        max_interval=max_interval,
+        commit=commit
+    )
+
+
+def build_source_registry() -> List[SourceSpec]:
+    """DATA_SOURCES와 RealDataScraper.scrape_* 메서드로 소스 목록 구성"""
+    sources: List[SourceSpec] = []
+
+    for feed_info in collect_real_data.DATA_SOURCES["rss_feeds"]:
+        sources.append(_spec(
+            f"rss:{feed_info['name']}",
+            lambda feed_info=feed_info: collect_real_data.collect_rss_feed(feed_info),
+            "rss",
+            commit=lambda feed_info=feed_info: collect_real_data.commit_feed_watermark(feed_info)
+        ))
+
+    for subreddit in collect_real_data.DATA_SOURCES["reddit"]["subreddits"]:
+        sources.append(_spec(
+            f"reddit:{subreddit}",
+            lambda subreddit=subreddit: collect_real_data.collect_subreddit(subreddit),
+            "reddit",
+            commit=lambda subreddit=subreddit: collect_real_data.commit_subreddit_watermark(subreddit)
+        ))
+
+    scraper = RealDataScraper()
+    for attr in sorted(dir(scraper)):
+        if not attr.startswith("scrape_") or attr in SKIPPED_SCRAPE_METHODS:
+            continue
+        kind = "official" if attr.endswith("_rss") else "portal"
+        feed_url = FEED_SCRAPERS.get(attr)
+        commit = (lambda feed_url=feed_url: commit_feed_watermark(feed_url)) if feed_url else None
+        sources.append(_spec(f"scraper:{attr[len('scrape_'):]}", getattr(scraper, attr), kind, commit=commit))
+
+    return sources
+
+
+class JsonlSink:
+    """중복 제거 후 새 항목만 게시일 파티션 JSONL로 저장"""
+
+    def __init__(self, output_dir: str, dedup_index_path: str, pg_sink: Optional[PostgresSink] = None,
+                 embedding_stage: Optional[EmbeddingStage] = None,
+                 article_enricher: Optional[ArticleEnricher] = None):
+        self.output_dir = output_dir
+        self.writer = PartitionedJsonlWriter(output_dir)
+        self.pg_sink = pg_sink
+        self.embedding_stage = embedding_stage
+        self.article_enricher = article_enricher
+        os.makedirs(os.path.dirname(dedup_index_path), exist_ok=True)
+        self.dedup_index = DedupIndex(dedup_index_path)
+        self._lock = threading.Lock()
+
+    def __call__(self, spec: SourceSpec, items: List[Dict[str, Any]]) -> int:
+        normalize_items(items)
+        # 인덱스 연결을 스레드들이 공유하므로 commit/rollback 범위가 섞이지 않게 저장까지 잠금 안에서 수행
+        with self._lock:
+            new_items = deduplicate(items, self.dedup_index)
+            if not new_items:
+                self.dedup_index.commit()
+                return 0
+            try:
+                if self.article_enricher:
+                    self.article_enricher(new_items)
+                if self.embedding_stage:
+                    self.embedding_stage.process(new_items)
+                self.writer.write_many(new_items)
+                if self.pg_sink:
+                    self.pg_sink.write_many(new_items)
+                    # 중복 인덱스/워터마크 확정(SourceSpec.commit) 전에 적재를 끝냄
+                    self.pg_sink.flush()
+            except Exception:
+                # 저장하지 못한 항목이 다음 실행에서 중복으로 걸러지지 않도록 인덱스 변경을 버림
+                self.dedup_index.rollback()
+                raise
+            self.dedup_index.commit()
+        print(f"💾 [{spec.name}] 새 항목 {len(new_items)}개 저장 (수집 {len(items)}개)")
+        return len(new_items)
+
+    def close(self) -> None:
+        self.dedup_index.close()
+        if self.article_enricher:
+            self.article_enricher.close()
+        if self.embedding_stage:
+            self.embedding_stage.close()
+        if self.pg_sink:
+            self.pg_sink.close()
+
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="국민연금 데이터 상시 수집 데몬")
+    parser.add_argument("--output-dir", default=DEFAULT_OUTPUT_DIR, help="파티션 JSONL 저장 디렉터리")
+    parser.add_argument("--status-file", default=None, help="상태 파일 경로 (기본: <output-dir>/status.json)")
+    parser.add_argument("--status-port", type=int, default=None, help="상태 HTTP 포트 (GET /status)")
+    parser.add_argument("--workers", type=int, default=4, help="동시 수집 스레드 수")
+    parser.add_argument("--only", action="append", default=[], help="이름에 해당 문자열이 포함된 소스만 실행 (반복 가능)")
+    parser.add_argument("--once", action="store_true", help="모든 소스를 한 번씩만 실행하고 종료")
+    add_transport_arguments(parser)
+    add_sink_arguments(parser)
+    add_embedding_arguments(parser)
+    add_article_arguments(parser)
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str]) -> int:
+    args = parse_args(argv)
+    configure_transport(args.http_cache, args.http_cache_dir, pool_size=max(16, args.workers * 2))
+    os.makedirs(args.output_dir, exist_ok=True)
+    status_file = args.status_file or os.path.join(args.output_dir, "status.json")
+
+    sources = build_source_registry()
+    if args.only:
+        sources = [spec for spec in sources if any(key in spec.name for key in args.only)]
+    if not sources:
+        print("실행할 소스가 없습니다.")
+        return 1
+
+    data_dir = os.path.dirname(collect_real_data.DEDUP_INDEX_PATH)
+    sink = JsonlSink(args.output_dir, collect_real_data.DEDUP_INDEX_PATH,
+                     pg_sink=sink_from_args(args), embedding_stage=stage_from_args(args),
+                     article_enricher=enricher_from_args(args, default_cache_path(data_dir)))
+    scheduler = CollectorScheduler(sources, sink, max_workers=args.workers, status_path=status_file,
+                                   status_extras=lambda: {"retry_budget": get_transport().budget.snapshot()})
+
+    print("=" * 60)
+    print(f"🛰️  수집 데몬 시작: 소스 {len(sources)}개, 워커 {args.workers}개")
+    for spec in sources:
+        print(f"  - {spec.name}: {spec.interval}s ({spec.min_interval}~{spec.max_interval}s)")
+    print(f"📄 상태 파일: {status_file}")
+    if args.status_port:
+        scheduler.serve_status(args.status_port)
+        print(f"🌐 상태 엔드포인트: http://127.0.0.1:{args.status_port}/status")
+    print("=" * 60)
+
+    try:
+        scheduler.run(once=args.once)
+    except KeyboardInterrupt:
+        print("\n🛑 종료 요청 수신")
+    finally:
+        scheduler.stop()
+        sink.close()
+        scheduler.write_status()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,3 @@
+"""
+수집 스크립트(collect_real_data.py, scrape_real_data.py) 공용 모듈 모음.
+"""
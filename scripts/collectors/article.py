@@ -0,0 +1,241 @@
+"""
+기사 본문 보강 단계 (crawl-worker)
+
+수집기는 RSS/검색 요약(content[:500])만 보관하므로, 파이프라인 enrich 단계에서 항목 URL을
+crawl-worker(services/python/crawl-worker, POST /crawl)로 보내 추출된 본문 마크다운을
+article_markdown 필드로 붙입니다.
+
+- 동시성: 전체 동시 요청 수(max_concurrency)와 호스트별 동시 요청 수(per_host)를 함께 제한합니다.
+  호스트별 대기열을 라운드로빈으로 꺼내므로 한 언론사 URL이 많아도 다른 호스트가 밀리지 않습니다.
+- 캐시: content_hash(정규화한 제목+본문, collectors.embedding)별로 가져온 본문을 SQLite에 저장하고,
+  이미 아는 해시는 crawl-worker를 호출하지 않고 캐시에서 붙입니다.
+- 실패한 URL은 캐시하지 않으므로 다음 실행에서 다시 시도합니다.
+
+crawl-worker 주소는 --crawl-worker-url / CRAWL_WORKER_URL (기본: docker-compose.spring.yml이
+crawl4ai 서비스를 게시하는 http://localhost:8011). --enrich-articles인데 crawl-worker에 연결할 수
+없으면 보강 없이 조용히 진행하지 않고 종료합니다.
+"""
+
+import os
+import sqlite3
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import datetime
+from typing import Any, Deque, Dict, Iterable, List, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from collectors.embedding import content_hash
+
+ARTICLE_FIELD = "article_markdown"
+# docker-compose.spring.yml의 crawl4ai 게시 포트 (CRAWL4AI_PORT, 호스트 8001은 analysis-service)
+DEFAULT_WORKER_URL = "http://localhost:8011"
+DEFAULT_CONCURRENCY = 8
+DEFAULT_PER_HOST = 2
+DEFAULT_TIMEOUT = 60.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    content_hash TEXT PRIMARY KEY,
+    url TEXT,
+    markdown TEXT NOT NULL,
+    fetched_at TEXT NOT NULL
+);
+"""
+
+
+class ArticleCache:
+    """content_hash → 본문 마크다운 SQLite 캐시 (스레드 안전)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.executescript(_SCHEMA)
+
+    def get_many(self, hashes: Iterable[str]) -> Dict[str, str]:
+        hashes = list(hashes)
+        if not hashes:
+            return {}
+        placeholders = ",".join("?" for _ in hashes)
+        with self._lock:
+            rows = self.conn.execute(
+                f"SELECT content_hash, markdown FROM articles WHERE content_hash IN ({placeholders})", hashes
+            ).fetchall()
+        return dict(rows)
+
+    def put(self, digest: str, url: str, markdown: str) -> None:
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO articles (content_hash, url, markdown, fetched_at) VALUES (?, ?, ?, ?)",
+                (digest, url, markdown, datetime.now().isoformat())
+            )
+            self.conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self.conn.close()
+
+
+class CrawlWorkerClient:
+    """crawl-worker HTTP 클라이언트 (연결 풀 크기 = 최대 동시 요청 수)"""
+
+    def __init__(self, base_url: str = DEFAULT_WORKER_URL, timeout: float = DEFAULT_TIMEOUT,
+                 pool_size: int = DEFAULT_CONCURRENCY):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def health(self) -> bool:
+        """crawl-worker의 /health 응답({"status": "ok"})인지까지 확인 (같은 포트의 다른 서비스 구분)"""
+        try:
+            response = self.session.get(f"{self.base_url}/health", timeout=5)
+            return response.status_code == 200 and response.json().get("status") == "ok"
+        except (requests.RequestException, ValueError, AttributeError):
+            return False
+
+    def crawl(self, url: str) -> Optional[str]:
+        """본문 마크다운 반환 (추출 실패 시 None, 네트워크 오류는 예외)"""
+        response = self.session.post(f"{self.base_url}/crawl", json={"url": url}, timeout=self.timeout)
+        if response.status_code != 200:
+            return None
+        body = response.json()
+        if body.get("status") != "SUCCESS":
+            return None
+        return body.get("markdown") or None
+
+    def close(self) -> None:
+        self.session.close()
+
+
+class ArticleEnricher:
+    """파이프라인 enrich 단계: 배치의 항목 URL을 crawl-worker로 가져와 본문을 붙임"""
+
+    def __init__(self, client: CrawlWorkerClient, cache: Optional[ArticleCache] = None,
+                 max_concurrency: int = DEFAULT_CONCURRENCY, per_host: int = DEFAULT_PER_HOST):
+        self.client = client
+        self.cache = cache
+        self.max_concurrency = max(1, max_concurrency)
+        self.per_host = max(1, per_host)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="crawl")
+        self.fetched = 0
+        self.cached = 0
+        self.failed = 0
+
+    def __call__(self, items: List[Any]) -> None:
+        pending: Dict[str, List[Any]] = {}
+        for item in items:
+            url = item.get('url') or ''
+            if not url.startswith('http') or item.get(ARTICLE_FIELD):
+                continue
+            if not item.get('content_hash'):
+                item['content_hash'] = content_hash(item)
+            pending.setdefault(item['content_hash'], []).append(item)
+        if not pending:
+            return
+
+        if self.cache is not None:
+            for digest, markdown in self.cache.get_many(pending).items():
+                for item in pending.pop(digest):
+                    item[ARTICLE_FIELD] = markdown
+                self.cached += 1
+
+        for digest, markdown in self._crawl_all(pending).items():
+            for item in pending[digest]:
+                item[ARTICLE_FIELD] = markdown
+
+    def _crawl_all(self, pending: Dict[str, List[Any]]) -> Dict[str, str]:
+        """호스트별 대기열을 라운드로빈으로 돌며 전체/호스트별 동시 요청 수 안에서 가져옴"""
+        queues: "OrderedDict[str, Deque[tuple]]" = OrderedDict()
+        for digest, group in pending.items():
+            url = group[0]['url']
+            queues.setdefault(urlsplit(url).netloc, deque()).append((digest, url))
+
+        in_flight: Dict[Future, tuple] = {}
+        per_host: Dict[str, int] = {host: 0 for host in queues}
+        results: Dict[str, str] = {}
+
+        while queues or in_flight:
+            # 빈 슬롯을 호스트 순서대로 한 건씩 채움
+            progressed = True
+            while progressed and len(in_flight) < self.max_concurrency:
+                progressed = False
+                for host in list(queues):
+                    if len(in_flight) >= self.max_concurrency:
+                        break
+                    if per_host[host] >= self.per_host:
+                        continue
+                    digest, url = queues[host].popleft()
+                    if not queues[host]:
+                        del queues[host]
+                    else:
+                        queues.move_to_end(host)
+                    per_host[host] += 1
+                    in_flight[self._executor.submit(self.client.crawl, url)] = (host, digest, url)
+                    progressed = True
+
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                host, digest, url = in_flight.pop(future)
+                per_host[host] -= 1
+                try:
+                    markdown = future.result()
+                except Exception as e:
+                    markdown = None
+                    print(f"   ⚠️ 본문 수집 실패: {url} ({e})")
+                if not markdown:
+                    self.failed += 1
+                    continue
+                results[digest] = markdown
+                self.fetched += 1
+                if self.cache is not None:
+                    self.cache.put(digest, url, markdown)
+        return results
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+        self.client.close()
+        if self.cache is not None:
+            self.cache.close()
+
+
+def add_article_arguments(parser) -> None:
+    """수집 스크립트 공통 CLI 옵션"""
+    parser.add_argument("--enrich-articles", action="store_true",
+                        help="crawl-worker로 기사 본문을 가져와 article_markdown에 저장")
+    parser.add_argument("--crawl-worker-url", default=os.environ.get("CRAWL_WORKER_URL", DEFAULT_WORKER_URL),
+                        help=f"crawl-worker 주소 (CRAWL_WORKER_URL, 기본 {DEFAULT_WORKER_URL})")
+    parser.add_argument("--crawl-concurrency", type=int, default=DEFAULT_CONCURRENCY,
+                        help="crawl-worker 동시 요청 수")
+    parser.add_argument("--crawl-per-host", type=int, default=DEFAULT_PER_HOST,
+                        help="원문 호스트별 동시 요청 수")
+
+
+def default_cache_path(data_dir: str) -> str:
+    """본문 캐시 경로 (COLLECTOR_ARTICLE_CACHE, 기본: 수집 데이터 디렉터리의 article_cache.sqlite3)"""
+    return os.environ.get("COLLECTOR_ARTICLE_CACHE") or os.path.join(data_dir, "article_cache.sqlite3")
+
+
+def enricher_from_args(args, cache_path: str) -> Optional[ArticleEnricher]:
+    if not args.enrich_articles:
+        return None
+    client = CrawlWorkerClient(args.crawl_worker_url, pool_size=args.crawl_concurrency)
+    if not client.health():
+        client.close()
+        # 본문 보강을 요청했는데 빈 결과로 진행하지 않도록 중단
+        raise SystemExit(f"❌ crawl-worker에 연결할 수 없습니다: {args.crawl_worker_url} "
+                         f"(--crawl-worker-url 또는 CRAWL_WORKER_URL로 crawl-worker 주소를 지정하세요)")
+    return ArticleEnricher(
+        client,
+        ArticleCache(cache_path),
+        max_concurrency=args.crawl_concurrency,
+        per_host=args.crawl_per_host
+    )
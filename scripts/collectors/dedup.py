@@ -0,0 +1,247 @@
+"""
+교차 소스 유사 중복 제거 (SimHash + LSH 밴딩)
+
+같은 기사가 네이버/다음 검색, 연합뉴스/한겨레 RSS 등에서 서로 다른 URL로 수집되므로
+URL 기반 id만으로는 중복을 걸러낼 수 없습니다. 제목+본문 요약으로 64비트 SimHash를
+계산하고, 해밍 거리 max_distance 이하인 항목을 같은 클러스터로 묶습니다.
+
+- 인덱스: SQLite 파일에 저장되어 실행 간 유지됩니다. deduplicate()는 확정하지 않으므로
+  호출자가 sink 저장이 끝난 뒤 commit()하고, 실패하면 rollback()해 다음 실행에서 다시 처리합니다.
+- 조회: 서명을 (max_distance + 1)개 밴드로 나누어 (밴드, 값) 인덱스로 후보만 조회합니다.
+  비둘기집 원리에 따라 거리 max_distance 이하인 서명은 최소 한 밴드가 정확히 일치하므로
+  전체 스캔 없이 누락 없는 후보 검색이 가능합니다.
+- 클러스터: 최초 수집 항목이 대표(canonical) 레코드가 되고 나머지는 alternates로 기록됩니다.
+"""
+
+import hashlib
+import re
+import sqlite3
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+SIMHASH_BITS = 64
+SHINGLE_SIZE = 3
+DEFAULT_MAX_DISTANCE = 3
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_NON_WORD_RE = re.compile(r"[^\w]+", re.UNICODE)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS clusters (
+    cluster_id INTEGER PRIMARY KEY,
+    canonical_id TEXT NOT NULL,
+    canonical_url TEXT,
+    canonical_source TEXT,
+    created_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS signatures (
+    item_id TEXT PRIMARY KEY,
+    cluster_id INTEGER NOT NULL,
+    simhash INTEGER NOT NULL,
+    url TEXT,
+    source TEXT
+);
+CREATE TABLE IF NOT EXISTS bands (
+    band INTEGER NOT NULL,
+    value INTEGER NOT NULL,
+    item_id TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_bands_lookup ON bands (band, value);
+CREATE INDEX IF NOT EXISTS idx_signatures_cluster ON signatures (cluster_id);
+"""
+
+
+def normalize_text(text: str) -> str:
+    """HTML 태그/구두점을 제거하고 소문자로 정규화"""
+    text = _TAG_RE.sub(" ", text or "")
+    text = _NON_WORD_RE.sub(" ", text.lower())
+    return " ".join(text.split())
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> Dict[str, int]:
+    """문자 n-gram 빈도 (한국어는 띄어쓰기가 매체마다 달라 공백을 제거한 문자 단위 사용)"""
+    compact = text.replace(" ", "")
+    if len(compact) <= size:
+        return {compact: 1} if compact else {}
+    counts: Dict[str, int] = {}
+    for i in range(len(compact) - size + 1):
+        gram = compact[i:i + size]
+        counts[gram] = counts.get(gram, 0) + 1
+    return counts
+
+
+def simhash(text: str) -> int:
+    """정규화된 텍스트의 64비트 SimHash"""
+    features = shingles(normalize_text(text))
+    if not features:
+        return 0
+    weights = [0] * SIMHASH_BITS
+    for gram, weight in features.items():
+        h = int.from_bytes(hashlib.blake2b(gram.encode("utf-8"), digest_size=8).digest(), "big")
+        for bit in range(SIMHASH_BITS):
+            if h >> bit & 1:
+                weights[bit] += weight
+            else:
+                weights[bit] -= weight
+    value = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            value |= 1 << bit
+    return value
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+
+def item_text(item: Dict[str, Any]) -> str:
+    return f"{item.get('title', '')} {item.get('content', '')}"
+
+
+def _to_signed(value: int) -> int:
+    """SQLite INTEGER(부호 있는 64비트)에 저장하기 위한 변환"""
+    return value - (1 << 64) if value >= 1 << 63 else value
+
+
+def _to_unsigned(value: int) -> int:
+    return value + (1 << 64) if value < 0 else value
+
+
+class DedupIndex:
+    """실행 간 유지되는 SimHash 클러스터 인덱스"""
+
+    def __init__(self, path: str = ":memory:", max_distance: int = DEFAULT_MAX_DISTANCE):
+        self.path = path
+        self.max_distance = max_distance
+        band_count = max_distance + 1
+        width = -(-SIMHASH_BITS // band_count)
+        self._bands = [
+            (start, min(width, SIMHASH_BITS - start))
+            for start in range(0, SIMHASH_BITS, width)
+        ]
+        # 데몬 모드에서는 여러 수집 스레드가 잠금 하에 공유하므로 스레드 검사 비활성화
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.executescript(_SCHEMA)
+
+    def _band_values(self, signature: int) -> List[Tuple[int, int]]:
+        return [
+            (band, (signature >> start) & ((1 << width) - 1))
+            for band, (start, width) in enumerate(self._bands)
+        ]
+
+    def contains(self, item_id: str) -> bool:
+        row = self.conn.execute("SELECT 1 FROM signatures WHERE item_id = ?", (item_id,)).fetchone()
+        return row is not None
+
+    def lookup(self, signature: int) -> Optional[Tuple[int, int]]:
+        """가장 가까운 클러스터 (cluster_id, 해밍 거리) 또는 None"""
+        best: Optional[Tuple[int, int]] = None
+        seen = set()
+        for band, value in self._band_values(signature):
+            rows = self.conn.execute(
+                "SELECT s.item_id, s.simhash, s.cluster_id FROM bands b "
+                "JOIN signatures s ON s.item_id = b.item_id "
+                "WHERE b.band = ? AND b.value = ?",
+                (band, value),
+            )
+            for item_id, candidate, cluster_id in rows:
+                if item_id in seen:
+                    continue
+                seen.add(item_id)
+                distance = hamming_distance(signature, _to_unsigned(candidate))
+                if distance <= self.max_distance and (best is None or distance < best[1]):
+                    best = (cluster_id, distance)
+        return best
+
+    def add(self, item: Dict[str, Any], signature: int, cluster_id: Optional[int] = None) -> int:
+        """항목 서명을 등록하고 소속 cluster_id 반환 (cluster_id가 없으면 새 클러스터 생성)"""
+        if cluster_id is None:
+            cursor = self.conn.execute(
+                "INSERT INTO clusters (canonical_id, canonical_url, canonical_source, created_at) "
+                "VALUES (?, ?, ?, ?)",
+                (item["id"], item.get("url"), item.get("source"), datetime.now().isoformat()),
+            )
+            cluster_id = cursor.lastrowid
+        self.conn.execute(
+            "INSERT OR IGNORE INTO signatures (item_id, cluster_id, simhash, url, source) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (item["id"], cluster_id, _to_signed(signature), item.get("url"), item.get("source")),
+        )
+        if not signature:
+            # 텍스트가 없는 항목은 id로만 식별하고 밴드 인덱스에는 넣지 않음
+            return cluster_id
+        self.conn.executemany(
+            "INSERT INTO bands (band, value, item_id) VALUES (?, ?, ?)",
+            [(band, value, item["id"]) for band, value in self._band_values(signature)],
+        )
+        return cluster_id
+
+    def canonical(self, cluster_id: int) -> Optional[str]:
+        row = self.conn.execute(
+            "SELECT canonical_id FROM clusters WHERE cluster_id = ?", (cluster_id,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def alternates(self, cluster_id: int) -> List[Dict[str, Any]]:
+        """대표 레코드를 제외한 클러스터 구성원 목록"""
+        rows = self.conn.execute(
+            "SELECT s.item_id, s.url, s.source FROM signatures s "
+            "JOIN clusters c ON c.cluster_id = s.cluster_id "
+            "WHERE s.cluster_id = ? AND s.item_id != c.canonical_id",
+            (cluster_id,),
+        )
+        return [{"id": item_id, "url": url, "source": source} for item_id, url, source in rows]
+
+    def commit(self) -> None:
+        self.conn.commit()
+
+    def rollback(self) -> None:
+        """마지막 commit 이후 등록한 서명/클러스터를 버림 (저장에 실패한 항목은 다음 실행에서 다시 처리)"""
+        self.conn.rollback()
+
+    def close(self) -> None:
+        """연결 종료 (commit하지 않은 변경은 버려짐)"""
+        self.conn.close()
+
+    def __enter__(self) -> "DedupIndex":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def deduplicate(items: Iterable[Dict[str, Any]], index: DedupIndex) -> List[Dict[str, Any]]:
+    """유사 중복을 클러스터링하고 새 클러스터의 대표 레코드만 반환
+
+    - 이미 인덱스에 있는 id: 이전 실행에서 처리된 항목이므로 제외
+    - 기존 클러스터와 유사: alternate로 기록하고 제외
+      (대표 레코드가 이번 실행 결과에 있으면 해당 레코드의 alternates에 추가)
+    - 그 외: 새 클러스터의 대표 레코드로 반환 (cluster_id, alternates 필드 추가)
+
+    인덱스 변경은 확정하지 않습니다. 반환된 항목이 저장된 뒤 호출자가 index.commit()합니다.
+    """
+    result: List[Dict[str, Any]] = []
+    by_cluster: Dict[int, Dict[str, Any]] = {}
+
+    for item in items:
+        if index.contains(item["id"]):
+            continue
+        signature = simhash(item_text(item))
+        match = index.lookup(signature) if signature else None
+        if match is None:
+            cluster_id = index.add(item, signature)
+            canonical = item.copy()  # dict 또는 CollectedItem
+            canonical["cluster_id"] = cluster_id
+            canonical["alternates"] = []
+            by_cluster[cluster_id] = canonical
+            result.append(canonical)
+            continue
+
+        cluster_id, _ = match
+        index.add(item, signature, cluster_id)
+        if cluster_id in by_cluster:
+            by_cluster[cluster_id]["alternates"].append(
+                {"id": item["id"], "url": item.get("url"), "source": item.get("source")}
+            )
+
+    return result
@@ -0,0 +1,231 @@
+"""
+수집 데이터 임베딩 단계 (배치 계산 → pgvector 저장)
+
+제목+본문으로 텍스트 임베딩을 대량 배치로 계산해 pgvector 컬럼에 저장합니다.
+분석 서비스의 유사도 검색/클러스터링은 파이썬 이중 루프 대신 HNSW 인덱스 질의가 됩니다.
+
+- 기본 임베더: 해싱 트릭 벡터라이저 (문자 2/3-gram → 고정 차원, 모델 다운로드/GPU 불필요)
+- 선택 임베더: sentence-transformers 로컬 모델 (CPU 고정, 설치되어 있을 때만)
+- 캐시: 정규화한 제목+본문의 content_hash를 키로 저장하므로, 다시 수집된 동일 내용은
+  재계산하지 않습니다. 모델마다 별도 테이블(HNSW 인덱스)을 쓰므로 차원이 같은 다른 모델의
+  벡터를 재사용하거나 한 인덱스에 섞지 않습니다.
+"""
+
+import hashlib
+import math
+import re
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from collectors.dedup import item_text, normalize_text
+
+try:
+    import psycopg2  # type: ignore
+    from psycopg2.extras import execute_values  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    psycopg2 = None
+    execute_values = None
+
+try:
+    from sentence_transformers import SentenceTransformer  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    SentenceTransformer = None
+
+HASHING_MODEL = "hashing"
+DEFAULT_DIM = 256
+DEFAULT_BATCH_SIZE = 256
+NGRAM_SIZES = (2, 3)
+TABLE_PREFIX = "item_embeddings"
+# PostgreSQL 식별자 최대 63바이트 ("{table}_hnsw" 인덱스 이름 포함)
+MAX_TABLE_NAME = 58
+
+
+def content_hash(item: Dict[str, Any]) -> str:
+    """정규화된 제목+본문의 해시 (URL/수집 시각과 무관)"""
+    return hashlib.sha256(normalize_text(item_text(item)).encode('utf-8')).hexdigest()
+
+
+class HashingEmbedder:
+    """문자 n-gram 해싱 트릭 벡터라이저 (부호 해싱 + L2 정규화)"""
+
+    model_name = HASHING_MODEL
+
+    def __init__(self, dim: int = DEFAULT_DIM):
+        self.dim = dim
+
+    def _embed_one(self, text: str) -> List[float]:
+        vector = [0.0] * self.dim
+        compact = normalize_text(text).replace(" ", "")
+        for n in NGRAM_SIZES:
+            for i in range(len(compact) - n + 1):
+                h = int.from_bytes(
+                    hashlib.blake2b(compact[i:i + n].encode('utf-8'), digest_size=8).digest(), "big"
+                )
+                vector[h % self.dim] += 1.0 if h >> 63 else -1.0
+        norm = math.sqrt(sum(v * v for v in vector))
+        return [v / norm for v in vector] if norm else vector
+
+    def embed(self, texts: Sequence[str]) -> List[List[float]]:
+        return [self._embed_one(text) for text in texts]
+
+
+class SentenceTransformerEmbedder:
+    """sentence-transformers 로컬 모델 (CPU)"""
+
+    def __init__(self, model_name: str, batch_size: int = DEFAULT_BATCH_SIZE):
+        if SentenceTransformer is None:
+            raise RuntimeError("sentence-transformers가 설치되어 있지 않습니다: pip install sentence-transformers")
+        self.model_name = model_name
+        self.batch_size = batch_size
+        self.model = SentenceTransformer(model_name, device="cpu")
+        self.dim = self.model.get_sentence_embedding_dimension()
+
+    def embed(self, texts: Sequence[str]) -> List[List[float]]:
+        vectors = self.model.encode(
+            list(texts), batch_size=self.batch_size, normalize_embeddings=True, show_progress_bar=False
+        )
+        return [vector.tolist() for vector in vectors]
+
+
+def create_embedder(model: str = HASHING_MODEL, dim: int = DEFAULT_DIM):
+    if model == HASHING_MODEL:
+        return HashingEmbedder(dim)
+    return SentenceTransformerEmbedder(model)
+
+
+def _vector_literal(vector: Sequence[float]) -> str:
+    return "[" + ",".join(f"{v:.6g}" for v in vector) + "]"
+
+
+def embedding_table(model: str, dim: int) -> str:
+    """모델/차원별 임베딩 테이블 이름 (기본 해싱 임베더 256차원은 init.sql의 item_embeddings)"""
+    if model == HASHING_MODEL and dim == DEFAULT_DIM:
+        return TABLE_PREFIX
+    slug = re.sub(r"[^a-z0-9]+", "_", model.lower()).strip("_")
+    table = f"{TABLE_PREFIX}_{slug}_{dim}"
+    if len(table) > MAX_TABLE_NAME:
+        # 긴 모델 이름은 잘라내고 원래 이름의 해시를 붙여 구분
+        suffix = f"_{hashlib.sha1(model.encode('utf-8')).hexdigest()[:8]}_{dim}"
+        table = table[:MAX_TABLE_NAME - len(suffix)].rstrip("_") + suffix
+    return table
+
+
+class PgVectorStore:
+    """content_hash → 임베딩 저장소 (모델별 pgvector 테이블 + HNSW 코사인 인덱스)"""
+
+    def __init__(self, dsn: str, dim: int, model: str = HASHING_MODEL, table: Optional[str] = None):
+        if psycopg2 is None:
+            raise RuntimeError("pgvector 저장에는 psycopg2가 필요합니다: pip install psycopg2-binary")
+        self.dim = dim
+        self.model = model
+        # 모델마다 별도 테이블: 캐시 키와 HNSW 인덱스가 모델 단위로 분리됨 (인덱스는 고정 차원 필요)
+        self.table = table or embedding_table(model, dim)
+        self.conn = psycopg2.connect(dsn)
+        with self.conn, self.conn.cursor() as cur:
+            cur.execute("CREATE EXTENSION IF NOT EXISTS vector")
+            cur.execute(f"""
+                CREATE TABLE IF NOT EXISTS {self.table} (
+                    content_hash TEXT PRIMARY KEY,
+                    model TEXT NOT NULL,
+                    embedding vector({dim}) NOT NULL,
+                    created_at TIMESTAMPTZ NOT NULL DEFAULT now()
+                )
+            """)
+            cur.execute(
+                f"CREATE INDEX IF NOT EXISTS {self.table}_hnsw "
+                f"ON {self.table} USING hnsw (embedding vector_cosine_ops)"
+            )
+
+    def known_hashes(self, hashes: Sequence[str]) -> set:
+        if not hashes:
+            return set()
+        with self.conn.cursor() as cur:
+            # 모델별 테이블 이전에 같은 테이블에 저장된 다른 모델의 벡터는 캐시로 보지 않음
+            cur.execute(
+                f"SELECT content_hash FROM {self.table} WHERE content_hash = ANY(%s) AND model = %s",
+                (list(hashes), self.model)
+            )
+            return {row[0] for row in cur.fetchall()}
+
+    def write(self, rows: Sequence[tuple]) -> None:
+        """rows: (content_hash, vector) 목록"""
+        with self.conn, self.conn.cursor() as cur:
+            execute_values(
+                cur,
+                f"INSERT INTO {self.table} (content_hash, model, embedding) VALUES %s "
+                f"ON CONFLICT (content_hash) DO UPDATE SET model = EXCLUDED.model, "
+                f"embedding = EXCLUDED.embedding, created_at = now() "
+                f"WHERE {self.table}.model <> EXCLUDED.model",
+                [(h, self.model, _vector_literal(vector)) for h, vector in rows],
+                template="(%s, %s, %s::vector)",
+                page_size=len(rows)
+            )
+
+    def nearest(self, vector: Sequence[float], k: int = 10) -> List[tuple]:
+        """코사인 거리 기준 최근접 (content_hash, distance) k개 (HNSW 인덱스 사용)"""
+        with self.conn.cursor() as cur:
+            cur.execute(
+                f"SELECT content_hash, embedding <=> %s::vector AS distance FROM {self.table} "
+                f"ORDER BY embedding <=> %s::vector LIMIT %s",
+                (_vector_literal(vector), _vector_literal(vector), k)
+            )
+            return cur.fetchall()
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+class EmbeddingStage:
+    """수집 결과에 content_hash를 붙이고, 처음 보는 내용만 배치 임베딩해 저장"""
+
+    def __init__(self, embedder, store: PgVectorStore, batch_size: int = DEFAULT_BATCH_SIZE):
+        self.embedder = embedder
+        self.store = store
+        self.batch_size = batch_size
+        self.embedded = 0
+        self.cached = 0
+
+    def process(self, items: Iterable[Dict[str, Any]]) -> None:
+        batch: List[Dict[str, Any]] = []
+        for item in items:
+            item['content_hash'] = content_hash(item)
+            batch.append(item)
+            if len(batch) >= self.batch_size:
+                self._flush(batch)
+                batch = []
+        if batch:
+            self._flush(batch)
+
+    def _flush(self, batch: List[Dict[str, Any]]) -> None:
+        pending: Dict[str, str] = {}
+        for item in batch:
+            pending.setdefault(item['content_hash'], item_text(item))
+        known = self.store.known_hashes(list(pending))
+        todo = [(h, text) for h, text in pending.items() if h not in known]
+        self.cached += len(pending) - len(todo)
+        if not todo:
+            return
+        vectors = self.embedder.embed([text for _, text in todo])
+        self.store.write([(h, v) for (h, _), v in zip(todo, vectors)])
+        self.embedded += len(todo)
+
+    def close(self) -> None:
+        self.store.close()
+
+
+def add_embedding_arguments(parser) -> None:
+    """수집 스크립트 공통 CLI 옵션"""
+    parser.add_argument("--embed", action="store_true",
+                        help="수집 후 임베딩을 계산해 pgvector에 저장 (--pg-dsn 필요)")
+    parser.add_argument("--embedding-model", default=HASHING_MODEL,
+                        help="'hashing'(기본, 오프라인) 또는 sentence-transformers 모델 이름")
+    parser.add_argument("--embedding-batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+
+
+def stage_from_args(args) -> Optional[EmbeddingStage]:
+    if not args.embed:
+        return None
+    if not args.pg_dsn:
+        raise SystemExit("--embed에는 --pg-dsn(또는 COLLECTOR_PG_DSN)이 필요합니다")
+    embedder = create_embedder(args.embedding_model)
+    store = PgVectorStore(args.pg_dsn, embedder.dim, model=embedder.model_name)
+    return EmbeddingStage(embedder, store, batch_size=args.embedding_batch_size)
@@ -0,0 +1,200 @@
+"""
+스트리밍 RSS/Atom 파서
+
+응답 본문을 청크 단위로 pull 파서에 넣으면서 <item>/<entry>가 닫힐 때마다 항목을 내놓습니다.
+항목 수 상한(limit)에 도달하거나 이전 실행에서 본 항목(stop_at)을 만나면 즉시 읽기를 멈추고,
+처리한 요소는 트리에서 제거하므로 크거나 느린 피드도 실제로 사용하는 항목만큼만 비용이 듭니다.
+
+- 백엔드: lxml XMLPullParser(recover 모드)가 있으면 사용, 없으면 xml.etree.ElementTree.XMLPullParser
+- 잘못된 XML로 파싱이 실패하면 지금까지 받은 본문 + 나머지를 feedparser로 다시 파싱 (설치된 경우)
+
+항목 dict 키: id, title, link, summary, published, author, feed_title
+
+fetch_feed_items()는 피드별 워터마크(마지막으로 본 최신 항목 id)까지 읽고 멈춥니다.
+피드가 최신순으로 정렬되어 있다고 가정합니다.
+"""
+
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+from xml.etree import ElementTree
+
+from collectors.metrics import get_metrics
+from collectors.timestamps import to_epoch
+
+try:
+    from lxml import etree as lxml_etree  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    lxml_etree = None
+
+try:
+    import feedparser  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    feedparser = None
+
+CHUNK_SIZE = 16 * 1024
+ITEM_TAGS = ("item", "entry")
+FEED_TAGS = ("channel", "feed")
+
+_PARSE_ERRORS = (ElementTree.ParseError,) + ((lxml_etree.XMLSyntaxError,) if lxml_etree else ())
+
+FeedItem = Dict[str, Optional[str]]
+
+
+def _local(tag: Any) -> str:
+    if not isinstance(tag, str):  # lxml 주석/처리 명령
+        return ""
+    return tag.rsplit("}", 1)[-1]
+
+
+def _new_parser():
+    if lxml_etree is not None:
+        return lxml_etree.XMLPullParser(events=("start", "end"), recover=True, resolve_entities=False)
+    return ElementTree.XMLPullParser(events=("start", "end"))
+
+
+def _text(elem) -> Optional[str]:
+    text = "".join(elem.itertext()).strip()
+    return text or None
+
+
+def _item(elem, feed_title: Optional[str]) -> FeedItem:
+    item: FeedItem = {
+        "id": None, "title": None, "link": None, "summary": None,
+        "published": None, "author": None, "feed_title": feed_title
+    }
+    for child in elem:
+        name = _local(child.tag)
+        if name == "title":
+            item["title"] = _text(child)
+        elif name == "link":
+            # Atom: <link href="..." rel="alternate"/>, RSS: <link>...</link>
+            href = child.get("href")
+            if href and child.get("rel", "alternate") == "alternate":
+                item["link"] = href
+            elif not href and item["link"] is None:
+                item["link"] = _text(child)
+        elif name in ("description", "summary") or (name == "content" and item["summary"] is None):
+            item["summary"] = _text(child)
+        elif name in ("pubDate", "published", "date") or (name == "updated" and item["published"] is None):
+            item["published"] = _text(child)
+        elif name in ("author", "creator"):
+            name_elem = next((c for c in child if _local(c.tag) == "name"), None)
+            item["author"] = _text(name_elem if name_elem is not None else child)
+        elif name in ("guid", "id"):
+            item["id"] = _text(child)
+    if item["id"] is None:
+        item["id"] = item["link"]
+    return item
+
+
+def iter_feed_items(chunks: Iterable[bytes], limit: Optional[int] = None,
+                    stop_at: Optional[Callable[[FeedItem], bool]] = None) -> Iterator[FeedItem]:
+    """본문 청크에서 피드 항목을 순서대로 반환
+
+    limit개를 반환했거나 stop_at(item)이 참인 항목을 만나면 (그 항목은 반환하지 않고) 중단합니다.
+    """
+    parser = _new_parser()
+    chunks = iter(chunks)
+    received: List[bytes] = []
+    stack: List[Any] = []
+    feed_title: Optional[str] = None
+    count = 0
+
+    try:
+        for chunk in chunks:
+            received.append(chunk)
+            parser.feed(chunk)
+            for event, elem in parser.read_events():
+                if event == "start":
+                    stack.append(elem)
+                    continue
+                stack.pop()
+                name = _local(elem.tag)
+                if name in ITEM_TAGS:
+                    item = _item(elem, feed_title)
+                    # 처리한 항목은 부모에서 떼어내 트리가 커지지 않게 함
+                    elem.clear()
+                    if stack:
+                        stack[-1].remove(elem)
+                    if stop_at is not None and stop_at(item):
+                        return
+                    yield item
+                    count += 1
+                    if limit is not None and count >= limit:
+                        return
+                elif name == "title" and feed_title is None and stack and _local(stack[-1].tag) in FEED_TAGS:
+                    feed_title = _text(elem)
+        parser.close()
+    except _PARSE_ERRORS:
+        if feedparser is None:
+            raise
+        body = b"".join(received) + b"".join(chunks)
+        yield from _fallback(body, count, limit, stop_at)
+
+
+def _fallback(body: bytes, skip: int, limit: Optional[int],
+              stop_at: Optional[Callable[[FeedItem], bool]]) -> Iterator[FeedItem]:
+    """feedparser로 전체 본문을 파싱해 이미 반환한 skip개 이후 항목을 이어서 반환"""
+    feed = feedparser.parse(body)
+    feed_title = feed.feed.get('title')
+    count = skip
+    for entry in feed.entries[skip:]:
+        item: FeedItem = {
+            "id": entry.get('id') or entry.get('link'),
+            "title": entry.get('title'),
+            "link": entry.get('link'),
+            "summary": entry.get('summary'),
+            "published": entry.get('published') or entry.get('updated'),
+            "author": entry.get('author'),
+            "feed_title": feed_title
+        }
+        if stop_at is not None and stop_at(item):
+            return
+        yield item
+        count += 1
+        if limit is not None and count >= limit:
+            return
+
+
+def iter_response_items(response, limit: Optional[int] = None,
+                        stop_at: Optional[Callable[[FeedItem], bool]] = None) -> Iterator[FeedItem]:
+    """requests 응답(stream=True 권장)에서 항목을 읽고, 끝나거나 중단하면 연결을 닫음"""
+    metrics = get_metrics().current()
+
+    def chunks() -> Iterator[bytes]:
+        for chunk in response.iter_content(CHUNK_SIZE):
+            if metrics is not None:
+                metrics.add(bytes=len(chunk))
+            yield chunk
+
+    try:
+        yield from iter_feed_items(chunks(), limit=limit, stop_at=stop_at)
+    finally:
+        response.close()
+
+
+def fetch_feed_items(transport, url: str, limit: Optional[int] = None, watermarks=None,
+                     headers: Optional[Dict[str, str]] = None, key: Optional[str] = None) -> Iterator[FeedItem]:
+    """피드를 스트리밍으로 읽어 항목 반환. watermarks(WatermarkStore)가 있으면 이전 실행의 최신 항목에서 멈춤
+
+    새 워터마크는 key(기본: url)로 stage()만 하므로, 호출자가 항목을 저장한 뒤 watermarks.commit([key])로
+    확정합니다. 같은 피드를 필터가 다른 여러 수집기가 읽으면 수집기별로 다른 key를 씁니다.
+    """
+    key = key or url
+    mark = watermarks.get(key) if watermarks is not None else None
+    stop_at = (lambda item: item["id"] == mark["id"]) if mark else None
+
+    response = transport.get(url, headers=headers, stream=True)
+    if response.status_code != 200:
+        response.close()
+        print(f"   ⚠️ 피드 접근 실패: {response.status_code} ({url})")
+        return
+
+    newest: Optional[FeedItem] = None
+    for item in iter_response_items(response, limit=limit, stop_at=stop_at):
+        if newest is None:
+            newest = item
+        yield item
+
+    if watermarks is not None and newest is not None and newest["id"]:
+        watermarks.stage(key, newest["id"], to_epoch(newest["published"]) or int(time.time()))
@@ -0,0 +1,252 @@
+"""
+수집 실행 계측 (소스별 성능 리포트 + 프로파일링)
+
+소스마다 다음 값을 모아 실행 리포트 JSON으로 남깁니다.
+
+  requests / bytes / latency        HTTP 요청 수, 받은 바이트, 요청 지연 (collectors.transport)
+  fetch_seconds                     fetch 이터레이터 소요 시간 (네트워크 + 스트리밍 파싱 포함)
+  parse_seconds                     응답 → 레코드 변환 시간
+  items_parsed / items_kept / items_new
+                                    파싱 → 필터 통과 → 중복 제거 후 신규
+  errors                            예외 클래스/HTTP 상태별 횟수, retries: 전송 계층 재시도 횟수
+
+현재 스레드가 어느 소스를 처리 중인지는 RunMetrics.scope()로 지정하며, 전송 계층은
+스코프가 없으면 기록하지 않습니다. --profile은 Profiler로 cProfile(모든 스레드 합산)과
+tracemalloc 상위 할당 위치를 함께 저장합니다.
+"""
+
+import cProfile
+import io
+import json
+import pstats
+import resource
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter, deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Deque, Dict, Iterator, List, Optional
+
+LATENCY_SAMPLES = 1000
+PROFILE_TOP = 40
+MEMORY_TOP = 30
+
+
+def _percentile(values: List[float], q: float) -> Optional[float]:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+@dataclass
+class SourceMetrics:
+    name: str
+    requests: int = 0
+    cached_responses: int = 0
+    retries: int = 0
+    bytes: int = 0
+    request_seconds: float = 0.0
+    max_latency: float = 0.0
+    fetch_seconds: float = 0.0
+    parse_seconds: float = 0.0
+    payloads: int = 0
+    items_parsed: int = 0
+    items_kept: int = 0
+    items_new: int = 0
+    errors: Counter = field(default_factory=Counter)
+    latencies: Deque[float] = field(default_factory=lambda: deque(maxlen=LATENCY_SAMPLES), repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record_request(self, latency: float, nbytes: int, status: Optional[int] = None,
+                       error: Optional[str] = None, cached: bool = False) -> None:
+        with self._lock:
+            self.requests += 1
+            self.cached_responses += int(cached)
+            self.bytes += nbytes
+            self.request_seconds += latency
+            self.max_latency = max(self.max_latency, latency)
+            self.latencies.append(latency)
+            if error:
+                self.errors[error] += 1
+            elif status is not None and status >= 400:
+                self.errors[f"HTTP {status}"] += 1
+
+    def add(self, **deltas: float) -> None:
+        with self._lock:
+            for name, delta in deltas.items():
+                setattr(self, name, getattr(self, name) + delta)
+
+    def record_error(self, error: BaseException) -> None:
+        with self._lock:
+            self.errors[type(error).__name__] += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            latencies = list(self.latencies)
+            return {
+                "requests": self.requests,
+                "cached_responses": self.cached_responses,
+                "retries": self.retries,
+                "bytes": self.bytes,
+                "request_seconds": round(self.request_seconds, 3),
+                "latency_p50": round(_percentile(latencies, 0.5) or 0.0, 3),
+                "latency_p95": round(_percentile(latencies, 0.95) or 0.0, 3),
+                "latency_max": round(self.max_latency, 3),
+                "fetch_seconds": round(self.fetch_seconds, 3),
+                "parse_seconds": round(self.parse_seconds, 3),
+                "payloads": self.payloads,
+                "items_parsed": self.items_parsed,
+                "items_kept": self.items_kept,
+                "items_new": self.items_new,
+                "errors": dict(self.errors),
+            }
+
+
+class RunMetrics:
+    """실행 단위 소스별 계측 저장소 (스레드 안전)"""
+
+    def __init__(self):
+        self.started_at = datetime.now().isoformat()
+        self._start = time.perf_counter()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.sources: Dict[str, SourceMetrics] = {}
+
+    def source(self, name: str) -> SourceMetrics:
+        with self._lock:
+            if name not in self.sources:
+                self.sources[name] = SourceMetrics(name)
+            return self.sources[name]
+
+    @contextmanager
+    def scope(self, name: str) -> Iterator[SourceMetrics]:
+        """현재 스레드의 HTTP 요청/바이트를 name 소스로 기록"""
+        previous = getattr(self._local, "current", None)
+        self._local.current = self.source(name)
+        try:
+            yield self._local.current
+        finally:
+            self._local.current = previous
+
+    def current(self) -> Optional[SourceMetrics]:
+        return getattr(self._local, "current", None)
+
+    def report(self) -> Dict[str, Any]:
+        """소스별 계측 (fetch + parse 시간이 긴 순)"""
+        with self._lock:
+            sources = list(self.sources.values())
+        sources.sort(key=lambda m: m.fetch_seconds + m.parse_seconds, reverse=True)
+        return {
+            "started_at": self.started_at,
+            "wall_seconds": round(time.perf_counter() - self._start, 3),
+            "peak_rss_mb": round(peak_rss_mb(), 1),
+            "sources": {m.name: m.to_dict() for m in sources},
+        }
+
+    def print_summary(self) -> None:
+        report = self.report()
+        print(f"\n📈 소스별 성능 (총 {report['wall_seconds']:.1f}s, 최대 RSS {report['peak_rss_mb']:.0f}MB)")
+        for name, m in report["sources"].items():
+            errors = sum(m["errors"].values())
+            print(f"  - {name[:24]:<24} 요청 {m['requests']:>4}  {m['bytes'] / 1024:>8.0f}KB  "
+                  f"p50 {m['latency_p50']:.2f}s  fetch {m['fetch_seconds']:>6.2f}s  parse {m['parse_seconds']:>6.3f}s  "
+                  f"항목 {m['items_parsed']}→{m['items_kept']}→{m['items_new']}  오류 {errors}")
+
+
+def peak_rss_mb() -> float:
+    """프로세스 최대 RSS (MB, Linux는 KB 단위, macOS는 바이트 단위)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+_metrics = RunMetrics()
+
+
+def get_metrics() -> RunMetrics:
+    return _metrics
+
+
+def reset_metrics() -> RunMetrics:
+    """새 실행 시작 (이전 실행 계측 폐기)"""
+    global _metrics
+    _metrics = RunMetrics()
+    return _metrics
+
+
+def write_report(path: str, report: Dict[str, Any]) -> None:
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+class Profiler:
+    """cProfile(메인 + 시작 이후 생성된 모든 스레드) + tracemalloc
+
+    Python 3.11 이하의 cProfile은 스레드별로 동작하므로 threading.setprofile 훅으로 새 스레드마다
+    프로파일러를 켜고, 종료 시 메인 스레드 결과와 합칩니다. 3.12부터는 cProfile이 프로세스 전체에
+    하나만 켜질 수 있고(sys.monitoring) 메인 프로파일러가 모든 스레드를 기록하므로 훅을 쓰지 않습니다.
+    """
+
+    PER_THREAD = sys.version_info < (3, 12)
+
+    def __init__(self, prefix: str):
+        self.prefix = prefix
+        self._main = cProfile.Profile()
+        self._threads: List[cProfile.Profile] = []
+        self._lock = threading.Lock()
+        self.outputs: Dict[str, str] = {}
+
+    def _thread_hook(self, frame, event, arg) -> None:
+        # 훅에서 예외가 나면 스레드가 대상 함수를 실행하지 못하고 종료되므로 실패는 무시
+        try:
+            profile = cProfile.Profile()
+            profile.enable()  # 이 스레드의 프로파일 함수를 교체
+        except Exception:
+            sys.setprofile(None)
+            return
+        with self._lock:
+            self._threads.append(profile)
+
+    def start(self) -> None:
+        tracemalloc.start(10)
+        if self.PER_THREAD:
+            threading.setprofile(self._thread_hook)
+        self._main.enable()
+
+    def stop(self) -> Dict[str, Any]:
+        """결과 파일을 저장하고 리포트용 요약 반환"""
+        self._main.disable()
+        if self.PER_THREAD:
+            threading.setprofile(None)
+        snapshot = tracemalloc.take_snapshot()
+        _, traced_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        stats = pstats.Stats(self._main)
+        with self._lock:
+            for profile in self._threads:
+                profile.create_stats()
+                if profile.stats:
+                    stats.add(profile)
+        stats.dump_stats(f"{self.prefix}.prof")
+
+        text = io.StringIO()
+        pstats.Stats(f"{self.prefix}.prof", stream=text).sort_stats("cumulative").print_stats(PROFILE_TOP)
+        with open(f"{self.prefix}.profile.txt", 'w', encoding='utf-8') as f:
+            f.write(text.getvalue())
+
+        top = snapshot.statistics("lineno")[:MEMORY_TOP]
+        with open(f"{self.prefix}.memory.txt", 'w', encoding='utf-8') as f:
+            f.write(f"traced peak: {traced_peak / 2**20:.1f} MiB\n\n")
+            for stat in top:
+                f.write(f"{stat}\n")
+
+        self.outputs = {
+            "cprofile": f"{self.prefix}.prof",
+            "cprofile_text": f"{self.prefix}.profile.txt",
+            "tracemalloc": f"{self.prefix}.memory.txt",
+        }
+        return {"traced_peak_mb": round(traced_peak / 2**20, 1), "files": self.outputs}
@@ -0,0 +1,104 @@
+"""
+게시일 기준 일자 파티션 저장소 (JSONL)
+
+항목을 published_ts(UTC)의 날짜별 디렉터리에 나눠 저장합니다.
+
+  <base_dir>/dt=2024-01-15/<name>.jsonl
+
+시간 구간 조회는 구간에 걸친 dt= 디렉터리만 읽으므로, 누적 데이터가 커져도
+조회 비용은 구간 길이에 비례합니다. (Hive 스타일 경로라 DuckDB/Spark 등에서 그대로 읽을 수 있습니다.)
+"""
+
+import json
+import os
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from collectors.records import json_default
+from collectors.timestamps import normalize_item
+
+PARTITION_PREFIX = "dt="
+UNKNOWN_PARTITION = "dt=unknown"
+
+
+def partition_key(ts: Optional[int]) -> str:
+    if ts is None:
+        return UNKNOWN_PARTITION
+    return PARTITION_PREFIX + datetime.fromtimestamp(ts, tz=timezone.utc).strftime('%Y-%m-%d')
+
+
+class PartitionedJsonlWriter:
+    """published_ts 기준으로 dt=YYYY-MM-DD/<name>.jsonl에 추가 기록 (스레드 안전)"""
+
+    def __init__(self, base_dir: str, name: str = "collected"):
+        self.base_dir = base_dir
+        self.name = name
+        self._lock = threading.Lock()
+
+    def path_for(self, key: str) -> str:
+        return os.path.join(self.base_dir, key, f"{self.name}.jsonl")
+
+    def write_many(self, items: Iterable[Dict[str, Any]]) -> Dict[str, int]:
+        """항목을 파티션별로 묶어 기록하고 {파티션: 건수} 반환"""
+        groups: Dict[str, List[str]] = {}
+        for item in items:
+            if 'published_ts' not in item:
+                normalize_item(item)
+            groups.setdefault(partition_key(item.get('published_ts')), []).append(
+                json.dumps(item, ensure_ascii=False, default=json_default)
+            )
+        with self._lock:
+            for key, lines in groups.items():
+                path = self.path_for(key)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(path, 'a', encoding='utf-8') as f:
+                    f.write("\n".join(lines) + "\n")
+        return {key: len(lines) for key, lines in groups.items()}
+
+
+def partitions_in_range(base_dir: str, start_ts: Optional[int] = None,
+                        end_ts: Optional[int] = None) -> List[str]:
+    """[start_ts, end_ts] 구간에 걸친 파티션 디렉터리 (날짜순)"""
+    if not os.path.isdir(base_dir):
+        return []
+    if start_ts is not None and end_ts is not None:
+        # 구간이 짧으면 디렉터리 목록 대신 날짜를 직접 나열
+        day = datetime.fromtimestamp(start_ts, tz=timezone.utc).date()
+        last = datetime.fromtimestamp(end_ts, tz=timezone.utc).date()
+        keys = []
+        while day <= last:
+            keys.append(f"{PARTITION_PREFIX}{day.isoformat()}")
+            day += timedelta(days=1)
+        return [os.path.join(base_dir, key) for key in keys if os.path.isdir(os.path.join(base_dir, key))]
+
+    low = partition_key(start_ts) if start_ts is not None else None
+    high = partition_key(end_ts) if end_ts is not None else None
+    selected = []
+    for entry in sorted(os.listdir(base_dir)):
+        if not entry.startswith(PARTITION_PREFIX) or entry == UNKNOWN_PARTITION:
+            continue
+        if (low and entry < low) or (high and entry > high):
+            continue
+        selected.append(os.path.join(base_dir, entry))
+    return selected
+
+
+def read_range(base_dir: str, start_ts: Optional[int] = None,
+               end_ts: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+    """구간에 해당하는 파티션만 읽어 published_ts가 구간 안인 항목을 순회"""
+    for directory in partitions_in_range(base_dir, start_ts, end_ts):
+        for filename in sorted(os.listdir(directory)):
+            if not filename.endswith('.jsonl'):
+                continue
+            with open(os.path.join(directory, filename), 'r', encoding='utf-8') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    item = json.loads(line)
+                    ts = item.get('published_ts')
+                    if start_ts is not None and (ts is None or ts < start_ts):
+                        continue
+                    if end_ts is not None and (ts is None or ts > end_ts):
+                        continue
+                    yield item
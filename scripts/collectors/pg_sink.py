@@ -0,0 +1,221 @@
+"""
+수집 데이터 Postgres 적재 (COPY + upsert)
+
+레코드를 메모리에 배치로 모았다가 COPY로 임시 스테이징 테이블에 밀어 넣고,
+INSERT ... ON CONFLICT (id) DO UPDATE로 한 트랜잭션에 upsert합니다.
+행 단위 INSERT 대비 왕복 횟수가 배치 크기만큼 줄어 초당 수천 행 이상 적재할 수 있습니다.
+
+- batch_size개가 모이거나 flush_interval초가 지나면 flush
+- 스레드 안전 (데몬 모드에서 여러 수집 스레드가 공유)
+- psycopg2 ThreadedConnectionPool 사용
+
+환경 변수:
+  COLLECTOR_PG_DSN  적재 대상 DSN (없으면 적재하지 않음)
+"""
+
+import csv
+import io
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+try:
+    import psycopg2  # type: ignore
+    from psycopg2.pool import ThreadedConnectionPool  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    psycopg2 = None
+    ThreadedConnectionPool = None
+
+TABLE_NAME = "collected_items"
+STAGE_TABLE_NAME = "collected_items_stage"
+NULL_MARKER = "\\N"
+
+# 고정 컬럼 외의 필드(score, num_comments, alternates 등)는 extra JSONB에 저장
+COLUMNS = [
+    "id", "source", "category", "platform", "title", "content", "url",
+    "author", "author_id", "published_at", "published_ts", "collected_at", "content_hash", "extra"
+]
+
+SCHEMA_SQL = f"""
+CREATE TABLE IF NOT EXISTS {TABLE_NAME} (
+    id TEXT PRIMARY KEY,
+    source TEXT NOT NULL,
+    category TEXT,
+    platform TEXT,
+    title TEXT,
+    content TEXT,
+    url TEXT,
+    author TEXT,
+    author_id TEXT,
+    published_at TEXT,
+    published_ts BIGINT,
+    collected_at TIMESTAMPTZ,
+    content_hash TEXT,
+    extra JSONB,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+ALTER TABLE {TABLE_NAME} ADD COLUMN IF NOT EXISTS content_hash TEXT;
+ALTER TABLE {TABLE_NAME} ADD COLUMN IF NOT EXISTS published_ts BIGINT;
+CREATE INDEX IF NOT EXISTS {TABLE_NAME}_content_hash ON {TABLE_NAME} (content_hash);
+-- 게시 시각 구간 조회용 (적재 순서가 대체로 시간순이라 BRIN이 작고 빠름)
+CREATE INDEX IF NOT EXISTS {TABLE_NAME}_published_ts ON {TABLE_NAME} USING brin (published_ts);
+"""
+
+STAGE_SQL = f"""
+CREATE TEMP TABLE IF NOT EXISTS {STAGE_TABLE_NAME}
+    (LIKE {TABLE_NAME} INCLUDING DEFAULTS) ON COMMIT DELETE ROWS;
+"""
+
+# 단계가 꺼져 있으면 NULL로 오는 파생 컬럼: 재적재 시 저장된 값을 지우지 않음
+KEEP_IF_NULL_COLUMNS = ("content_hash", "published_ts")
+
+
+def _update_expr(col: str) -> str:
+    if col in KEEP_IF_NULL_COLUMNS:
+        return f"{col} = COALESCE(EXCLUDED.{col}, {TABLE_NAME}.{col})"
+    if col == "extra":
+        # 보강 필드(article_markdown 등)가 빠진 재적재가 저장된 키를 지우지 않도록 병합 (새 값 우선)
+        return (f"extra = NULLIF(COALESCE({TABLE_NAME}.extra, '{{}}'::jsonb) || "
+                f"COALESCE(EXCLUDED.extra, '{{}}'::jsonb), '{{}}'::jsonb)")
+    return f"{col} = EXCLUDED.{col}"
+
+
+# 한 배치에 같은 id가 여러 번 있으면 가장 최근에 수집한 행을 사용
+UPSERT_SQL = f"""
+INSERT INTO {TABLE_NAME} ({", ".join(COLUMNS)})
+SELECT DISTINCT ON (id) {", ".join(COLUMNS)} FROM {STAGE_TABLE_NAME}
+ORDER BY id, collected_at DESC NULLS LAST
+ON CONFLICT (id) DO UPDATE SET
+    {", ".join(_update_expr(col) for col in COLUMNS if col != "id")},
+    updated_at = now();
+"""
+
+
+def default_dsn() -> Optional[str]:
+    return os.environ.get("COLLECTOR_PG_DSN") or None
+
+
+def _row(item: Dict[str, Any]) -> List[Any]:
+    extra = {key: value for key, value in item.items() if key not in COLUMNS}
+    row = [item.get(col) for col in COLUMNS[:-1]]
+    row.append(json.dumps(extra, ensure_ascii=False) if extra else None)
+    return row
+
+
+class PostgresSink:
+    """배치 COPY + upsert 적재기"""
+
+    def __init__(self, dsn: str, batch_size: int = 1000, flush_interval: float = 5.0,
+                 min_connections: int = 1, max_connections: int = 4, ensure_schema: bool = True):
+        if psycopg2 is None:
+            raise RuntimeError("Postgres 적재에는 psycopg2가 필요합니다: pip install psycopg2-binary")
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.pool = ThreadedConnectionPool(min_connections, max_connections, dsn)
+        self.rows_written = 0
+        self.flush_count = 0
+        self._buffer: List[List[Any]] = []
+        self._lock = threading.Lock()
+        self._last_flush = time.monotonic()
+        self._closed = threading.Event()
+        if ensure_schema:
+            self._execute(SCHEMA_SQL)
+        self._flusher = threading.Thread(target=self._flush_periodically, name="pg-sink-flush", daemon=True)
+        self._flusher.start()
+
+    def _execute(self, sql: str) -> None:
+        conn = self.pool.getconn()
+        try:
+            with conn:
+                with conn.cursor() as cur:
+                    cur.execute(sql)
+        finally:
+            self.pool.putconn(conn)
+
+    def write(self, item: Dict[str, Any]) -> None:
+        with self._lock:
+            self._buffer.append(_row(item))
+            full = len(self._buffer) >= self.batch_size
+        if full:
+            self.flush()
+
+    def write_many(self, items: Iterable[Dict[str, Any]]) -> None:
+        for item in items:
+            self.write(item)
+
+    def flush(self) -> int:
+        """버퍼를 한 트랜잭션으로 적재하고 적재한 행 수 반환"""
+        with self._lock:
+            rows, self._buffer = self._buffer, []
+            self._last_flush = time.monotonic()
+        if not rows:
+            return 0
+
+        # None은 \N으로 써서 빈 문자열과 NULL을 구분
+        payload = io.StringIO()
+        csv.writer(payload).writerows(
+            [NULL_MARKER if value is None else value for value in row] for row in rows
+        )
+        payload.seek(0)
+
+        conn = self.pool.getconn()
+        try:
+            with conn:
+                with conn.cursor() as cur:
+                    cur.execute(STAGE_SQL)
+                    cur.copy_expert(
+                        f"COPY {STAGE_TABLE_NAME} ({', '.join(COLUMNS)}) FROM STDIN WITH (FORMAT csv, NULL '{NULL_MARKER}')",
+                        payload
+                    )
+                    cur.execute(UPSERT_SQL)
+        except Exception:
+            # 실패한 배치는 다음 flush에서 재시도
+            with self._lock:
+                self._buffer = rows + self._buffer
+            raise
+        finally:
+            self.pool.putconn(conn)
+
+        with self._lock:
+            self.rows_written += len(rows)
+            self.flush_count += 1
+        return len(rows)
+
+    def _flush_periodically(self) -> None:
+        while not self._closed.wait(self.flush_interval / 2):
+            if time.monotonic() - self._last_flush < self.flush_interval:
+                continue
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"❌ Postgres 적재 오류: {e}")
+
+    def close(self) -> None:
+        self._closed.set()
+        self._flusher.join()
+        try:
+            self.flush()
+        finally:
+            self.pool.closeall()
+
+    def __enter__(self) -> "PostgresSink":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def add_sink_arguments(parser) -> None:
+    """수집 스크립트 공통 CLI 옵션"""
+    parser.add_argument("--pg-dsn", default=default_dsn(),
+                        help="수집 결과를 적재할 Postgres DSN (기본: COLLECTOR_PG_DSN)")
+    parser.add_argument("--pg-batch-size", type=int, default=1000, help="COPY 배치 크기")
+    parser.add_argument("--pg-flush-interval", type=float, default=5.0, help="최대 flush 간격(초)")
+
+
+def sink_from_args(args) -> Optional[PostgresSink]:
+    if not args.pg_dsn:
+        return None
+    return PostgresSink(args.pg_dsn, batch_size=args.pg_batch_size, flush_interval=args.pg_flush_interval)
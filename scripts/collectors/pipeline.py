@@ -0,0 +1,337 @@
+"""
+단계별 수집 파이프라인
+
+  source → fetch → parse → filter → dedup → enrich → sink
+
+각 단계는 자체 스레드(fetch는 여러 워커)에서 실행되고 크기가 제한된 큐로 연결됩니다.
+다음 단계가 밀리면 put이 막히므로 앞 단계가 자동으로 속도를 늦추고(backpressure),
+전체 결과를 리스트로 모으지 않기 때문에 메모리 사용량이 수집량과 무관하게 일정합니다.
+
+새 소스는 Source(fetch, parse, filter)로 추가합니다.
+  - fetch(): 원시 응답/페이지를 순서대로 내놓는 이터러블 (페이지네이션 포함)
+  - parse(payload): 응답 하나에서 CollectedItem을 내놓는 이터러블
+  - filter(item): 보관 여부 (선택)
+  - commit(): 소스의 항목이 모두 sink에 기록된 뒤 호출 (워터마크 확정 등, 선택)
+
+단계별 처리량/대기 시간은 Pipeline.report()로, 소스별 요청/바이트/파싱 시간/항목 수는
+collectors.metrics.get_metrics()로 확인합니다.
+"""
+
+import hashlib
+import json
+import queue
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from collectors.dedup import DedupIndex, deduplicate
+from collectors.metrics import SourceMetrics, get_metrics
+from collectors.records import CollectedItem, json_default
+from collectors.timestamps import normalize_item
+
+_STOP = object()
+
+Batch = List[Any]
+
+
+def make_item_id(key: str) -> str:
+    """URL 등 고유 키로 항목 ID 생성"""
+    return hashlib.md5(key.encode()).hexdigest()[:16]
+
+
+def make_user_id(author: str, platform: str) -> str:
+    """작성자 ID 생성"""
+    return hashlib.md5(f"{platform}:{author}".encode()).hexdigest()[:16]
+
+
+def title_contains(*keywords: str) -> Callable[[CollectedItem], bool]:
+    return lambda item: any(keyword in (item.get('title') or '') for keyword in keywords)
+
+
+def text_contains(*keywords: str) -> Callable[[CollectedItem], bool]:
+    """제목+본문(소문자)에 키워드 중 하나가 있으면 통과"""
+    def matches(item: CollectedItem) -> bool:
+        text = f"{item.get('title') or ''}{item.get('content') or ''}".lower()
+        return any(keyword in text for keyword in keywords)
+    return matches
+
+
+@dataclass
+class Source:
+    name: str
+    fetch: Callable[[], Iterable[Any]]
+    parse: Callable[[Any], Iterable[CollectedItem]]
+    filter: Optional[Callable[[CollectedItem], bool]] = None
+    commit: Optional[Callable[[], None]] = None
+
+
+def timed_fetch(source: Source) -> Iterator[Any]:
+    """source.fetch()를 소스 계측 스코프 안에서 순회하며 응답마다 걸린 시간을 기록"""
+    metrics_store = get_metrics()
+    with metrics_store.scope(source.name) as metrics:
+        payloads = iter(source.fetch())
+        while True:
+            start = time.perf_counter()
+            try:
+                payload = next(payloads)
+            except StopIteration:
+                metrics.add(fetch_seconds=time.perf_counter() - start)
+                return
+            except Exception as e:
+                metrics.add(fetch_seconds=time.perf_counter() - start)
+                metrics.record_error(e)
+                raise
+            metrics.add(fetch_seconds=time.perf_counter() - start, payloads=1)
+            yield payload
+
+
+def parse_payload(source: Source, payload: Any, metrics: SourceMetrics) -> List[CollectedItem]:
+    """응답 하나를 레코드로 변환하고 게시 시각을 정규화 (파싱 시간/항목 수 기록)"""
+    start = time.perf_counter()
+    try:
+        items = list(source.parse(payload))
+        for item in items:
+            normalize_item(item)
+    except Exception as e:
+        metrics.record_error(e)
+        raise
+    finally:
+        metrics.add(parse_seconds=time.perf_counter() - start)
+    metrics.add(items_parsed=len(items))
+    return items
+
+
+def run_source(source: Source) -> List[CollectedItem]:
+    """단일 소스를 현재 스레드에서 순서대로 실행 (데몬/단건 호출용)"""
+    metrics = get_metrics().source(source.name)
+    items = []
+    for payload in timed_fetch(source):
+        for item in parse_payload(source, payload, metrics):
+            if source.filter is None or source.filter(item):
+                items.append(item)
+    metrics.add(items_kept=len(items))
+    return items
+
+
+@dataclass
+class StageStats:
+    name: str
+    workers: int = 1
+    items_in: int = 0
+    items_out: int = 0
+    errors: int = 0
+    busy_seconds: float = 0.0
+    blocked_seconds: float = 0.0  # 다음 단계 큐가 가득 차서 기다린 시간
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record(self, items_in: int, items_out: int, busy: float, blocked: float, errors: int = 0) -> None:
+        with self._lock:
+            self.items_in += items_in
+            self.items_out += items_out
+            self.busy_seconds += busy
+            self.blocked_seconds += blocked
+            self.errors += errors
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "workers": self.workers,
+            "items_in": self.items_in,
+            "items_out": self.items_out,
+            "errors": self.errors,
+            "busy_seconds": round(self.busy_seconds, 3),
+            "blocked_seconds": round(self.blocked_seconds, 3),
+            "items_per_second": round(self.items_in / self.busy_seconds, 1) if self.busy_seconds else None,
+        }
+
+
+@dataclass
+class _Stage:
+    name: str
+    handle: Callable[[Any], Iterable[Any]]
+    workers: int = 1
+    batch_size: Optional[int] = None  # 지정 시 handle은 항목 목록을 받음
+
+
+class Pipeline:
+    """bounded 큐로 연결된 스레드 단계 파이프라인"""
+
+    def __init__(self, dedup_index: Optional[DedupIndex] = None,
+                 enrichers: Sequence[Callable[[Batch], None]] = (),
+                 sinks: Sequence[Callable[[Batch], None]] = (),
+                 fetch_workers: int = 4, queue_size: int = 64, batch_size: int = 100):
+        self.dedup_index = dedup_index
+        self.enrichers = list(enrichers)
+        self.sinks = list(sinks)
+        self.queue_size = queue_size
+        self.stages = [
+            _Stage("fetch", self._fetch, workers=fetch_workers),
+            _Stage("parse", self._parse),
+            _Stage("filter", self._filter),
+            _Stage("dedup", self._dedup, batch_size=batch_size),
+            _Stage("enrich", self._enrich, batch_size=batch_size),
+            _Stage("sink", self._sink, batch_size=batch_size),
+        ]
+        self.stats: Dict[str, StageStats] = {"source": StageStats("source")}
+        self.stats.update({stage.name: StageStats(stage.name, stage.workers) for stage in self.stages})
+
+    # --- 단계 구현 ---------------------------------------------------------
+
+    def _fetch(self, source: Source) -> Iterable[Any]:
+        try:
+            for payload in timed_fetch(source):
+                yield source, payload
+        except Exception as e:
+            print(f"   ❌ [{source.name}] 수집 오류: {e}")
+            self.stats["fetch"].record(0, 0, 0.0, 0.0, errors=1)
+
+    def _parse(self, work) -> Iterable[Any]:
+        source, payload = work
+        for item in parse_payload(source, payload, get_metrics().source(source.name)):
+            yield source, item
+
+    def _filter(self, work) -> Iterable[Any]:
+        source, item = work
+        if source.filter is None or source.filter(item):
+            get_metrics().source(source.name).add(items_kept=1)
+            yield work
+
+    def _dedup(self, batch: Batch) -> Iterable[Any]:
+        items = [item for _, item in batch]
+        new_items = deduplicate(items, self.dedup_index) if self.dedup_index is not None else items
+        # 신규 항목 수를 소스별로 기록
+        source_by_id = {item['id']: source.name for source, item in batch}
+        metrics = get_metrics()
+        for name, count in Counter(source_by_id.get(item['id']) for item in new_items).items():
+            if name is not None:
+                metrics.source(name).add(items_new=count)
+        return new_items
+
+    def _enrich(self, items: Batch) -> Iterable[Any]:
+        for enricher in self.enrichers:
+            enricher(items)
+        return items
+
+    def _sink(self, items: Batch) -> Iterable[Any]:
+        for sink in self.sinks:
+            sink(items)
+        return ()
+
+    # --- 실행 --------------------------------------------------------------
+
+    def run(self, sources: Iterable[Source]) -> Dict[str, Any]:
+        queues = [queue.Queue(self.queue_size) for _ in self.stages]
+        threads = []
+        for index, stage in enumerate(self.stages):
+            out_q = queues[index + 1] if index + 1 < len(queues) else None
+            remaining = [stage.workers]
+            lock = threading.Lock()
+            for n in range(stage.workers):
+                thread = threading.Thread(
+                    target=self._worker, args=(stage, queues[index], out_q, remaining, lock),
+                    name=f"pipeline-{stage.name}-{n}", daemon=True
+                )
+                thread.start()
+                threads.append(thread)
+
+        source_stats = self.stats["source"]
+        for source in sources:
+            blocked = self._put(queues[0], source)
+            source_stats.record(1, 1, 0.0, blocked)
+        queues[0].put(_STOP)
+
+        for thread in threads:
+            thread.join()
+        return self.report()
+
+    @staticmethod
+    def _put(out_q: "queue.Queue", value: Any) -> float:
+        start = time.perf_counter()
+        out_q.put(value)
+        return time.perf_counter() - start
+
+    @staticmethod
+    def _take_batch(in_q: "queue.Queue", size: int) -> Batch:
+        """첫 항목은 대기하고, 이후는 이미 도착한 항목만 최대 size개까지 모음"""
+        batch = [in_q.get()]
+        while len(batch) < size and batch[-1] is not _STOP:
+            try:
+                batch.append(in_q.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _worker(self, stage: _Stage, in_q: "queue.Queue", out_q: Optional["queue.Queue"],
+                remaining: List[int], lock: threading.Lock) -> None:
+        stats = self.stats[stage.name]
+        while True:
+            if stage.batch_size:
+                work = self._take_batch(in_q, stage.batch_size)
+                stop = work[-1] is _STOP
+                if stop:
+                    work.pop()
+                count = len(work)
+            else:
+                work = in_q.get()
+                stop = work is _STOP
+                count = 0 if stop else 1
+
+            if count:
+                start = time.perf_counter()
+                blocked = 0.0
+                produced = 0
+                errors = 0
+                try:
+                    for output in stage.handle(work):
+                        if out_q is not None:
+                            blocked += self._put(out_q, output)
+                        produced += 1
+                except Exception as e:
+                    errors = 1
+                    print(f"   ❌ [{stage.name}] 처리 오류: {e}")
+                stats.record(count, produced, time.perf_counter() - start - blocked, blocked, errors)
+
+            if stop:
+                with lock:
+                    remaining[0] -= 1
+                    last = remaining[0] == 0
+                if last:
+                    if out_q is not None:
+                        out_q.put(_STOP)
+                else:
+                    in_q.put(_STOP)  # 같은 단계의 다른 워커에게 전달
+                return
+
+    def report(self) -> Dict[str, Any]:
+        return {name: stats.to_dict() for name, stats in self.stats.items()}
+
+    def print_report(self) -> None:
+        print("\n⏱️  파이프라인 단계별 처리량")
+        for name, stats in self.report().items():
+            rate = f"{stats['items_per_second']}/s" if stats['items_per_second'] else "-"
+            print(f"  - {name:<7} 입력 {stats['items_in']:>6} → 출력 {stats['items_out']:>6}  "
+                  f"처리 {stats['busy_seconds']:>7.3f}s  대기 {stats['blocked_seconds']:>7.3f}s  "
+                  f"{rate}  오류 {stats['errors']}")
+
+
+class JsonArrayWriter:
+    """{"data": [...], "metadata": {...}} JSON을 레코드 단위로 스트리밍 기록 (파이프라인 sink)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.count = 0
+        self._file = open(path, 'w', encoding='utf-8')
+        self._file.write('{\n  "data": [')
+
+    def __call__(self, items: Batch) -> None:
+        for item in items:
+            self._file.write(",\n    " if self.count else "\n    ")
+            self._file.write(json.dumps(item, ensure_ascii=False, default=json_default))
+            self.count += 1
+
+    def close(self, metadata: Dict[str, Any]) -> None:
+        self._file.write("\n  ],\n  \"metadata\": ")
+        self._file.write(json.dumps(metadata, ensure_ascii=False, indent=2, default=json_default).replace("\n", "\n  "))
+        self._file.write("\n}\n")
+        self._file.close()
@@ -0,0 +1,136 @@
+"""
+네이버/다음 뉴스 검색 결과 페이지 파서
+
+검색 결과 페이지 전체(수백 KB)를 파이썬 html.parser로 트리화하는 대신,
+응답 바이트를 그대로 받아 결과 목록(.list_news) 하위 트리만 파싱합니다.
+
+백엔드 (사용 가능한 것 중 우선순위 순):
+- selectolax: lexbor 기반 C 파서, 가장 빠름 (선택 의존성)
+- bs4 + lxml + SoupStrainer: 결과 목록 하위 트리만 트리에 적재
+- bs4 + html.parser + SoupStrainer: lxml이 없는 환경용 폴백
+"""
+
+from typing import Any, Dict, List, Optional
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    HTMLParser = None
+
+try:
+    import lxml  # type: ignore  # noqa: F401
+    BS4_FEATURES = "lxml"
+except ImportError:  # pragma: no cover - optional dependency
+    BS4_FEATURES = "html.parser"
+
+RESULT_LIST_CLASS = "list_news"
+DEFAULT_LIMIT = 10
+
+
+def default_backend() -> str:
+    return "selectolax" if HTMLParser is not None else "bs4"
+
+
+def _is_result_list(class_value: Optional[str]) -> bool:
+    # bs4 버전에 따라 class 전체 문자열 또는 개별 값이 전달되므로 분리해서 비교
+    return class_value is not None and RESULT_LIST_CLASS in class_value.split()
+
+
+def _result_soup(content: bytes, encoding: Optional[str]) -> BeautifulSoup:
+    return BeautifulSoup(
+        content,
+        BS4_FEATURES,
+        parse_only=SoupStrainer(class_=_is_result_list),
+        from_encoding=encoding
+    )
+
+
+def _text(node: Any) -> Optional[str]:
+    # bs4 Tag.text는 속성, selectolax Node.text는 메서드
+    if node is None:
+        return None
+    return node.text() if callable(node.text) else node.text
+
+
+def declared_encoding(content_type: Optional[str]) -> Optional[str]:
+    """Content-Type 헤더의 charset (없으면 None → 파서가 meta 태그로 판단)"""
+    for part in (content_type or "").split(";")[1:]:
+        key, _, value = part.strip().partition("=")
+        if key.lower() == "charset" and value:
+            return value.strip('"\'')
+    return None
+
+
+def parse_naver_results(content: bytes, limit: int = DEFAULT_LIMIT,
+                        encoding: Optional[str] = None, backend: Optional[str] = None) -> List[Dict[str, Optional[str]]]:
+    """네이버 뉴스 검색 결과에서 (title, url, press, summary, published) 추출"""
+    backend = backend or default_backend()
+    results: List[Dict[str, Optional[str]]] = []
+
+    if backend == "selectolax":
+        tree = HTMLParser(content)
+        for item in tree.css(f'.{RESULT_LIST_CLASS} .news_area')[:limit]:
+            title_elem = item.css_first('.news_tit')
+            if title_elem is None:
+                continue
+            results.append({
+                "title": title_elem.attributes.get('title') or '',
+                "url": title_elem.attributes.get('href') or '',
+                "press": _text(item.css_first('.info_group .press')),
+                "summary": _text(item.css_first('.api_txt_lines')),
+                "published": _text(item.css_first('.info_group span'))
+            })
+        return results
+
+    soup = _result_soup(content, encoding)
+    for item in soup.select(f'.{RESULT_LIST_CLASS} .news_area')[:limit]:
+        title_elem = item.select_one('.news_tit')
+        if not title_elem:
+            continue
+        results.append({
+            "title": title_elem.get('title', ''),
+            "url": title_elem.get('href', ''),
+            "press": _text(item.select_one('.info_group .press')),
+            "summary": _text(item.select_one('.api_txt_lines')),
+            "published": _text(item.select_one('.info_group span'))
+        })
+    return results
+
+
+def parse_daum_results(content: bytes, limit: int = DEFAULT_LIMIT,
+                       encoding: Optional[str] = None, backend: Optional[str] = None) -> List[Dict[str, Optional[str]]]:
+    """다음 뉴스 검색 결과에서 (title, url, press, summary) 추출"""
+    backend = backend or default_backend()
+    results: List[Dict[str, Optional[str]]] = []
+
+    if backend == "selectolax":
+        tree = HTMLParser(content)
+        for item in tree.css(f'.{RESULT_LIST_CLASS} .cont_inner')[:limit]:
+            title_link = item.css_first('.tit_main a')
+            if title_link is None:
+                continue
+            results.append({
+                "title": title_link.text().strip(),
+                "url": title_link.attributes.get('href') or '',
+                "press": _text(item.css_first('.txt_info')),
+                "summary": _text(item.css_first('.desc'))
+            })
+        return results
+
+    soup = _result_soup(content, encoding)
+    for item in soup.select(f'.{RESULT_LIST_CLASS} .cont_inner')[:limit]:
+        title_elem = item.select_one('.tit_main')
+        if not title_elem:
+            continue
+        title_link = title_elem.find('a')
+        if not title_link:
+            continue
+        results.append({
+            "title": title_link.text.strip(),
+            "url": title_link.get('href', ''),
+            "press": _text(item.select_one('.txt_info')),
+            "summary": _text(item.select_one('.desc'))
+        })
+    return results
@@ -0,0 +1,183 @@
+"""
+포털 뉴스 검색 확장 (검색어 × 기간 × 페이지)
+
+검색어 하나, 첫 페이지 하나만 요청하면 뉴스량과 무관하게 실행당 수집량이 고정되므로,
+동의어/관련 정책 용어 검색어를 날짜 구간별로 나누고 구간마다 여러 페이지를 요청합니다.
+
+- 쿼리: build_queries(terms, days, window_days) → (검색어, 시작일, 종료일) 목록 (최신 구간 우선)
+- 페이지: 쿼리 하나 안에서는 순서대로 요청하고, 응답 바이트를 그대로 PortalPage로 내놓음
+  (HTML 파싱은 소스의 parse 단계에서 parse_page로 수행해 fetch 시간에 섞이지 않음)
+- 조기 중단: parse 단계가 한 페이지(PAGE_SIZE)보다 적은 결과를 보면 쿼리 진행 상태에 표시하고,
+  fetch는 다음 페이지를 요청하기 직전에 이를 확인 (기다리지 않으므로 파이프라인에서는
+  파싱이 늦으면 한 페이지를 더 요청할 수 있음)
+- 동시성: 쿼리마다 별도 Source가 되어 파이프라인 fetch 워커에서 동시에 실행되며,
+  HostConcurrencyLimiter로 포털 호스트별 동시 요청 수를 제한
+- 병합: 실행 내에서 공유하는 SeenUrls로 URL이 처음 나온 결과만 통과 (파싱 순서대로)
+"""
+
+import threading
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+from collectors.portal_parser import declared_encoding
+from collectors.ratelimit import HostConcurrencyLimiter
+
+NAVER_SEARCH_URL = "https://search.naver.com/search.naver"
+DAUM_SEARCH_URL = "https://search.daum.net/search"
+
+# 국민연금 동의어 + 관련 정책 용어
+DEFAULT_TERMS = (
+    "국민연금 개혁",
+    "국민연금",
+    "연금개혁",
+    "국민연금 보험료율",
+    "소득대체율",
+    "국민연금 기금 고갈",
+    "기초연금",
+    "노후소득보장",
+)
+PAGE_SIZE = 10
+DEFAULT_PAGES = 3
+DEFAULT_DAYS = 1
+DEFAULT_PER_HOST = 2
+
+ResultParser = Callable[..., List[Dict[str, Optional[str]]]]
+
+
+@dataclass(frozen=True)
+class SearchQuery:
+    term: str
+    start: date
+    end: date
+
+    @property
+    def label(self) -> str:
+        if self.start == self.end:
+            return f"{self.term}@{self.start.isoformat()}"
+        return f"{self.term}@{self.start.isoformat()}~{self.end.isoformat()}"
+
+
+def build_queries(terms: Sequence[str], days: int = DEFAULT_DAYS, window_days: int = 1,
+                  today: Optional[date] = None) -> List[SearchQuery]:
+    """최근 days일을 window_days일 구간으로 나눠 검색어마다 쿼리 생성 (최신 구간부터)"""
+    today = today or date.today()
+    window_days = max(1, window_days)
+    windows = []
+    end = today
+    oldest = today - timedelta(days=max(1, days) - 1)
+    while end >= oldest:
+        start = max(oldest, end - timedelta(days=window_days - 1))
+        windows.append((start, end))
+        end = start - timedelta(days=1)
+    return [SearchQuery(term, start, end) for start, end in windows for term in terms]
+
+
+def naver_params(query: SearchQuery, page: int) -> Dict[str, str]:
+    start, end = query.start, query.end
+    return {
+        "where": "news",
+        "query": query.term,
+        "sort": "1",  # 최신순
+        "pd": "3",    # 기간 직접 입력
+        "ds": start.strftime('%Y.%m.%d'),
+        "de": end.strftime('%Y.%m.%d'),
+        "nso": f"so:dd,p:from{start.strftime('%Y%m%d')}to{end.strftime('%Y%m%d')}",
+        "start": str(1 + (page - 1) * PAGE_SIZE),
+    }
+
+
+def daum_params(query: SearchQuery, page: int) -> Dict[str, str]:
+    return {
+        "w": "news",
+        "q": query.term,
+        "DA": "STC",
+        "sort": "recency",  # 최신순
+        "period": "u",      # 기간 직접 입력
+        "sd": query.start.strftime('%Y%m%d') + "000000",
+        "ed": query.end.strftime('%Y%m%d') + "235959",
+        "p": str(page),
+    }
+
+
+class SeenUrls:
+    """실행 내 URL 중복 제거 (스레드 안전)"""
+
+    def __init__(self):
+        self._seen = set()
+        self._lock = threading.Lock()
+
+    def claim(self, url: str) -> bool:
+        """처음 보는 URL이면 기록하고 True"""
+        with self._lock:
+            if url in self._seen:
+                return False
+            self._seen.add(url)
+            return True
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+
+class QueryProgress:
+    """쿼리 하나의 페이지네이션 상태 (parse 단계가 기록, fetch가 확인)"""
+
+    def __init__(self):
+        self._exhausted = threading.Event()
+
+    def mark_exhausted(self) -> None:
+        self._exhausted.set()
+
+    @property
+    def exhausted(self) -> bool:
+        return self._exhausted.is_set()
+
+
+@dataclass
+class PortalPage:
+    """파싱 전 검색 결과 페이지 (fetch 단계의 payload)"""
+    query: SearchQuery
+    page: int
+    content: bytes
+    encoding: Optional[str]
+    progress: QueryProgress
+
+
+def search_pages(transport, url: str, params_for: Callable[[SearchQuery, int], Dict[str, str]],
+                 query: SearchQuery, pages: int, limiter: HostConcurrencyLimiter,
+                 headers: Optional[Dict[str, str]] = None, label: str = "") -> Iterator[PortalPage]:
+    """쿼리 하나의 검색 결과 페이지를 파싱하지 않고 순서대로 반환"""
+    progress = QueryProgress()
+    for page in range(1, pages + 1):
+        with limiter.slot(url):
+            if progress.exhausted:
+                return
+            response = transport.get(url, params=params_for(query, page), headers=headers)
+        if response.status_code != 200:
+            print(f"{label} 접근 실패: {response.status_code} ({query.label}, {page}페이지)")
+            return
+        yield PortalPage(
+            query=query,
+            page=page,
+            content=response.content,
+            encoding=declared_encoding(response.headers.get('Content-Type')),
+            progress=progress
+        )
+
+
+def parse_page(page: PortalPage, parse_results: ResultParser, seen: SeenUrls) -> List[Dict[str, Any]]:
+    """검색 결과 페이지를 파싱해 이미 본 URL을 제외한 결과 반환 (마지막 페이지면 쿼리에 표시)"""
+    results = parse_results(page.content, limit=PAGE_SIZE, encoding=page.encoding)
+    if len(results) < PAGE_SIZE:
+        page.progress.mark_exhausted()
+    return [result for result in results if result['url'] and seen.claim(result['url'])]
+
+
+def add_portal_arguments(parser) -> None:
+    """포털 검색 CLI 옵션"""
+    parser.add_argument("--query", dest="queries", action="append", default=None,
+                        help="포털 검색어 (반복 가능, 기본: 국민연금 동의어/관련 정책 용어)")
+    parser.add_argument("--pages", type=int, default=DEFAULT_PAGES, help="검색어/기간당 최대 페이지 수")
+    parser.add_argument("--days", type=int, default=DEFAULT_DAYS, help="검색 기간 (최근 N일)")
+    parser.add_argument("--window-days", type=int, default=1, help="기간을 나눌 구간 길이 (일)")
+    parser.add_argument("--per-host", type=int, default=DEFAULT_PER_HOST, help="포털 호스트별 동시 요청 수")
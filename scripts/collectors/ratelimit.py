@@ -0,0 +1,94 @@
+"""
+응답 헤더 기반 적응형 요청 간격 조절
+
+Reddit 등은 X-Ratelimit-Remaining(남은 요청 수)과 X-Ratelimit-Reset(창 초기화까지 남은 초)을
+응답마다 알려 줍니다. 고정 sleep 대신 남은 할당량을 초기화 시점까지 균등하게 나눠 쓰도록
+다음 요청 시각을 계산하므로, 여유가 있을 때는 빠르게 백필하고 소진 직전에는 자동으로 감속합니다.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Mapping, Optional
+from urllib.parse import urlsplit
+
+
+class HeaderRateLimiter:
+    """X-Ratelimit-* / Retry-After 헤더로 다음 요청 시각을 정하는 스레드 안전 리미터"""
+
+    def __init__(self, min_interval: float = 0.0, reserve: float = 1.0,
+                 default_interval: float = 2.0, max_wait: float = 600.0):
+        self.min_interval = min_interval
+        self.reserve = reserve                    # 다른 클라이언트용으로 남겨둘 요청 수
+        self.default_interval = default_interval  # 헤더가 없을 때의 보수적 간격
+        self.max_wait = max_wait
+        self.remaining: Optional[float] = None
+        self.reset_in: Optional[float] = None
+        # 요청 사이 간격: update()가 헤더로 계산, 첫 응답 전에는 보수적 기본값
+        self.interval = max(min_interval, default_interval)
+        self._next_allowed = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> float:
+        """다음 요청이 허용될 때까지 대기하고 대기 시간(초) 반환"""
+        with self._lock:
+            now = time.monotonic()
+            delay = max(0.0, self._next_allowed - now)
+            # 동시에 호출한 다른 스레드가 같은 슬롯을 쓰지 않도록 현재 간격만큼 미리 예약
+            self._next_allowed = max(self._next_allowed, now) + self.interval
+        if delay:
+            time.sleep(delay)
+        return delay
+
+    def update(self, headers: Mapping[str, str], status_code: int = 200) -> None:
+        """응답 헤더로 할당량 상태 갱신"""
+        now = time.monotonic()
+        retry_after = _as_float(headers.get('Retry-After'))
+        remaining = _as_float(headers.get('X-Ratelimit-Remaining'))
+        reset_in = _as_float(headers.get('X-Ratelimit-Reset'))
+
+        with self._lock:
+            self.remaining = remaining
+            self.reset_in = reset_in
+            # delay: 다음 요청까지 대기, interval: 그 뒤 요청끼리의 간격 (대기 중인 스레드가 한꺼번에 나가지 않도록)
+            interval = self.default_interval
+            if status_code == 429:
+                delay = retry_after if retry_after is not None else (reset_in or self.default_interval * 10)
+            elif remaining is None or reset_in is None:
+                delay = self.default_interval
+            elif remaining <= self.reserve:
+                delay = reset_in
+            else:
+                # 남은 요청을 초기화 시점까지 균등 분배
+                delay = interval = reset_in / (remaining - self.reserve)
+            self.interval = min(self.max_wait, max(self.min_interval, interval))
+            delay = min(self.max_wait, max(self.min_interval, delay))
+            self._next_allowed = max(self._next_allowed, now + delay)
+
+
+def _as_float(value: Optional[str]) -> Optional[float]:
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+class HostConcurrencyLimiter:
+    """호스트별 동시 요청 수 제한 (여러 fetch 워커가 같은 호스트를 공유할 때)"""
+
+    def __init__(self, per_host: int = 2):
+        self.per_host = max(1, per_host)
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def slot(self, url: str) -> Iterator[None]:
+        host = urlsplit(url).netloc
+        with self._lock:
+            semaphore = self._semaphores.get(host)
+            if semaphore is None:
+                semaphore = self._semaphores[host] = threading.BoundedSemaphore(self.per_host)
+        with semaphore:
+            yield
@@ -0,0 +1,217 @@
+"""
+수집 레코드 타입과 컬럼형 배치
+
+대량 백필에서는 레코드마다 12개 안팎의 키를 가진 dict가 수십만~수백만 개 메모리에 올라갑니다.
+CollectedItem은 __slots__ 데이터클래스로 키 테이블을 레코드마다 두지 않고,
+반복되는 짧은 문자열(source/category/platform/author/author_id)은 sys.intern으로 공유합니다.
+dict와 같은 방식(item['title'], item.get(...), item[...] = ...)으로 접근할 수 있어
+기존 수집/중복 제거/적재 코드가 그대로 동작합니다.
+
+RecordBatch는 필드별 리스트로 보관하는 컬럼형 컨테이너로, 집계(analyze_collected_data)와
+Arrow/Parquet/NumPy 변환에 사용합니다. (pyarrow, numpy는 선택 의존성)
+
+메모리 비교: python scripts/bench/bench_record_memory.py
+"""
+
+import json
+import sys
+from dataclasses import dataclass, fields
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    import numpy as np  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+try:
+    import pyarrow as pa  # type: ignore
+    import pyarrow.parquet as pq  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+    pq = None
+
+# 값 종류가 적고 레코드마다 반복되는 필드
+INTERNED_FIELDS = ("source", "category", "platform", "author", "author_id")
+
+
+def _intern(value: Any) -> Any:
+    return sys.intern(value) if type(value) is str else value
+
+
+@dataclass(slots=True)
+class CollectedItem:
+    """수집 레코드 (고정 필드 외 값은 extra에 보관)"""
+
+    id: str
+    source: str
+    category: Optional[str] = None
+    platform: Optional[str] = None
+    title: str = ""
+    content: str = ""
+    url: Optional[str] = None
+    author: Optional[str] = None
+    author_id: Optional[str] = None
+    published_at: Optional[str] = None
+    published_ts: Optional[int] = None
+    collected_at: Optional[str] = None
+    content_hash: Optional[str] = None
+    extra: Optional[Dict[str, Any]] = None
+
+    def __post_init__(self) -> None:
+        for name in INTERNED_FIELDS:
+            value = getattr(self, name)
+            if type(value) is str:
+                setattr(self, name, sys.intern(value))
+
+    # dict 호환 접근: None인 고정 필드는 '없는 키'로 취급
+    def __getitem__(self, key: str) -> Any:
+        if key in FIELD_NAMES:
+            value = getattr(self, key)
+            if value is None:
+                raise KeyError(key)
+            return value
+        if self.extra is None:
+            raise KeyError(key)
+        return self.extra[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key in FIELD_NAMES:
+            setattr(self, key, _intern(value) if key in INTERNED_FIELDS else value)
+        else:
+            if self.extra is None:
+                self.extra = {}
+            self.extra[key] = value
+
+    def __contains__(self, key: str) -> bool:
+        if key in FIELD_NAMES:
+            return getattr(self, key) is not None
+        return self.extra is not None and key in self.extra
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self) -> List[str]:
+        return [key for key, _ in self.items()]
+
+    def items(self) -> List[Tuple[str, Any]]:
+        pairs = [(name, getattr(self, name)) for name in FIELD_NAMES]
+        pairs = [(name, value) for name, value in pairs if value is not None]
+        if self.extra:
+            pairs.extend(self.extra.items())
+        return pairs
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys())
+
+    def copy(self) -> "CollectedItem":
+        item = CollectedItem(*(getattr(self, name) for name in FIELD_NAMES))
+        item.extra = dict(self.extra) if self.extra else None
+        return item
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(self.items())
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CollectedItem":
+        known = {name: data[name] for name in FIELD_NAMES if name in data}
+        extra = {key: value for key, value in data.items() if key not in FIELD_NAMES}
+        return cls(**known, extra=extra or None)
+
+
+FIELD_NAMES: Tuple[str, ...] = tuple(f.name for f in fields(CollectedItem) if f.name != "extra")
+
+
+def as_record(item: Any) -> CollectedItem:
+    return item if isinstance(item, CollectedItem) else CollectedItem.from_dict(item)
+
+
+def json_default(value: Any) -> Any:
+    """json.dump(..., default=json_default)로 CollectedItem 직렬화"""
+    if isinstance(value, CollectedItem):
+        return value.to_dict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class RecordBatch:
+    """필드별 리스트로 보관하는 컬럼형 레코드 배치"""
+
+    COLUMNS = FIELD_NAMES + ("extra",)
+
+    def __init__(self) -> None:
+        self.columns: Dict[str, List[Any]] = {name: [] for name in self.COLUMNS}
+
+    @classmethod
+    def from_records(cls, items: Iterable[Any]) -> "RecordBatch":
+        batch = cls()
+        batch.extend(items)
+        return batch
+
+    def append(self, item: Any) -> None:
+        record = as_record(item)
+        for name in self.COLUMNS:
+            self.columns[name].append(getattr(record, name))
+
+    def extend(self, items: Iterable[Any]) -> None:
+        for item in items:
+            self.append(item)
+
+    def __len__(self) -> int:
+        return len(self.columns["id"])
+
+    def column(self, name: str) -> List[Any]:
+        return self.columns[name]
+
+    def row(self, index: int) -> CollectedItem:
+        return CollectedItem(*(self.columns[name][index] for name in self.COLUMNS))
+
+    def __iter__(self) -> Iterator[CollectedItem]:
+        for values in zip(*(self.columns[name] for name in self.COLUMNS)):
+            yield CollectedItem(*values)
+
+    def dictionary_encode(self, name: str) -> Tuple[List[int], List[Any]]:
+        """반복 값 컬럼을 (코드 목록, 값 목록)으로 인코딩"""
+        lookup: Dict[Any, int] = {}
+        codes = [lookup.setdefault(value, len(lookup)) for value in self.columns[name]]
+        return codes, list(lookup)
+
+    def to_numpy(self) -> Dict[str, Any]:
+        """NumPy 배열 딕셔너리. 반복 값 컬럼은 '<이름>_codes'/'<이름>_values' 범주형으로 변환,
+        published_ts는 int64 (결측 -1)"""
+        if np is None:
+            raise RuntimeError("NumPy 변환에는 numpy가 필요합니다: pip install numpy")
+        arrays: Dict[str, Any] = {}
+        for name in self.COLUMNS:
+            if name in INTERNED_FIELDS:
+                codes, values = self.dictionary_encode(name)
+                arrays[f"{name}_codes"] = np.asarray(codes, dtype=np.int32)
+                arrays[f"{name}_values"] = np.asarray(values, dtype=object)
+            elif name == "published_ts":
+                arrays[name] = np.asarray([-1 if ts is None else ts for ts in self.columns[name]], dtype=np.int64)
+            else:
+                arrays[name] = np.asarray(self.columns[name], dtype=object)
+        return arrays
+
+    def to_arrow(self):
+        """pyarrow.Table (반복 값 컬럼은 dictionary 타입, extra는 JSON 문자열)"""
+        if pa is None:
+            raise RuntimeError("Arrow 변환에는 pyarrow가 필요합니다: pip install pyarrow")
+        arrays = {}
+        for name in self.COLUMNS:
+            values = self.columns[name]
+            if name in INTERNED_FIELDS:
+                arrays[name] = pa.array(values, type=pa.string()).dictionary_encode()
+            elif name == "published_ts":
+                arrays[name] = pa.array(values, type=pa.int64())
+            elif name == "extra":
+                arrays[name] = pa.array(
+                    [json.dumps(v, ensure_ascii=False) if v else None for v in values], type=pa.string()
+                )
+            else:
+                arrays[name] = pa.array(values, type=pa.string())
+        return pa.table(arrays)
+
+    def to_parquet(self, path: str) -> None:
+        pq.write_table(self.to_arrow(), path)
@@ -0,0 +1,179 @@
+"""
+수집 스크립트 공용 실행기
+
+collect_real_data.py / scrape_real_data.py가 같은 파이프라인 구성으로 소스를 실행합니다.
+
+  sinks: 스트리밍 JSON 파일, 통계(CollectionStats), 일자 파티션, Postgres(선택), Parquet(선택)
+  enrich: 기사 본문(--enrich-articles, 선택) → 임베딩(--embed, 선택)
+
+결과를 메모리에 모으지 않으므로 백필 규모와 무관하게 메모리 사용량이 일정합니다.
+(--parquet는 컬럼형 배치를 메모리에 모은 뒤 기록합니다.)
+
+실행마다 소스별 계측(collectors.metrics)을 <output>.report.json으로 저장하고,
+--profile이면 <output>.prof / .profile.txt / .memory.txt도 함께 저장합니다.
+"""
+
+import os
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+from collectors.article import default_cache_path, enricher_from_args
+from collectors.dedup import DedupIndex
+from collectors.embedding import stage_from_args
+from collectors.metrics import Profiler, reset_metrics, write_report
+from collectors.partition import PartitionedJsonlWriter
+from collectors.pg_sink import sink_from_args
+from collectors.pipeline import JsonArrayWriter, Pipeline, Source
+from collectors.records import RecordBatch
+from collectors.stats import CollectionStats, save_stats
+
+SAMPLE_SIZE = 5
+# 이 단계에서 오류가 나면 일부 항목이 sink에 기록되지 않았을 수 있음
+PERSIST_STAGES = ("parse", "filter", "dedup", "enrich", "sink")
+
+
+def add_pipeline_arguments(parser) -> None:
+    """수집 스크립트 공통 CLI 옵션"""
+    parser.add_argument("--fetch-workers", type=int, default=4, help="동시 fetch 워커 수")
+    parser.add_argument("--queue-size", type=int, default=64, help="단계 간 큐 크기 (backpressure)")
+    parser.add_argument("--batch-size", type=int, default=100, help="dedup/enrich/sink 배치 크기")
+    parser.add_argument("--profile", action="store_true",
+                        help="cProfile/tracemalloc 결과를 출력 파일 옆에 저장")
+
+
+@dataclass
+class CollectionResult:
+    output_file: str
+    stats: CollectionStats
+    pipeline: Dict[str, Any]
+    real_urls: int = 0
+    samples: List[Any] = field(default_factory=list)
+    report_file: Optional[str] = None
+
+    @property
+    def total_count(self) -> int:
+        return self.stats.total_count
+
+
+def run_collection(sources: Iterable[Source], args, output_file: str, dedup_index_path: str,
+                   partition_dir: Optional[str] = None, partition_name: str = "collected",
+                   parquet: bool = False) -> CollectionResult:
+    """소스를 파이프라인으로 실행하고 파일/통계/적재 sink로 스트리밍
+
+    sink가 모두 닫히고(Postgres flush 포함) 처리 오류가 없을 때만 중복 인덱스와 소스별 commit()을
+    확정하므로, 저장되지 않은 항목이 중복으로 걸러지거나 그 뒤로 워터마크가 넘어가지 않습니다.
+    """
+    sources = list(sources)
+    os.makedirs(os.path.dirname(output_file), exist_ok=True)
+    os.makedirs(os.path.dirname(dedup_index_path), exist_ok=True)
+
+    metrics = reset_metrics()
+    profiler = Profiler(os.path.splitext(output_file)[0]) if args.profile else None
+    if profiler:
+        profiler.start()
+
+    stats = CollectionStats()
+    writer = JsonArrayWriter(output_file)
+    result = CollectionResult(output_file=output_file, stats=stats, pipeline={})
+
+    def observe(items) -> None:
+        stats.extend(items)
+        result.real_urls += sum(1 for item in items if (item.get('url') or '').startswith('http'))
+        result.samples.extend(items[:SAMPLE_SIZE - len(result.samples)])
+
+    sinks = [writer, observe]
+    if partition_dir:
+        sinks.append(PartitionedJsonlWriter(partition_dir, name=partition_name).write_many)
+    batch = RecordBatch() if parquet else None
+    if batch is not None:
+        sinks.append(batch.extend)
+    pg_sink = sink_from_args(args)
+    if pg_sink:
+        sinks.append(pg_sink.write_many)
+    article_enricher = enricher_from_args(args, default_cache_path(os.path.dirname(dedup_index_path)))
+    embedding_stage = stage_from_args(args)
+    enrichers = []
+    if article_enricher:
+        enrichers.append(article_enricher)
+    if embedding_stage:
+        enrichers.append(embedding_stage.process)
+
+    dedup_index = DedupIndex(dedup_index_path)
+    try:
+        try:
+            pipeline = Pipeline(
+                dedup_index=dedup_index,
+                enrichers=enrichers,
+                sinks=sinks,
+                fetch_workers=args.fetch_workers,
+                queue_size=args.queue_size,
+                batch_size=args.batch_size
+            )
+            result.pipeline = pipeline.run(sources)
+        finally:
+            if article_enricher:
+                article_enricher.close()
+            if embedding_stage:
+                embedding_stage.close()
+            if pg_sink:
+                pg_sink.close()
+            writer.close({
+                'collected_at': datetime.now().isoformat(),
+                'total_count': stats.total_count,
+                'analysis': stats.summary(),
+                'real_urls': result.real_urls,
+                'pipeline': result.pipeline
+            })
+
+        stage_errors = sum(result.pipeline.get(stage, {}).get("errors", 0) for stage in PERSIST_STAGES)
+        if stage_errors:
+            print(f"⚠️ 처리 오류 {stage_errors}건: 중복 인덱스/워터마크를 확정하지 않습니다 (다음 실행에서 다시 수집)")
+        else:
+            dedup_index.commit()
+            for source in sources:
+                if source.commit:
+                    source.commit()
+    finally:
+        # 확정하지 않은 중복 인덱스 변경은 버려짐
+        dedup_index.close()
+
+    profile_summary = profiler.stop() if profiler else None
+
+    # 병합 가능한 집계 상태 (일자별 통계 합산용: collectors/stats.py merge)
+    save_stats(stats, output_file.replace('.json', '.stats.json'))
+
+    report = metrics.report()
+    report['output_file'] = output_file
+    report['total_count'] = stats.total_count
+    report['pipeline'] = result.pipeline
+    if article_enricher:
+        report['articles'] = {'fetched': article_enricher.fetched, 'cached': article_enricher.cached,
+                              'failed': article_enricher.failed}
+    if embedding_stage:
+        report['embedding'] = {'embedded': embedding_stage.embedded, 'cached': embedding_stage.cached}
+    if profile_summary:
+        report['profile'] = profile_summary
+    result.report_file = output_file.replace('.json', '.report.json')
+    write_report(result.report_file, report)
+
+    pipeline.print_report()
+    metrics.print_summary()
+    print(f"🧾 실행 리포트: {result.report_file}")
+    if profile_summary:
+        print(f"🔬 프로파일: {', '.join(profile_summary['files'].values())} "
+              f"(tracemalloc 최대 {profile_summary['traced_peak_mb']}MB)")
+    if article_enricher:
+        print(f"📰 본문 보강 완료: 수집 {article_enricher.fetched}개, 캐시 {article_enricher.cached}개, "
+              f"실패 {article_enricher.failed}개")
+    if embedding_stage:
+        print(f"🧭 임베딩 완료: 신규 {embedding_stage.embedded}개, 캐시 {embedding_stage.cached}개")
+    if pg_sink:
+        print(f"🐘 Postgres 적재 완료: {pg_sink.rows_written}행 ({pg_sink.flush_count}개 배치)")
+    if partition_dir:
+        print(f"🗂️  파티션 저장: {partition_dir}")
+    if batch is not None:
+        parquet_file = output_file.replace('.json', '.parquet')
+        batch.to_parquet(parquet_file)
+        print(f"📦 Parquet 저장: {parquet_file}")
+    return result
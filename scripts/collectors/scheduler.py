@@ -0,0 +1,234 @@
+"""
+소스별 주기 수집 스케줄러
+
+각 소스는 자체 폴링 주기를 가지며, 새 항목이 나오면 주기를 줄이고 조용하면 늘립니다.
+오류가 연속되면 지수 백오프를 적용하고, 모든 실행 시점에 지터를 더해 요청이 몰리지 않게 합니다.
+소스들은 스레드 풀에서 동시에 실행되며, 실행이 끝날 때마다 상태 파일이 갱신됩니다.
+"""
+
+import heapq
+import json
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+FetchFn = Callable[[], List[Dict[str, Any]]]
+# 수집 결과를 받아 "새" 항목 수를 반환 (중복 제거/저장 담당)
+SinkFn = Callable[["SourceSpec", List[Dict[str, Any]]], int]
+
+
+@dataclass
+class SourceSpec:
+    """스케줄 대상 소스 정의"""
+    name: str
+    fetch: FetchFn
+    interval: float
+    min_interval: float
+    max_interval: float
+    jitter: float = 0.1
+    speedup: float = 0.5    # 새 항목이 있을 때 주기 배율
+    slowdown: float = 1.5   # 새 항목이 없을 때 주기 배율
+    commit: Optional[Callable[[], None]] = None  # sink 저장이 끝난 뒤 호출 (워터마크 확정)
+
+
+@dataclass
+class SourceState:
+    """소스별 실행 상태 (상태 파일로 노출)"""
+    interval: float
+    next_run: float = 0.0
+    running: bool = False
+    runs: int = 0
+    errors: int = 0
+    consecutive_errors: int = 0
+    last_started_at: Optional[str] = None
+    last_finished_at: Optional[str] = None
+    last_duration_sec: Optional[float] = None
+    last_items: int = 0
+    last_new_items: int = 0
+    total_new_items: int = 0
+    last_error: Optional[str] = None
+    history: List[float] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "interval_sec": round(self.interval, 1),
+            "next_run_at": datetime.fromtimestamp(self.next_run).isoformat() if self.next_run else None,
+            "running": self.running,
+            "runs": self.runs,
+            "errors": self.errors,
+            "consecutive_errors": self.consecutive_errors,
+            "last_started_at": self.last_started_at,
+            "last_finished_at": self.last_finished_at,
+            "last_duration_sec": self.last_duration_sec,
+            "last_items": self.last_items,
+            "last_new_items": self.last_new_items,
+            "total_new_items": self.total_new_items,
+            "last_error": self.last_error,
+            "recent_durations_sec": self.history
+        }
+
+
+class CollectorScheduler:
+    """소스별 적응형 주기로 동시 수집을 수행하는 스케줄러"""
+
+    HISTORY_SIZE = 10
+
+    def __init__(self, sources: Sequence[SourceSpec], sink: SinkFn,
+                 max_workers: int = 4, status_path: Optional[str] = None,
+                 status_extras: Optional[Callable[[], Dict[str, Any]]] = None):
+        self.sources = {spec.name: spec for spec in sources}
+        # 상태 파일에 함께 기록할 공용 자원 현황 (예: HTTP 재시도 예산)
+        self.status_extras = status_extras
+        self.sink = sink
+        self.status_path = status_path
+        self.started_at = datetime.now().isoformat()
+        self.states = {spec.name: SourceState(interval=spec.interval) for spec in sources}
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="collector")
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._queue: List[tuple] = []
+        self._stop = threading.Event()
+        self._status_lock = threading.Lock()
+
+    def _jittered(self, spec: SourceSpec, interval: float) -> float:
+        return interval * random.uniform(1 - spec.jitter, 1 + spec.jitter)
+
+    def _schedule(self, name: str, delay: float) -> None:
+        state = self.states[name]
+        state.next_run = time.time() + delay
+        heapq.heappush(self._queue, (state.next_run, name))
+        self._wakeup.notify()
+
+    def _run_source(self, name: str) -> None:
+        spec = self.sources[name]
+        state = self.states[name]
+        started = time.time()
+        state.last_started_at = datetime.now().isoformat()
+        error: Optional[str] = None
+        items: List[Dict[str, Any]] = []
+        new_count = 0
+        try:
+            items = spec.fetch()
+            new_count = self.sink(spec, items)
+            if spec.commit:
+                spec.commit()
+        except Exception as e:
+            error = str(e)
+            print(f"❌ [{name}] 수집 오류: {error}")
+
+        duration = time.time() - started
+        with self._lock:
+            state.running = False
+            state.runs += 1
+            state.last_finished_at = datetime.now().isoformat()
+            state.last_duration_sec = round(duration, 3)
+            state.history = (state.history + [state.last_duration_sec])[-self.HISTORY_SIZE:]
+            state.last_items = len(items)
+            state.last_new_items = new_count
+
+            if error is not None:
+                state.errors += 1
+                state.consecutive_errors += 1
+                state.last_error = error
+                delay = min(spec.max_interval, spec.interval * (2 ** state.consecutive_errors))
+            else:
+                state.consecutive_errors = 0
+                state.total_new_items += new_count
+                factor = spec.speedup if new_count else spec.slowdown
+                state.interval = min(spec.max_interval, max(spec.min_interval, state.interval * factor))
+                delay = state.interval
+
+            if not self._stop.is_set():
+                self._schedule(name, self._jittered(spec, delay))
+        self.write_status()
+
+    def status(self) -> Dict[str, Any]:
+        with self._lock:
+            status = {
+                "started_at": self.started_at,
+                "updated_at": datetime.now().isoformat(),
+                "sources": {name: state.to_dict() for name, state in self.states.items()}
+            }
+        if self.status_extras:
+            status.update(self.status_extras())
+        return status
+
+    def write_status(self) -> None:
+        if not self.status_path:
+            return
+        status = self.status()
+        tmp_path = f"{self.status_path}.tmp"
+        with self._status_lock:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(status, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.status_path)
+
+    def serve_status(self, port: int, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+        """GET /status 로 상태 JSON을 제공하는 HTTP 서버를 백그라운드로 실행"""
+        scheduler = self
+
+        class StatusHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.rstrip('/') not in ('', '/status'):
+                    self.send_error(404)
+                    return
+                body = json.dumps(scheduler.status(), ensure_ascii=False).encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), StatusHandler)
+        threading.Thread(target=server.serve_forever, name="status-http", daemon=True).start()
+        return server
+
+    def run(self, once: bool = False) -> None:
+        """스케줄 루프 실행 (once=True면 모든 소스를 한 번씩만 실행)"""
+        if once:
+            with self._lock:
+                self._stop.set()
+                for state in self.states.values():
+                    state.running = True
+            futures = [self._executor.submit(self._run_source, name) for name in self.sources]
+            for future in futures:
+                future.result()
+            self._executor.shutdown()
+            return
+
+        with self._lock:
+            for name, spec in self.sources.items():
+                # 최초 실행도 지터만큼 분산
+                self._schedule(name, random.uniform(0, spec.jitter * spec.min_interval))
+
+        try:
+            while not self._stop.is_set():
+                with self._lock:
+                    while not self._queue or self._queue[0][0] > time.time():
+                        timeout = self._queue[0][0] - time.time() if self._queue else None
+                        self._wakeup.wait(timeout)
+                        if self._stop.is_set():
+                            return
+                    _, name = heapq.heappop(self._queue)
+                    state = self.states[name]
+                    if state.running:
+                        continue
+                    state.running = True
+                self._executor.submit(self._run_source, name)
+        finally:
+            self.stop()
+
+    def stop(self) -> None:
+        with self._lock:
+            self._stop.set()
+            self._wakeup.notify_all()
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,278 @@
+"""
+수집 데이터 스트리밍 집계
+
+레코드를 한 건씩 소비하며 플랫폼/카테고리 분포, 상위 작성자, 게시 시간 범위를 집계합니다.
+작성자별 게시물 목록을 보관하지 않고 Space-Saving 스케치로 상위 작성자만 추적하므로
+메모리 사용량이 데이터 크기와 무관하게 일정합니다. 집계 상태는 JSON으로 직렬화되고
+merge()로 병합할 수 있어 원본 데이터를 다시 읽지 않고도 일자별 통계를 합칠 수 있습니다.
+
+사용법:
+  python scripts/collectors/stats.py merge data/*.stats.json
+"""
+
+import heapq
+import json
+import os
+import sys
+from collections import Counter
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple
+
+if __package__ in (None, ""):
+    # python scripts/collectors/stats.py 로 직접 실행한 경우
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from collectors.timestamps import to_epoch  # noqa: E402
+
+if TYPE_CHECKING:
+    from collectors.records import RecordBatch
+
+DEFAULT_AUTHOR_CAPACITY = 100
+TOP_AUTHORS = 10
+
+
+def parse_timestamp(value: Any) -> Optional[int]:
+    """게시 시각 값을 UTC epoch 초로 변환 (해석 불가 시 None, collectors/timestamps.py 참고)"""
+    return to_epoch(value)
+
+
+class SpaceSaving:
+    """Space-Saving 상위 K 스케치 (Metwally et al.)
+
+    최대 capacity개 키만 유지하며, 빈도가 capacity 분의 1 이상인 키는 반드시 포함됩니다.
+    각 키의 count는 실제 빈도의 상한이고 error는 과대 추정 폭입니다.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_AUTHOR_CAPACITY):
+        self.capacity = capacity
+        self.counters: Dict[str, List[int]] = {}  # key -> [count, error]
+        self._heap: List[Tuple[int, str]] = []
+
+    def add(self, key: str, weight: int = 1) -> Optional[str]:
+        """키 빈도 증가. 용량 초과로 밀려난 키가 있으면 반환"""
+        if len(self._heap) > 4 * self.capacity:
+            self._compact()
+        counter = self.counters.get(key)
+        if counter is not None:
+            counter[0] += weight
+            heapq.heappush(self._heap, (counter[0], key))
+            return None
+        if len(self.counters) < self.capacity:
+            self.counters[key] = [weight, 0]
+            heapq.heappush(self._heap, (weight, key))
+            return None
+
+        evicted, floor = self._pop_min()
+        del self.counters[evicted]
+        self.counters[key] = [floor + weight, floor]
+        heapq.heappush(self._heap, (floor + weight, key))
+        return evicted
+
+    def _pop_min(self) -> Tuple[str, int]:
+        # 힙에는 갱신 전 값이 남아 있을 수 있으므로 현재 count와 일치하는 항목만 유효
+        while True:
+            count, key = heapq.heappop(self._heap)
+            counter = self.counters.get(key)
+            if counter is not None and counter[0] == count:
+                return key, count
+
+    def _compact(self) -> None:
+        self._heap = [(counter[0], key) for key, counter in self.counters.items()]
+        heapq.heapify(self._heap)
+
+    def min_count(self) -> int:
+        if len(self.counters) < self.capacity or not self.counters:
+            return 0
+        return min(counter[0] for counter in self.counters.values())
+
+    def top(self, k: int) -> List[Tuple[str, int, int]]:
+        """(키, count, error) 상위 k개"""
+        ranked = sorted(self.counters.items(), key=lambda kv: (-kv[1][0], kv[0]))
+        return [(key, count, error) for key, (count, error) in ranked[:k]]
+
+    def merge(self, other: "SpaceSaving") -> None:
+        """다른 스케치와 병합 (Agarwal et al. mergeable summaries)"""
+        floor_self = self.min_count()
+        floor_other = other.min_count()
+        merged: Dict[str, List[int]] = {}
+        for key in set(self.counters) | set(other.counters):
+            count_a, error_a = self.counters.get(key, (floor_self, floor_self))
+            count_b, error_b = other.counters.get(key, (floor_other, floor_other))
+            merged[key] = [count_a + count_b, error_a + error_b]
+        self.capacity = max(self.capacity, other.capacity)
+        kept = sorted(merged.items(), key=lambda kv: (-kv[1][0], kv[0]))[:self.capacity]
+        self.counters = dict(kept)
+        self._compact()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"capacity": self.capacity, "counters": self.counters}
+
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any]) -> "SpaceSaving":
+        sketch = cls(state.get("capacity", DEFAULT_AUTHOR_CAPACITY))
+        sketch.counters = {key: list(counter) for key, counter in state.get("counters", {}).items()}
+        sketch._compact()
+        return sketch
+
+
+class CollectionStats:
+    """레코드 단위로 갱신되는 병합 가능한 수집 통계"""
+
+    def __init__(self, author_capacity: int = DEFAULT_AUTHOR_CAPACITY):
+        self.total_count = 0
+        self.by_platform: Counter = Counter()
+        self.by_category: Counter = Counter()
+        self.authors = SpaceSaving(author_capacity)
+        self.author_ids: Dict[str, Optional[str]] = {}
+        self.earliest: Optional[int] = None
+        self.latest: Optional[int] = None
+        self.unparsed_timestamps = 0
+
+    def add(self, item: Dict[str, Any]) -> None:
+        self.total_count += 1
+        self.by_platform[item.get('platform', 'unknown')] += 1
+        self.by_category[item.get('category', 'unknown')] += 1
+
+        author = item.get('author', 'Unknown')
+        evicted = self.authors.add(author)
+        if evicted is not None:
+            self.author_ids.pop(evicted, None)
+        self.author_ids.setdefault(author, item.get('author_id'))
+
+        ts = item.get('published_ts')
+        published = item.get('published_at')
+        if ts is not None or published:
+            if ts is None:
+                ts = parse_timestamp(published)
+            if ts is None:
+                self.unparsed_timestamps += 1
+            else:
+                self.earliest = ts if self.earliest is None else min(self.earliest, ts)
+                self.latest = ts if self.latest is None else max(self.latest, ts)
+
+    def extend(self, items: Iterable[Dict[str, Any]]) -> "CollectionStats":
+        for item in items:
+            self.add(item)
+        return self
+
+    def add_batch(self, batch: "RecordBatch") -> "CollectionStats":
+        """컬럼형 배치 집계 (레코드 객체를 만들지 않고 컬럼 단위로 처리)"""
+        self.total_count += len(batch)
+        self.by_platform.update(p if p is not None else 'unknown' for p in batch.column('platform'))
+        self.by_category.update(c if c is not None else 'unknown' for c in batch.column('category'))
+
+        for author, author_id in zip(batch.column('author'), batch.column('author_id')):
+            author = author if author is not None else 'Unknown'
+            evicted = self.authors.add(author)
+            if evicted is not None:
+                self.author_ids.pop(evicted, None)
+            self.author_ids.setdefault(author, author_id)
+
+        for ts, published in zip(batch.column('published_ts'), batch.column('published_at')):
+            if ts is None:
+                if not published:
+                    continue
+                ts = parse_timestamp(published)
+                if ts is None:
+                    self.unparsed_timestamps += 1
+                    continue
+            self.earliest = ts if self.earliest is None else min(self.earliest, ts)
+            self.latest = ts if self.latest is None else max(self.latest, ts)
+        return self
+
+    def merge(self, other: "CollectionStats") -> "CollectionStats":
+        self.total_count += other.total_count
+        self.by_platform.update(other.by_platform)
+        self.by_category.update(other.by_category)
+        self.authors.merge(other.authors)
+        for author, author_id in other.author_ids.items():
+            self.author_ids.setdefault(author, author_id)
+        self.author_ids = {a: self.author_ids.get(a) for a in self.authors.counters}
+        for ts in (other.earliest, other.latest):
+            if ts is not None:
+                self.earliest = ts if self.earliest is None else min(self.earliest, ts)
+                self.latest = ts if self.latest is None else max(self.latest, ts)
+        self.unparsed_timestamps += other.unparsed_timestamps
+        return self
+
+    def summary(self, top_n: int = TOP_AUTHORS) -> Dict[str, Any]:
+        """collect_real_data.py 분석 결과 형식"""
+        return {
+            "total_count": self.total_count,
+            "by_platform": dict(self.by_platform),
+            "by_category": dict(self.by_category),
+            "time_range": {
+                "earliest": _isoformat(self.earliest),
+                "latest": _isoformat(self.latest)
+            },
+            "top_authors": [
+                {
+                    'name': author,
+                    'id': self.author_ids.get(author),
+                    'post_count': count
+                }
+                for author, count, _ in self.authors.top(top_n)
+            ]
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """병합용 직렬화 상태"""
+        return {
+            "total_count": self.total_count,
+            "by_platform": dict(self.by_platform),
+            "by_category": dict(self.by_category),
+            "authors": self.authors.to_dict(),
+            "author_ids": self.author_ids,
+            "earliest": self.earliest,
+            "latest": self.latest,
+            "unparsed_timestamps": self.unparsed_timestamps
+        }
+
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any]) -> "CollectionStats":
+        stats = cls()
+        stats.total_count = state.get("total_count", 0)
+        stats.by_platform = Counter(state.get("by_platform", {}))
+        stats.by_category = Counter(state.get("by_category", {}))
+        stats.authors = SpaceSaving.from_dict(state.get("authors", {}))
+        stats.author_ids = dict(state.get("author_ids", {}))
+        stats.earliest = state.get("earliest")
+        stats.latest = state.get("latest")
+        stats.unparsed_timestamps = state.get("unparsed_timestamps", 0)
+        return stats
+
+
+def _isoformat(ts: Optional[int]) -> Optional[str]:
+    if ts is None:
+        return None
+    return datetime.fromtimestamp(ts, tz=timezone.utc).isoformat()
+
+
+def save_stats(stats: CollectionStats, path: str) -> None:
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(stats.to_dict(), f, ensure_ascii=False)
+
+
+def load_stats(path: str) -> CollectionStats:
+    with open(path, 'r', encoding='utf-8') as f:
+        return CollectionStats.from_dict(json.load(f))
+
+
+def merge_stats_files(paths: Iterable[str]) -> CollectionStats:
+    combined = CollectionStats()
+    for path in paths:
+        combined.merge(load_stats(path))
+    return combined
+
+
+def main(argv: List[str]) -> int:
+    if len(argv) < 2 or argv[0] != "merge":
+        print("사용법: python scripts/collectors/stats.py merge <stats.json>...")
+        return 2
+    combined = merge_stats_files(argv[1:])
+    print(json.dumps(combined.summary(), ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
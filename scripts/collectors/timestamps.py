@@ -0,0 +1,185 @@
+"""
+게시 시각 정규화 (→ UTC epoch 초)
+
+수집 소스마다 published_at 형식이 다릅니다.
+  - RSS: RFC 822 ("Mon, 15 Jan 2024 09:30:00 +0900")
+  - Reddit/기본값: ISO 8601 ("2024-01-15T09:30:00")
+  - 네이버/다음: 상대 시각 ("3시간 전", "어제") 또는 "2024.01.15."
+
+문자열의 '모양'(숫자를 0으로 치환한 형태)별로 처음 성공한 파서를 캐시하므로,
+같은 형식이 반복되는 배치에서는 후보 파서를 매번 차례로 시도하지 않습니다.
+절대 시각은 결과도 문자열 단위로 캐시합니다 (데몬이 같은 피드를 반복 폴링하면 대부분 적중).
+상대 시각은 항목의 collected_at(없으면 현재 시각)을 기준으로 계산합니다.
+"""
+
+import re
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Optional
+
+MAX_CACHED_SHAPES = 1024
+MAX_CACHED_VALUES = 65536
+
+_DIGITS = str.maketrans("0123456789", "0000000000")
+
+_MONTHS = {}
+for _i, _name in enumerate(["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"], 1):
+    _MONTHS[_name] = _MONTHS[_name.upper()] = _MONTHS[_name.lower()] = _i
+_ZONES = {"GMT": 0, "UT": 0, "UTC": 0, "Z": 0, "KST": 9 * 3600, "EST": -5 * 3600, "EDT": -4 * 3600,
+          "CST": -6 * 3600, "CDT": -5 * 3600, "PST": -8 * 3600, "PDT": -7 * 3600}
+
+_RFC822 = re.compile(
+    r"(?:[A-Za-z]{3},\s*)?(\d{1,2})\s+([A-Za-z]{3})\s+(\d{2,4})\s+"
+    r"(\d{1,2}):(\d{2})(?::(\d{2}))?\s*([+-]\d{4}|[A-Za-z]{1,3})?$"
+)
+_RELATIVE = re.compile(r"(\d+)\s*(초|분|시간|일|주|개월|달|년)\s*전$")
+_RELATIVE_UNITS = {"초": 1, "분": 60, "시간": 3600, "일": 86400, "주": 7 * 86400,
+                   "개월": 30 * 86400, "달": 30 * 86400, "년": 365 * 86400}
+_RELATIVE_WORDS = {"방금": 0, "방금 전": 0, "어제": 86400, "그제": 2 * 86400, "그저께": 2 * 86400}
+_DOTTED = re.compile(r"(\d{4})\.\s*(\d{1,2})\.\s*(\d{1,2})\.?(?:\s+(\d{1,2}):(\d{2}))?$")
+
+# 포털의 날짜 표기("2024.01.15.")는 한국 시간
+DEFAULT_OFFSET = 9 * 3600
+
+Parser = Callable[[str, float], Optional[int]]
+
+
+def _epoch(year: int, month: int, day: int, hour: int = 0, minute: int = 0, second: int = 0) -> Optional[int]:
+    """UTC 달력 시각 → epoch 초 (calendar.timegm보다 가벼운 days-from-civil 계산)"""
+    if not (1 <= month <= 12 and 1 <= day <= 31 and hour < 24 and minute < 60 and second < 61):
+        return None
+    y = year - (month <= 2)
+    era = y // 400
+    yoe = y - era * 400
+    doy = (153 * (month + (-3 if month > 2 else 9)) + 2) // 5 + day - 1
+    days = era * 146097 + yoe * 365 + yoe // 4 - yoe // 100 + doy - 719468
+    return days * 86400 + hour * 3600 + minute * 60 + second
+
+
+def _parse_iso(text: str, now: float) -> Optional[int]:
+    try:
+        parsed = datetime.fromisoformat(text.replace("Z", "+00:00") if text.endswith("Z") else text)
+    except ValueError:
+        return None
+    # naive 값은 datetime.now().isoformat()으로 만든 로컬 시각
+    return int(parsed.timestamp())
+
+
+def _parse_rfc822(text: str, now: float) -> Optional[int]:
+    match = _RFC822.match(text)
+    if not match:
+        return _parse_email_date(text)
+    day, month, year, hour, minute, second, zone = match.groups()
+    month_no = _MONTHS.get(month) or _MONTHS.get(month.title())
+    if month_no is None:
+        return None
+    year_no = int(year)
+    if year_no < 100:
+        year_no += 2000 if year_no < 50 else 1900
+    if zone is None:
+        offset = 0
+    elif zone[0] in "+-":
+        offset = (int(zone[1:3]) * 3600 + int(zone[3:5]) * 60) * (1 if zone[0] == "+" else -1)
+    elif zone.upper() in _ZONES:
+        offset = _ZONES[zone.upper()]
+    else:
+        return _parse_email_date(text)
+    ts = _epoch(year_no, month_no, int(day), int(hour), int(minute), int(second or 0))
+    return None if ts is None else ts - offset
+
+
+def _parse_email_date(text: str) -> Optional[int]:
+    try:
+        return int(parsedate_to_datetime(text).timestamp())
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+def _parse_relative(text: str, now: float) -> Optional[int]:
+    if text in _RELATIVE_WORDS:
+        return int(now) - _RELATIVE_WORDS[text]
+    match = _RELATIVE.match(text)
+    if not match:
+        return None
+    return int(now) - int(match.group(1)) * _RELATIVE_UNITS[match.group(2)]
+
+
+def _parse_dotted(text: str, now: float) -> Optional[int]:
+    match = _DOTTED.match(text)
+    if not match:
+        return None
+    year, month, day, hour, minute = match.groups()
+    ts = _epoch(int(year), int(month), int(day), int(hour or 0), int(minute or 0))
+    return None if ts is None else ts - DEFAULT_OFFSET
+
+
+_PARSERS = (_parse_iso, _parse_rfc822, _parse_relative, _parse_dotted)
+_shape_cache: Dict[str, Parser] = {}
+_value_cache: Dict[str, int] = {}
+
+
+def to_epoch(value: Any, now: Optional[float] = None) -> Optional[int]:
+    """게시 시각 값을 UTC epoch 초로 변환 (해석 불가 시 None)"""
+    if value is None or value == "":
+        return None
+    if isinstance(value, (int, float)):
+        return int(value)
+    if isinstance(value, datetime):
+        return int(value.timestamp())
+    text = str(value).strip()
+    cached = _value_cache.get(text)
+    if cached is not None:
+        return cached
+    if now is None:
+        now = time.time()
+
+    shape = text.translate(_DIGITS)
+    parser = _shape_cache.get(shape)
+    if parser is not None:
+        ts = parser(text, now)
+        if ts is not None:
+            return _remember(text, parser, ts)
+
+    for candidate in _PARSERS:
+        if candidate is parser:
+            continue
+        ts = candidate(text, now)
+        if ts is not None:
+            if len(_shape_cache) >= MAX_CACHED_SHAPES:
+                _shape_cache.clear()
+            _shape_cache[shape] = candidate
+            return _remember(text, candidate, ts)
+    return None
+
+
+def _remember(text: str, parser: Parser, ts: int) -> int:
+    # 상대 시각은 기준 시각에 따라 달라지므로 값 캐시 제외
+    if parser is not _parse_relative:
+        if len(_value_cache) >= MAX_CACHED_VALUES:
+            _value_cache.clear()
+        _value_cache[text] = ts
+    return ts
+
+
+def to_iso(ts: int) -> str:
+    """UTC epoch 초 → ISO 8601 (UTC)"""
+    return datetime.fromtimestamp(ts, tz=timezone.utc).isoformat()
+
+
+def normalize_item(item: Dict[str, Any]) -> Dict[str, Any]:
+    """published_ts(UTC epoch)를 채우고 published_at을 UTC ISO 문자열로 통일"""
+    collected = to_epoch(item.get('collected_at'))
+    ts = to_epoch(item.get('published_at'), now=collected)
+    if ts is None:
+        ts = collected
+    if ts is not None:
+        item['published_ts'] = ts
+        item['published_at'] = to_iso(ts)
+    return item
+
+
+def normalize_items(items):
+    for item in items:
+        normalize_item(item)
+    return items
@@ -0,0 +1,261 @@
+"""
+수집 스크립트 공용 HTTP 전송 계층
+
+- keep-alive 연결 풀을 공유하는 requests.Session
+- 지수 백오프 재시도 + 공유 재시도 예산(시간 창마다 다시 채워지는 토큰 버킷)
+- 디스크 HTTP 캐시: record(네트워크 응답 저장) / replay(저장된 응답만 사용, 네트워크 없음)
+
+replay 모드에서는 파서와 전체 파이프라인을 캡처된 응답으로 반복 실행하고 벤치마크할 수 있습니다.
+
+환경 변수:
+  COLLECTOR_HTTP_CACHE_MODE  off | record | replay (기본 off)
+  COLLECTOR_HTTP_CACHE_DIR   캐시 디렉터리 (기본 data/http_cache)
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, Mapping, Optional
+from urllib.parse import urlencode
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.exceptions import MaxRetryError
+from urllib3.util.retry import Retry
+
+from collectors.metrics import get_metrics
+
+CACHE_MODES = ("off", "record", "replay")
+DEFAULT_CACHE_DIR = "/home/nodove/workspace/Capstone/data/http_cache"
+DEFAULT_USER_AGENT = 'PensionSentimentBot/1.0'
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class CacheMiss(requests.RequestException):
+    """replay 모드에서 캐시에 없는 요청"""
+
+
+class RetryBudget:
+    """전송 객체 전체에서 공유하는 재시도 토큰 버킷
+
+    최대 total회까지 재시도할 수 있고, 토큰은 window초마다 total개 비율로 다시 채워집니다.
+    상시 실행(데몬)에서도 재시도 폭주만 막고, 시간이 지나면 재시도가 다시 가능해집니다.
+    """
+
+    def __init__(self, total: int, window: float = 600.0):
+        self.total = total
+        self.window = window
+        self.tokens = float(total)
+        self.used = 0
+        self.rejected = 0
+        self.last_exhausted_at: Optional[str] = None
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        if self.window > 0:
+            self.tokens = min(self.total, self.tokens + (now - self._updated) * self.total / self.window)
+        self._updated = now
+
+    def consume(self) -> bool:
+        with self._lock:
+            self._refill()
+            if self.tokens < 1:
+                self.rejected += 1
+                self.last_exhausted_at = datetime.now().isoformat()
+                return False
+            self.tokens -= 1
+            self.used += 1
+            return True
+
+    def snapshot(self) -> Dict[str, Any]:
+        """상태 파일용 예산 현황"""
+        with self._lock:
+            self._refill()
+            return {
+                "capacity": self.total,
+                "window_sec": self.window,
+                "available": int(self.tokens),
+                "exhausted": self.tokens < 1,
+                "used": self.used,
+                "rejected": self.rejected,
+                "last_exhausted_at": self.last_exhausted_at
+            }
+
+
+class BudgetRetry(Retry):
+    """재시도마다 공유 예산을 차감하고, 예산이 바닥나면 즉시 실패하는 Retry"""
+
+    def __init__(self, *args, budget: Optional[RetryBudget] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.budget = budget
+
+    def new(self, **kw):
+        retry = super().new(**kw)
+        retry.budget = self.budget
+        return retry
+
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        current = get_metrics().current()
+        if current is not None:
+            current.add(retries=1)
+        if self.budget is not None and not self.budget.consume():
+            raise MaxRetryError(_pool, url, error or Exception("retry budget exhausted"))
+        return super().increment(method, url, response, error, _pool, _stacktrace)
+
+
+class ResponseCache:
+    """요청 키(메서드+URL+쿼리) 단위의 디스크 응답 캐시"""
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+
+    @staticmethod
+    def key(method: str, url: str, params: Optional[Mapping[str, Any]] = None) -> str:
+        query = urlencode(sorted((params or {}).items()), doseq=True)
+        return hashlib.sha256(f"{method.upper()} {url}?{query}".encode('utf-8')).hexdigest()
+
+    def _paths(self, key: str):
+        base = os.path.join(self.cache_dir, key[:2], key)
+        return f"{base}.json", f"{base}.body"
+
+    def load(self, key: str) -> Optional[requests.Response]:
+        meta_path, body_path = self._paths(key)
+        if not os.path.exists(meta_path):
+            return None
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        with open(body_path, 'rb') as f:
+            body = f.read()
+        response = requests.Response()
+        response.status_code = meta["status_code"]
+        response.url = meta["url"]
+        response.headers = CaseInsensitiveDict(meta["headers"])
+        response.encoding = meta.get("encoding")
+        response.reason = "cached"
+        response._content = body
+        response._content_consumed = True  # iter_content가 저장된 본문을 나눠 읽도록
+        return response
+
+    def store(self, key: str, response: requests.Response) -> None:
+        meta_path, body_path = self._paths(key)
+        os.makedirs(os.path.dirname(meta_path), exist_ok=True)
+        with open(body_path, 'wb') as f:
+            f.write(response.content)
+        with open(meta_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                "url": response.url,
+                "status_code": response.status_code,
+                "headers": dict(response.headers),
+                "encoding": response.encoding,
+                "recorded_at": datetime.now().isoformat()
+            }, f, ensure_ascii=False, indent=2)
+
+
+class HttpTransport:
+    """연결 풀 + 재시도 예산 + 디스크 캐시를 갖춘 GET 전용 클라이언트"""
+
+    def __init__(self, cache_mode: str = "off", cache_dir: str = DEFAULT_CACHE_DIR,
+                 pool_size: int = 16, retries: int = 3, backoff: float = 0.5,
+                 retry_budget: int = 30, retry_budget_window: float = 600.0, timeout: float = 10,
+                 headers: Optional[Dict[str, str]] = None):
+        if cache_mode not in CACHE_MODES:
+            raise ValueError(f"cache_mode must be one of {CACHE_MODES}: {cache_mode}")
+        self.cache_mode = cache_mode
+        self.cache = ResponseCache(cache_dir) if cache_mode != "off" else None
+        self.timeout = timeout
+        self.budget = RetryBudget(retry_budget, retry_budget_window)
+
+        retry = BudgetRetry(
+            total=retries,
+            backoff_factor=backoff,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=frozenset(["GET", "HEAD"]),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+            budget=self.budget
+        )
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({'User-Agent': DEFAULT_USER_AGENT})
+        if headers:
+            self.session.headers.update(headers)
+
+    def get(self, url: str, params: Optional[Mapping[str, Any]] = None,
+            headers: Optional[Dict[str, str]] = None, timeout: Optional[float] = None,
+            stream: bool = False) -> requests.Response:
+        """GET 요청. stream=True면 본문을 iter_content로 필요한 만큼만 읽음 (record 모드는 저장을 위해 전체 수신)"""
+        key = ResponseCache.key("GET", url, params) if self.cache else None
+        # 현재 스레드의 소스 스코프가 있으면 지연/바이트/오류를 기록 (collectors.metrics)
+        metrics = get_metrics().current()
+        start = time.perf_counter()
+
+        if self.cache_mode == "replay":
+            cached = self.cache.load(key)
+            if cached is None:
+                if metrics is not None:
+                    metrics.record_request(time.perf_counter() - start, 0, error=CacheMiss.__name__)
+                raise CacheMiss(f"replay 캐시에 없는 요청: {url} {dict(params or {})}")
+            if metrics is not None:
+                metrics.record_request(time.perf_counter() - start, 0 if stream else len(cached.content),
+                                       status=cached.status_code, cached=True)
+            return cached
+
+        streaming = stream and self.cache_mode == "off"
+        try:
+            response = self.session.get(
+                url, params=params, headers=headers, timeout=timeout or self.timeout, stream=streaming
+            )
+        except requests.RequestException as e:
+            if metrics is not None:
+                metrics.record_request(time.perf_counter() - start, 0, error=type(e).__name__)
+            raise
+        if self.cache_mode == "record":
+            self.cache.store(key, response)
+        if metrics is not None:
+            # stream=True 호출의 본문 바이트는 읽는 쪽(collectors.feed_parser)에서 기록
+            metrics.record_request(time.perf_counter() - start, 0 if stream else len(response.content),
+                                   status=response.status_code)
+        return response
+
+    def close(self) -> None:
+        self.session.close()
+
+
+_default_transport: Optional[HttpTransport] = None
+_default_lock = threading.Lock()
+
+
+def configure_transport(cache_mode: Optional[str] = None, cache_dir: Optional[str] = None, **kwargs) -> HttpTransport:
+    """기본 전송 객체 (재)설정. 인자가 없으면 환경 변수 값을 사용"""
+    global _default_transport
+    with _default_lock:
+        if _default_transport is not None:
+            _default_transport.close()
+        _default_transport = HttpTransport(
+            cache_mode=cache_mode or os.environ.get("COLLECTOR_HTTP_CACHE_MODE", "off"),
+            cache_dir=cache_dir or os.environ.get("COLLECTOR_HTTP_CACHE_DIR", DEFAULT_CACHE_DIR),
+            **kwargs
+        )
+        return _default_transport
+
+
+def get_transport() -> HttpTransport:
+    """프로세스 공용 전송 객체 (최초 호출 시 환경 변수로 생성)"""
+    if _default_transport is None:
+        return configure_transport()
+    return _default_transport
+
+
+def add_transport_arguments(parser) -> None:
+    """수집 스크립트 공통 CLI 옵션"""
+    parser.add_argument("--http-cache", choices=CACHE_MODES, default=None,
+                        help="HTTP 캐시 모드 (record: 응답 저장, replay: 저장된 응답만 사용)")
+    parser.add_argument("--http-cache-dir", default=None, help="HTTP 캐시 디렉터리")
@@ -0,0 +1,90 @@
+"""
+소스별 수집 워터마크 저장소
+
+각 소스에서 마지막으로 본 최신 항목(id, 게시 시각)을 JSON 파일에 기록합니다.
+다음 실행은 워터마크에 도달하면 페이지네이션을 멈추므로, 최초 백필 이후의 폴링은
+새 항목이 있는 첫 페이지만 요청합니다.
+
+수집 중에는 stage()로 새 워터마크를 보류해 두고, 항목이 sink에 기록된 뒤 commit()으로
+확정합니다. 저장 전에 실패하면 워터마크가 그대로여서 다음 실행이 같은 구간을 다시 수집합니다.
+"""
+
+import json
+import os
+import threading
+from typing import Any, Dict, Iterable, Optional
+
+
+class WatermarkStore:
+    """{소스 키: {"id": ..., "ts": ...}} 형태의 스레드 안전 JSON 저장소"""
+
+    def __init__(self, path: Optional[str]):
+        self.path = path
+        self._lock = threading.Lock()
+        self._marks: Dict[str, Dict[str, Any]] = {}
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        if path and os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                self._marks = json.load(f)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            mark = self._marks.get(key)
+            return dict(mark) if mark else None
+
+    def advance(self, key: str, item_id: str, ts: float) -> None:
+        """더 최신 항목일 때만 워터마크를 앞으로 이동하고 저장"""
+        with self._lock:
+            current = self._marks.get(key)
+            if current and current.get("ts", 0) >= ts:
+                return
+            self._marks[key] = {"id": item_id, "ts": ts}
+            self._save()
+
+    def stage(self, key: str, item_id: str, ts: float) -> None:
+        """commit() 전까지 보류할 워터마크 (같은 키는 더 최신 항목만 유지)"""
+        with self._lock:
+            pending = self._pending.get(key)
+            if pending is None or pending["ts"] < ts:
+                self._pending[key] = {"id": item_id, "ts": ts}
+
+    def discard(self, key: str) -> None:
+        with self._lock:
+            self._pending.pop(key, None)
+
+    def commit(self, keys: Optional[Iterable[str]] = None) -> int:
+        """보류 중인 워터마크를 확정하고 저장 (keys가 없으면 전부). 앞으로 이동한 키 수 반환"""
+        with self._lock:
+            selected = list(self._pending) if keys is None else [key for key in keys if key in self._pending]
+            advanced = 0
+            for key in selected:
+                mark = self._pending.pop(key)
+                current = self._marks.get(key)
+                if current and current.get("ts", 0) >= mark["ts"]:
+                    continue
+                self._marks[key] = mark
+                advanced += 1
+            if advanced:
+                self._save()
+            return advanced
+
+    def _save(self) -> None:
+        if not self.path:
+            return
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._marks, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+
+
+_shared_stores: Dict[str, WatermarkStore] = {}
+_shared_lock = threading.Lock()
+
+
+def shared_store(path: str) -> WatermarkStore:
+    """경로별 단일 저장소 (같은 파일을 여러 모듈이 각자 열어 서로 덮어쓰지 않도록)"""
+    with _shared_lock:
+        if path not in _shared_stores:
+            _shared_stores[path] = WatermarkStore(path)
+        return _shared_stores[path]
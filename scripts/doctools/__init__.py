@@ -0,0 +1 @@
+"""Shared helpers for the documentation tools (generate_wiki_docs.py and friends)."""
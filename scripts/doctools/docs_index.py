@@ -0,0 +1,83 @@
+"""Sharded document listing for the wiki index page.
+
+Instead of one docs-data.json holding every file, the build writes:
+
+    docs-index.json                      tiny root: count, field names, shard table
+    docs-index/<top-dir>-<n>.<hash>.json  compact rows [path, ext, size, textual]
+
+Rows are grouped by top-level directory (root-level files first) and sorted by path within
+a group; a directory with more than SHARD_ROWS files is split into several shards. Shard
+filenames carry a content hash, so the browser can cache them indefinitely and only
+docs-index.json is revalidated. The index page fetches shards as their rows scroll into
+view (all of them only when filtering).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+from itertools import groupby
+from pathlib import Path
+from typing import List, Sequence
+
+from doctools.incremental import write_if_changed
+from doctools.publish import VARIANT_EXTS
+
+INDEX_NAME = "docs-index.json"
+SHARD_SUBDIR = "docs-index"
+SHARD_ROWS = 1000
+FIELDS = ["path", "ext", "size", "textual"]
+ROOT_GROUP = "_root"
+
+_UNSAFE_RE = re.compile(r"[^A-Za-z0-9._-]+")
+
+
+def _group(path: str) -> str:
+    head, sep, _ = path.partition("/")
+    return head if sep else ROOT_GROUP
+
+
+def _dump(data) -> str:
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+def write_docs_index(site_dir: Path, files: Sequence[dict], shard_rows: int = SHARD_ROWS) -> dict:
+    """Write the root index and its shards for build_docs_payload() entries; returns stats."""
+    shard_dir = site_dir / SHARD_SUBDIR
+    shard_dir.mkdir(parents=True, exist_ok=True)
+    # Root-level files first, then each top-level directory; by path within a group
+    rows = sorted(([item["path"], item["ext"], item["size"], 1 if item["textual"] else 0] for item in files),
+                  key=lambda row: (_group(row[0]) != ROOT_GROUP, _group(row[0]), row[0]))
+
+    shards: List[dict] = []
+    written = set()
+    shard_bytes = 0
+    for group, members in groupby(rows, key=lambda row: _group(row[0])):
+        members = list(members)
+        safe = _UNSAFE_RE.sub("_", group)
+        for part, start in enumerate(range(0, len(members), shard_rows)):
+            chunk = members[start:start + shard_rows]
+            payload = _dump(chunk)
+            digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()[:12]
+            name = f"{safe}-{part}.{digest}.json"
+            write_if_changed(shard_dir / name, payload)
+            written.add(name)
+            shard_bytes += len(payload.encode("utf-8"))
+            shards.append({"group": group, "file": f"{SHARD_SUBDIR}/{name}", "count": len(chunk)})
+
+    # Precompressed siblings belong to publish(), which drops them once their source is gone
+    for stale in shard_dir.iterdir():
+        if stale.is_file() and stale.name not in written and not stale.name.endswith(VARIANT_EXTS):
+            stale.unlink()
+
+    # No build timestamp: an unchanged listing keeps its bytes and mtime, so publish() reuses its variants
+    root = {
+        "count": len(rows),
+        "fields": FIELDS,
+        "shards": shards,
+    }
+    root_payload = _dump(root)
+    write_if_changed(site_dir / INDEX_NAME, root_payload)
+    return {"rows": len(rows), "shards": len(shards), "index_bytes": len(root_payload.encode("utf-8")),
+            "shard_bytes": shard_bytes}
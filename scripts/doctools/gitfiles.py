@@ -0,0 +1,150 @@
+"""File enumeration from the git index, with a changed-since mode.
+
+list_files() asks git for the file list in one subprocess call instead of walking the
+tree, so .gitignore'd trees (node_modules, virtualenvs, build output) are never touched:
+
+    git ls-files -z --cached --others --exclude-standard
+
+That is every tracked file plus untracked files that are not ignored, so a new document
+shows up before it is committed. changed_since() narrows the work to what differs from a
+revision (committed, staged and unstaged changes, plus new untracked files):
+
+    git diff --name-status -z --no-renames --relative <rev>
+
+Both return root-relative POSIX paths. Files inside submodules are not listed (use the "walk"
+backend for those). When root is not inside a git work tree (or git is missing) the "auto"
+backend falls back to doctools.scan.walk_files.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Collection, Iterable, List, Optional, Set
+
+from doctools.scan import walk_files
+
+BACKENDS = ("auto", "git", "walk")
+
+
+class GitUnavailable(RuntimeError):
+    """root is not in a git work tree, git is not installed, or the revision is unknown."""
+
+
+def _git(root: Path, *args: str) -> bytes:
+    try:
+        proc = subprocess.run(["git", "-C", str(root), *args], stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=False)
+    except OSError as exc:
+        raise GitUnavailable(str(exc)) from exc
+    if proc.returncode != 0:
+        raise GitUnavailable(proc.stderr.decode("utf-8", "replace").strip() or f"git {args[0]} failed")
+    return proc.stdout
+
+
+def _split(output: bytes) -> List[str]:
+    return [os.fsdecode(item) for item in output.split(b"\0") if item]
+
+
+def _excluded(rel: str, excluded_names: Collection[str]) -> bool:
+    return bool(excluded_names) and any(part in excluded_names for part in rel.split("/")[:-1])
+
+
+def _skip_prefixes(root: Path, skip: Iterable[Path]) -> tuple:
+    root_abs = os.path.abspath(root)
+    prefixes = []
+    for path in skip:
+        rel = os.path.relpath(os.path.abspath(path), root_abs)
+        if not rel.startswith(".."):
+            prefixes.append(Path(rel).as_posix().rstrip("/") + "/")
+    return tuple(prefixes)
+
+
+def git_ls_files(root: Path) -> List[str]:
+    """Tracked + untracked-but-not-ignored files under root, minus files deleted from the work tree.
+
+    -t tags every entry with its status, so deleted files ("R") are dropped without a
+    stat per path and the whole listing stays one subprocess call.
+    """
+    output = _git(root, "ls-files", "-z", "-t", "--cached", "--deleted", "--others", "--exclude-standard")
+    present: List[str] = []
+    removed: Set[str] = set()
+    for item in _split(output):
+        tag, rel = item[0], item[2:]
+        if tag == "R":
+            removed.add(rel)
+        else:
+            present.append(rel)
+    return list(dict.fromkeys(rel for rel in present if rel not in removed))
+
+
+def list_files(root: Path, excluded_names: Collection[str] = (), skip: Iterable[Path] = (),
+               backend: str = "auto") -> List[str]:
+    """Every candidate file under root as a sorted root-relative POSIX path.
+
+    excluded_names/skip are applied on both backends so the result does not depend on
+    what happens to be committed (e.g. a checked-in build directory).
+    """
+    skip = list(skip)
+    if backend not in BACKENDS:
+        raise ValueError(f"unknown backend {backend!r} (expected one of {', '.join(BACKENDS)})")
+    if backend != "walk":
+        try:
+            files = git_ls_files(root)
+        except GitUnavailable:
+            if backend == "git":
+                raise
+        else:
+            prefixes = _skip_prefixes(root, skip)
+            return sorted(rel for rel in files
+                          if not _excluded(rel, excluded_names) and not (prefixes and rel.startswith(prefixes)))
+    return sorted(walk_files(root, excluded_names, skip=skip))
+
+
+@dataclass
+class ChangeSet:
+    """Paths that differ from a revision, relative to root."""
+
+    since: str
+    changed: Set[str] = field(default_factory=set)
+    deleted: Set[str] = field(default_factory=set)
+
+    def __contains__(self, rel: str) -> bool:
+        return rel in self.changed
+
+    def __len__(self) -> int:
+        return len(self.changed)
+
+
+def changed_since(root: Path, since: str) -> ChangeSet:
+    """Files added/modified (changed) or removed (deleted) since the given revision.
+
+    Compares the work tree against <since>, so uncommitted edits count, and adds new
+    untracked files that are not ignored. Raises GitUnavailable for an unknown revision.
+    """
+    changes = ChangeSet(since)
+    fields = _split(_git(root, "diff", "--name-status", "-z", "--no-renames", "--relative", since, "--"))
+    for status, rel in zip(fields[0::2], fields[1::2]):
+        (changes.deleted if status == "D" else changes.changed).add(rel)
+    changes.changed.update(_split(_git(root, "ls-files", "-z", "--others", "--exclude-standard")))
+    changes.changed = {rel for rel in changes.changed if os.path.isfile(os.path.join(root, rel))}
+    return changes
+
+
+def add_enumeration_arguments(parser) -> None:
+    """--since / --file-backend options shared by the doc tools."""
+    parser.add_argument("--since", metavar="REV", default=None,
+                        help="Only process files changed since this git revision (e.g. origin/main, HEAD~1)")
+    parser.add_argument("--file-backend", choices=BACKENDS, default="auto",
+                        help="How to enumerate files: git index (honours .gitignore), filesystem walk, or auto (git if available)")
+
+
+def resolve_changes(root: Path, since: Optional[str]) -> Optional[ChangeSet]:
+    """changed_since() for CLI use: None without --since; exits with a message on git errors."""
+    if not since:
+        return None
+    try:
+        return changed_since(root, since)
+    except GitUnavailable as exc:
+        raise SystemExit(f"--since {since}: {exc}") from None
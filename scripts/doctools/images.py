@@ -0,0 +1,306 @@
+"""Image optimization stage for the wiki bundle.
+
+For every PNG/JPEG placed under raw/ the stage produces, from the source image:
+
+- PNG: a losslessly recompressed PNG (optimize=True, same pixels), used in place of the
+  copied file when it is smaller,
+- <file>.webp: lossless WebP for PNGs (diagrams stay pixel-exact), quality WEBP_QUALITY for
+  JPEGs; kept only when smaller than the (optimized) original,
+- <file>.thumb.webp: a preview no larger than THUMB_MAX pixels for images whose longer
+  side exceeds THUMB_TRIGGER (e.g. the 3600x2400 architecture diagrams).
+
+Results are cached per source sha256 under <output>/.cache/images/<sha256>/ (kept across
+full builds), so an image is processed only when it changes; work runs in a process pool.
+<site>/images.json tells the viewer which variants exist. The stage is opt-in
+(generate_wiki_docs.py --optimize-images) and Pillow is optional: when the stage is off or
+Pillow is missing, images are served exactly as copied.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import os
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Mapping, Optional, Tuple
+
+try:
+    from PIL import Image, features  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    Image = None
+    features = None
+
+from doctools.incremental import file_sha256, prune_empty_parents, write_if_changed
+
+IMAGE_EXTS = {".png", ".jpg", ".jpeg"}
+CACHE_SUBDIR = "images"
+IMAGE_MANIFEST_NAME = ".image-manifest.json"
+IMAGES_INDEX_NAME = "images.json"
+WEBP_SUFFIX = ".webp"
+THUMB_SUFFIX = ".thumb.webp"
+THUMB_TRIGGER = 1600
+THUMB_MAX = 1024
+WEBP_QUALITY = 82
+THUMB_QUALITY = 78
+# Bump when the processing below changes so cached results are not reused
+PIPELINE_VERSION = 1
+POOL_THRESHOLD = 2
+
+
+def available() -> bool:
+    return Image is not None
+
+
+def _encode(image, fmt: str, **params) -> bytes:
+    buffer = io.BytesIO()
+    image.save(buffer, fmt, **params)
+    return buffer.getvalue()
+
+
+def _webp_ready(image):
+    if image.mode in ("RGB", "RGBA", "L", "LA"):
+        return image
+    has_alpha = image.mode.endswith("A") or "transparency" in image.info
+    return image.convert("RGBA" if has_alpha else "RGB")
+
+
+def process_image(source: str, cache_dir: str) -> dict:
+    """Write the optimized variants of source into cache_dir; returns the metadata."""
+    out = Path(cache_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    original = os.path.getsize(source)
+    meta = {"version": PIPELINE_VERSION, "original_bytes": original, "outputs": {}}
+    with Image.open(source) as image:
+        image.load()
+        meta["width"], meta["height"] = image.size
+        fmt = image.format
+        best = original
+
+        if fmt == "PNG":
+            params = {"optimize": True}
+            if image.info.get("icc_profile"):
+                params["icc_profile"] = image.info["icc_profile"]
+            packed = _encode(image, "PNG", **params)
+            if len(packed) < original:
+                (out / "optimized.png").write_bytes(packed)
+                meta["outputs"]["optimized"] = len(packed)
+                best = len(packed)
+
+        if features.check("webp") and getattr(image, "n_frames", 1) == 1:
+            ready = _webp_ready(image)
+            if fmt == "PNG":
+                packed = _encode(ready, "WEBP", lossless=True, method=4)
+            else:
+                packed = _encode(ready, "WEBP", quality=WEBP_QUALITY, method=4)
+            if len(packed) < best:
+                (out / "variant.webp").write_bytes(packed)
+                meta["outputs"]["webp"] = len(packed)
+
+            if max(image.size) > THUMB_TRIGGER:
+                thumb = ready.copy()
+                thumb.thumbnail((THUMB_MAX, THUMB_MAX), Image.LANCZOS)
+                packed = _encode(thumb, "WEBP", quality=THUMB_QUALITY, method=4)
+                (out / "thumb.webp").write_bytes(packed)
+                meta["outputs"]["thumb"] = len(packed)
+                meta["thumb_size"] = list(thumb.size)
+
+    (out / "meta.json").write_text(json.dumps(meta), encoding="utf-8")
+    return meta
+
+
+def _process_task(task: Tuple[str, str]) -> Tuple[str, Optional[dict], Optional[str]]:
+    source, cache_dir = task
+    try:
+        return cache_dir, process_image(source, cache_dir), None
+    except Exception as exc:  # corrupt or unsupported image: serve it as copied
+        shutil.rmtree(cache_dir, ignore_errors=True)
+        return cache_dir, None, f"{type(exc).__name__}: {exc}"
+
+
+def _load_cached(cache_dir: Path) -> Optional[dict]:
+    try:
+        meta = json.loads((cache_dir / "meta.json").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return meta if meta.get("version") == PIPELINE_VERSION else None
+
+
+def _replace(src: Path, dest: Path) -> None:
+    # Write through a temp file so a hardlinked raw/ copy never modifies the repository file
+    tmp = dest.with_name(f".{dest.name}.tmp")
+    shutil.copyfile(src, tmp)
+    os.replace(tmp, dest)
+
+
+@dataclass
+class ImageReport:
+    images: int = 0
+    processed: int = 0
+    from_cache: int = 0
+    unchanged: int = 0
+    failed: int = 0
+    bytes_original: int = 0
+    bytes_optimized: int = 0
+    bytes_webp: int = 0
+    thumbnails: int = 0
+    seconds: float = 0.0
+    skipped_reason: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        if self.skipped_reason:
+            return {"skipped": self.skipped_reason}
+        return {
+            "images": self.images,
+            "processed": self.processed,
+            "from_cache": self.from_cache,
+            "unchanged": self.unchanged,
+            "failed": self.failed,
+            "bytes_original": self.bytes_original,
+            "bytes_optimized": self.bytes_optimized,
+            "saved_bytes": self.bytes_original - self.bytes_optimized,
+            "bytes_webp": self.bytes_webp,
+            "thumbnails": self.thumbnails,
+            "seconds": round(self.seconds, 4),
+        }
+
+
+def _load_manifest(path: Path) -> Dict[str, dict]:
+    try:
+        return json.loads(path.read_text(encoding="utf-8")).get("files", {})
+    except (OSError, ValueError, AttributeError):
+        return {}
+
+
+def _installed(output_dir: Path, dest_rel: str, meta: dict) -> bool:
+    outputs = meta["outputs"]
+    try:
+        if (output_dir / dest_rel).stat().st_size != outputs.get("optimized", meta["original_bytes"]):
+            return False
+    except OSError:
+        return False
+    return all((output_dir / f"{dest_rel}{suffix}").exists()
+               for key, suffix in (("webp", WEBP_SUFFIX), ("thumb", THUMB_SUFFIX)) if key in outputs)
+
+
+def _remove_variants(output_dir: Path, dest_rel: str) -> None:
+    for suffix in (WEBP_SUFFIX, THUMB_SUFFIX):
+        (output_dir / f"{dest_rel}{suffix}").unlink(missing_ok=True)
+    # sync() could not prune the directory of a removed image while its variants were there
+    prune_empty_parents((output_dir / dest_rel).parent, output_dir)
+
+
+def clear_image_variants(output_dir: Path, site_dir: Path) -> None:
+    """Drop variants of an earlier build (the raw/ files themselves are managed by sync)."""
+    for dest_rel in _load_manifest(output_dir / IMAGE_MANIFEST_NAME):
+        _remove_variants(output_dir, dest_rel)
+    (output_dir / IMAGE_MANIFEST_NAME).unlink(missing_ok=True)
+    (site_dir / IMAGES_INDEX_NAME).unlink(missing_ok=True)
+
+
+def optimize_images(wanted: Mapping[str, Path], output_dir: Path, site_dir: Path, cache_root: Path,
+                    known_hashes: Optional[Mapping[str, str]] = None, jobs: Optional[int] = None) -> ImageReport:
+    """Optimize the images among wanted (output-relative raw path -> source file)."""
+    started = time.perf_counter()
+    report = ImageReport()
+    if not available():
+        clear_image_variants(output_dir, site_dir)
+        report.skipped_reason = "Pillow not installed"
+        return report
+
+    cache_dir = cache_root / CACHE_SUBDIR
+    manifest_path = output_dir / IMAGE_MANIFEST_NAME
+    previous = _load_manifest(manifest_path)
+    known_hashes = known_hashes or {}
+
+    digests: Dict[str, str] = {}
+    for dest_rel, source in wanted.items():
+        if source.suffix.lower() in IMAGE_EXTS:
+            digests[dest_rel] = known_hashes.get(dest_rel) or file_sha256(source)
+    report.images = len(digests)
+
+    metas: Dict[str, dict] = {}
+    pending: Dict[str, str] = {}
+    for dest_rel, digest in digests.items():
+        if digest in metas or digest in pending.values():
+            continue
+        meta = _load_cached(cache_dir / digest)
+        if meta is not None:
+            metas[digest] = meta
+        else:
+            pending[str(wanted[dest_rel])] = digest
+
+    if pending:
+        tasks = [(source, str(cache_dir / digest)) for source, digest in pending.items()]
+        workers = max(1, min(jobs or os.cpu_count() or 1, len(tasks)))
+        if workers == 1 or len(tasks) < POOL_THRESHOLD:
+            results = list(map(_process_task, tasks))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(_process_task, tasks))
+        for done_dir, meta, error in results:
+            digest = Path(done_dir).name
+            if meta is None:
+                print(f"Image optimization failed for {digest[:12]}: {error}")
+                report.failed += 1
+                continue
+            metas[digest] = meta
+            report.processed += 1
+
+    current: Dict[str, dict] = {}
+    index: Dict[str, dict] = {}
+    raw_prefix = f"{site_dir.name}/raw/"
+    for dest_rel, digest in digests.items():
+        meta = metas.get(digest)
+        dest = output_dir / dest_rel
+        source = wanted[dest_rel]
+        if meta is None:
+            _remove_variants(output_dir, dest_rel)
+            continue
+        outputs = meta["outputs"]
+        before = previous.get(dest_rel)
+        if before and before.get("sha256") == digest and _installed(output_dir, dest_rel, meta):
+            report.unchanged += 1
+        else:
+            if digest not in pending.values():
+                report.from_cache += 1
+            entry_dir = cache_dir / digest
+            if "optimized" in outputs:
+                _replace(entry_dir / "optimized.png", dest)
+            for key, name, suffix in (("webp", "variant.webp", WEBP_SUFFIX), ("thumb", "thumb.webp", THUMB_SUFFIX)):
+                target = output_dir / f"{dest_rel}{suffix}"
+                if key in outputs:
+                    _replace(entry_dir / name, target)
+                else:
+                    target.unlink(missing_ok=True)
+        current[dest_rel] = {"sha256": digest, "src": source.name}
+        report.bytes_original += meta["original_bytes"]
+        report.bytes_optimized += outputs.get("optimized", meta["original_bytes"])
+        report.bytes_webp += outputs.get("webp", 0)
+        report.thumbnails += 1 if "thumb" in outputs else 0
+        if dest_rel.startswith(raw_prefix):
+            index[dest_rel[len(raw_prefix):]] = {
+                "width": meta["width"],
+                "height": meta["height"],
+                "webp": "webp" in outputs,
+                "thumb": meta.get("thumb_size") if "thumb" in outputs else None,
+            }
+
+    for dest_rel in previous.keys() - current.keys():
+        _remove_variants(output_dir, dest_rel)
+
+    # Keep only cache entries this build uses; everything else is an old version of an image
+    used = set(digests.values())
+    if cache_dir.exists():
+        for entry in cache_dir.iterdir():
+            if entry.is_dir() and entry.name not in used:
+                shutil.rmtree(entry, ignore_errors=True)
+
+    manifest_path.write_text(json.dumps({"files": dict(sorted(current.items()))}, indent=1), encoding="utf-8")
+    write_if_changed(site_dir / IMAGES_INDEX_NAME,
+                     json.dumps(dict(sorted(index.items())), ensure_ascii=False, separators=(",", ":")))
+    report.seconds = time.perf_counter() - started
+    return report
@@ -0,0 +1,211 @@
+"""Incremental file mirroring driven by a build manifest.
+
+The manifest records, for every file placed in the output tree, the source path and its
+(size, mtime_ns, sha256) at the time it was placed. On the next build a file is:
+
+- skipped when size and mtime_ns are unchanged (no read at all),
+- skipped when only the mtime changed but the content hash is the same,
+- otherwise re-placed, by reflink (copy-on-write clone) when the filesystem supports it,
+  by hardlink when requested, or by a regular copy.
+
+Output files that are no longer wanted are deleted, and empty directories are pruned.
+Without a previous manifest the caller should start from an empty output directory.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Collection, Dict, Mapping, Optional
+
+MANIFEST_NAME = ".build-manifest.json"
+MANIFEST_VERSION = 1
+LINK_MODES = ("auto", "reflink", "hardlink", "copy")
+HASH_CHUNK = 1024 * 1024
+
+# FICLONE ioctl (linux/fs.h): share extents with the source file (btrfs, xfs, overlayfs on those)
+_FICLONE = 0x40049409
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(HASH_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _reflink(src: Path, dest: Path) -> bool:
+    if not sys.platform.startswith("linux"):
+        return False
+    import fcntl
+
+    with open(src, "rb") as s, open(dest, "wb") as d:
+        try:
+            fcntl.ioctl(d.fileno(), _FICLONE, s.fileno())
+        except OSError:
+            return False
+    shutil.copystat(src, dest)
+    return True
+
+
+def place_file(src: Path, dest: Path, mode: str = "auto") -> str:
+    """Materialize src at dest atomically; returns the method actually used."""
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    tmp = dest.with_name(f".{dest.name}.tmp")
+    if tmp.exists():
+        tmp.unlink()
+    method = "copy"
+    try:
+        if mode in ("auto", "reflink") and _reflink(src, tmp):
+            method = "reflink"
+        elif mode == "hardlink":
+            try:
+                os.link(src, tmp)
+                method = "hardlink"
+            except OSError:
+                shutil.copy2(src, tmp)
+        else:
+            shutil.copy2(src, tmp)
+        os.replace(tmp, dest)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+    return method
+
+
+@dataclass
+class SyncReport:
+    unchanged: int = 0
+    placed: Dict[str, int] = field(default_factory=dict)
+    removed: int = 0
+    bytes_written: int = 0
+    hashed: int = 0
+    seconds: float = 0.0
+
+    @property
+    def changed(self) -> int:
+        return sum(self.placed.values())
+
+    def to_dict(self) -> dict:
+        return {
+            "unchanged": self.unchanged,
+            "placed": dict(self.placed),
+            "removed": self.removed,
+            "bytes_written": self.bytes_written,
+            "hashed": self.hashed,
+            "seconds": round(self.seconds, 4),
+        }
+
+
+class BuildManifest:
+    """dest-relative path -> {src, size, mtime_ns, sha256} of the previous build."""
+
+    def __init__(self, output_dir: Path, entries: Optional[Dict[str, dict]] = None):
+        self.output_dir = output_dir
+        self.entries: Dict[str, dict] = entries or {}
+
+    @property
+    def path(self) -> Path:
+        return self.output_dir / MANIFEST_NAME
+
+    @classmethod
+    def load(cls, output_dir: Path) -> Optional["BuildManifest"]:
+        path = output_dir / MANIFEST_NAME
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if data.get("version") != MANIFEST_VERSION:
+            return None
+        return cls(output_dir, data.get("files", {}))
+
+    def save(self) -> None:
+        payload = {"version": MANIFEST_VERSION, "files": dict(sorted(self.entries.items()))}
+        tmp = self.path.with_name(f".{MANIFEST_NAME}.tmp")
+        tmp.write_text(json.dumps(payload, ensure_ascii=False, indent=1), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+    def sync(self, wanted: Mapping[str, Path], root: Path, mode: str = "auto",
+             only: Optional[Collection[str]] = None) -> SyncReport:
+        """Make output_dir/<dest> mirror wanted[dest] for every entry; delete the rest.
+
+        only: root-relative source paths known to have changed (e.g. from git diff). Entries
+        for any other source already in the manifest are carried over without a stat.
+        """
+        started = time.perf_counter()
+        report = SyncReport()
+        entries: Dict[str, dict] = {}
+
+        for dest_rel, src in wanted.items():
+            previous = self.entries.get(dest_rel)
+            src_rel = src.relative_to(root).as_posix()
+            if only is not None and src_rel not in only and previous and previous.get("src") == src_rel:
+                entries[dest_rel] = previous
+                report.unchanged += 1
+                continue
+            stat = src.stat()
+            dest = self.output_dir / dest_rel
+            current = {"src": src_rel, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+            if previous and previous.get("src") == src_rel and dest.exists():
+                if previous["size"] == stat.st_size and previous["mtime_ns"] == stat.st_mtime_ns:
+                    entries[dest_rel] = previous
+                    report.unchanged += 1
+                    continue
+                if previous["size"] == stat.st_size:
+                    digest = file_sha256(src)
+                    report.hashed += 1
+                    if digest == previous.get("sha256"):
+                        entries[dest_rel] = {**current, "sha256": digest}
+                        report.unchanged += 1
+                        continue
+                    current["sha256"] = digest
+
+            if "sha256" not in current:
+                current["sha256"] = file_sha256(src)
+                report.hashed += 1
+            method = place_file(src, dest, mode)
+            report.placed[method] = report.placed.get(method, 0) + 1
+            if method == "copy":
+                report.bytes_written += stat.st_size
+            entries[dest_rel] = current
+
+        for dest_rel in self.entries.keys() - entries.keys():
+            target = self.output_dir / dest_rel
+            if target.exists() or target.is_symlink():
+                target.unlink()
+                report.removed += 1
+                prune_empty_parents(target.parent, self.output_dir)
+
+        self.entries = entries
+        report.seconds = time.perf_counter() - started
+        return report
+
+
+def prune_empty_parents(directory: Path, stop: Path) -> None:
+    while directory != stop and stop in directory.parents:
+        try:
+            directory.rmdir()
+        except OSError:
+            return
+        directory = directory.parent
+
+
+def write_if_changed(path: Path, text: str) -> bool:
+    """Write text only when it differs from the current content (keeps mtimes stable)."""
+    data = text.encode("utf-8")
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return True
@@ -0,0 +1,179 @@
+"""Build-time markdown rendering for the wiki viewer.
+
+Each .md/.markdown document is rendered once at build time into
+<site>/rendered/<repo path>.html, so the viewer shows an HTML fragment instead of
+downloading `marked` and parsing the raw file in the browser.
+
+- Rendering runs in a process pool (Python-Markdown is pure Python and CPU bound).
+- Outputs are keyed by the source's sha256 plus the renderer version, recorded in
+  <output>/.render-manifest.json. A document whose key is unchanged is not re-rendered.
+  A document whose content matches another document's previous output (a copy, a rename
+  or a revert), or another document in the same build, is copied instead of rendered.
+- Python-Markdown is optional. Without it the stage is skipped and the viewer falls back
+  to client-side rendering.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Tuple
+
+try:
+    import markdown  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    markdown = None
+
+from doctools.incremental import file_sha256, prune_empty_parents
+
+RENDERED_SUBDIR = "rendered"
+RENDER_MANIFEST_NAME = ".render-manifest.json"
+RENDER_EXTS = {".md", ".markdown"}
+MARKDOWN_EXTENSIONS = ("extra", "sane_lists", "toc")
+# Below this many documents the pool start-up costs more than it saves
+POOL_THRESHOLD = 8
+
+
+def renderer_id() -> Optional[str]:
+    if markdown is None:
+        return None
+    return f"python-markdown-{markdown.__version__}:{','.join(MARKDOWN_EXTENSIONS)}"
+
+
+def render_markdown(text: str) -> str:
+    return markdown.markdown(text, extensions=list(MARKDOWN_EXTENSIONS), output_format="html")
+
+
+def _render_file(task: Tuple[str, str]) -> Tuple[str, str]:
+    rel, source = task
+    with open(source, "r", encoding="utf-8", errors="replace") as handle:
+        return rel, render_markdown(handle.read())
+
+
+@dataclass
+class RenderReport:
+    rendered: int = 0
+    reused: int = 0
+    unchanged: int = 0
+    removed: int = 0
+    jobs: int = 1
+    seconds: float = 0.0
+    skipped_reason: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        if self.skipped_reason:
+            return {"skipped": self.skipped_reason}
+        return {
+            "rendered": self.rendered,
+            "reused": self.reused,
+            "unchanged": self.unchanged,
+            "removed": self.removed,
+            "jobs": self.jobs,
+            "seconds": round(self.seconds, 4),
+        }
+
+
+def _load_manifest(path: Path) -> Dict[str, str]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data.get("files", {}) if isinstance(data, dict) else {}
+
+
+def _write_outputs(rendered_dir: Path, rels: List[str], html: str) -> None:
+    for rel in rels:
+        dest = rendered_dir / f"{rel}.html"
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        tmp = dest.with_name(f".{dest.name}.tmp")
+        tmp.write_text(html, encoding="utf-8")
+        os.replace(tmp, dest)
+
+
+def clear_prerendered(output_dir: Path, site_dir: Path) -> None:
+    """Drop fragments of an earlier build so the viewer does not show stale HTML."""
+    shutil.rmtree(site_dir / RENDERED_SUBDIR, ignore_errors=True)
+    (output_dir / RENDER_MANIFEST_NAME).unlink(missing_ok=True)
+
+
+def prerender_markdown(sources: Mapping[str, Path], output_dir: Path, site_dir: Path,
+                       known_hashes: Optional[Mapping[str, str]] = None, jobs: Optional[int] = None) -> RenderReport:
+    """Render every markdown source (repo-relative path -> file) into site_dir/rendered.
+
+    known_hashes: repo-relative path -> sha256 already computed by the build manifest, so
+    unchanged sources are not read again just to hash them.
+    """
+    started = time.perf_counter()
+    report = RenderReport()
+    version = renderer_id()
+    if version is None:
+        clear_prerendered(output_dir, site_dir)
+        report.skipped_reason = "python-markdown not installed"
+        return report
+
+    manifest_path = output_dir / RENDER_MANIFEST_NAME
+    rendered_dir = site_dir / RENDERED_SUBDIR
+    previous = _load_manifest(manifest_path)
+    by_key = {key: rel for rel, key in previous.items()}
+    known_hashes = known_hashes or {}
+
+    current: Dict[str, str] = {}
+    pending = []
+    # Identical sources in this run are rendered once: key -> the other paths to fill
+    copies: Dict[str, List[str]] = {}
+    first_by_key: Dict[str, str] = {}
+    for rel, source in sources.items():
+        if source.suffix.lower() not in RENDER_EXTS:
+            continue
+        key = f"{known_hashes.get(rel) or file_sha256(source)}:{version}"
+        current[rel] = key
+        dest = rendered_dir / f"{rel}.html"
+        if previous.get(rel) == key and dest.exists():
+            report.unchanged += 1
+            continue
+        donor = by_key.get(key)
+        donor_file = rendered_dir / f"{donor}.html" if donor else None
+        if donor_file is not None and donor_file.exists():
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(donor_file, dest)
+            report.reused += 1
+            continue
+        if key in first_by_key:
+            copies[first_by_key[key]].append(rel)
+            continue
+        first_by_key[key] = rel
+        copies[rel] = []
+        pending.append((rel, str(source)))
+
+    if pending:
+        report.jobs = max(1, min(jobs or os.cpu_count() or 1, len(pending)))
+        if report.jobs == 1 or len(pending) < POOL_THRESHOLD:
+            report.jobs = 1
+            for rel, html in map(_render_file, pending):
+                _write_outputs(rendered_dir, [rel, *copies[rel]], html)
+        else:
+            chunksize = max(1, len(pending) // (report.jobs * 4))
+            with ProcessPoolExecutor(max_workers=report.jobs) as pool:
+                for rel, html in pool.map(_render_file, pending, chunksize=chunksize):
+                    _write_outputs(rendered_dir, [rel, *copies[rel]], html)
+        report.rendered = len(pending)
+        report.reused += sum(len(paths) for paths in copies.values())
+
+    for rel in previous.keys() - current.keys():
+        target = rendered_dir / f"{rel}.html"
+        if target.exists():
+            target.unlink()
+            report.removed += 1
+            prune_empty_parents(target.parent, rendered_dir)
+
+    tmp = manifest_path.with_name(f".{RENDER_MANIFEST_NAME}.tmp")
+    tmp.write_text(json.dumps({"renderer": version, "files": dict(sorted(current.items()))}, ensure_ascii=False, indent=1),
+                   encoding="utf-8")
+    os.replace(tmp, manifest_path)
+    report.seconds = time.perf_counter() - started
+    return report
@@ -0,0 +1,48 @@
+"""Single-pass repository file enumeration for the doc tools.
+
+walk_files() descends with os.scandir and drops excluded directories *before* entering
+them, so vendored trees such as FRONTEND-DASHBOARD/node_modules are never listed. It
+yields repository-relative POSIX paths, which callers classify in one pass instead of
+re-walking the tree once per glob pattern.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Collection, Iterable, Iterator
+
+
+def walk_files(root: Path, excluded_names: Collection[str] = (), skip: Iterable[Path] = (),
+               follow_symlinks: bool = False) -> Iterator[str]:
+    """Yield every file below root as a root-relative POSIX path, pruning as it goes.
+
+    excluded_names: directory names that are never entered (matched at any depth)
+    skip: absolute directories that are never entered (e.g. the build output)
+    """
+    root_path = os.path.abspath(root)
+    skip_paths = {os.path.abspath(path) for path in skip}
+    stack = [(root_path, "")]
+    while stack:
+        directory, prefix = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                subdirs = []
+                for entry in entries:
+                    try:
+                        is_dir = entry.is_dir(follow_symlinks=follow_symlinks)
+                    except OSError:
+                        continue
+                    if is_dir:
+                        if entry.name in excluded_names:
+                            continue
+                        if skip_paths and entry.path in skip_paths:
+                            continue
+                        subdirs.append((entry.path, f"{prefix}{entry.name}/"))
+                    elif entry.is_file():
+                        yield prefix + entry.name
+        except (FileNotFoundError, NotADirectoryError, PermissionError):
+            continue
+        # Depth-first in name order so output order is stable across runs
+        stack.extend(sorted(subdirs, reverse=True))
+
@@ -0,0 +1,358 @@
+"""Static full-text search index for the wiki portal.
+
+The index is built once per wiki build and served as plain JSON next to index.html, so the
+portal can search document bodies without a search server:
+
+    search/meta.json               N, avgdl, shard table, doc table [path, title, length]
+    search/terms-<key>.<hash>.json term -> delta-encoded [doc, tf, doc, tf, ...] postings
+    search/text-<n>.<hash>.json    plain text of TEXT_SHARD_SIZE docs, used for snippets
+
+Tokenization (mirrored exactly by SEARCH_JS):
+- text is lower-cased; runs of [a-z0-9] of length >= 2 become word terms,
+- runs of Hangul syllables become overlapping character bigrams (a one-syllable run is
+  kept as is), which matches Korean text without a morphological analyzer.
+
+Postings are sharded by term prefix: the first character for Latin terms and the initial
+consonant (choseong) of the first syllable for Hangul terms, so a query loads only the
+shards of its own terms. Shard filenames carry a content hash and can be cached forever;
+meta.json is the only file that has to be revalidated.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+from doctools.incremental import file_sha256, write_if_changed
+from doctools.publish import VARIANT_EXTS
+
+INDEX_VERSION = 1
+SEARCH_SUBDIR = "search"
+# Per-file analysis cache inside the build cache directory (kept across builds)
+SEARCH_CACHE_SUBDIR = "search"
+SEARCH_STATE_NAME = "index-state.json"
+TEXT_SHARD_SIZE = 16
+SNIPPET_TEXT_LIMIT = 8000
+MAX_INDEX_BYTES = 2 * 1024 * 1024
+TITLE_WEIGHT = 5
+MAX_TERM_LENGTH = 32
+
+TOKEN_RE = re.compile(r"[a-z0-9]+|[가-힣]+")
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+CHOSEONG_SPAN = 21 * 28
+
+_FENCE_RE = re.compile(r"^\s*(```|~~~).*$", re.MULTILINE)
+_IMAGE_RE = re.compile(r"!\[([^\]]*)\]\([^)]*\)")
+_LINK_RE = re.compile(r"\[([^\]]*)\]\([^)]*\)")
+_TAG_RE = re.compile(r"<[^>\n]+>")
+_MARKUP_RE = re.compile(r"^[ \t]*(?:#{1,6}|>|[-*+]|\d+\.)[ \t]+|[*_`|]+|^[ \t]*[-=:| ]{3,}[ \t]*$", re.MULTILINE)
+_SPACE_RE = re.compile(r"\s+")
+_HEADING_RE = re.compile(r"^#{1,6}[ \t]+(.+?)[ \t#]*$", re.MULTILINE)
+
+
+def tokenize(text: str) -> List[str]:
+    terms: List[str] = []
+    for run in TOKEN_RE.findall(text.lower()):
+        if HANGUL_BASE <= ord(run[0]) <= HANGUL_LAST:
+            if len(run) == 1:
+                terms.append(run)
+            else:
+                terms.extend(run[i:i + 2] for i in range(len(run) - 1))
+        elif len(run) >= 2:
+            terms.append(run[:MAX_TERM_LENGTH])
+    return terms
+
+
+def shard_key(term: str) -> str:
+    first = term[0]
+    code = ord(first)
+    if HANGUL_BASE <= code <= HANGUL_LAST:
+        return f"h{(code - HANGUL_BASE) // CHOSEONG_SPAN}"
+    return first
+
+
+def plain_text(markdown: str) -> str:
+    """Markdown/HTML source -> single-line plain text for snippets."""
+    text = _FENCE_RE.sub(" ", markdown)
+    text = _IMAGE_RE.sub(r"\1", text)
+    text = _LINK_RE.sub(r"\1", text)
+    text = _TAG_RE.sub(" ", text)
+    text = _MARKUP_RE.sub(" ", text)
+    return _SPACE_RE.sub(" ", text).strip()
+
+
+def _hashed_name(prefix: str, payload: str) -> str:
+    digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()[:12]
+    return f"{prefix}.{digest}.json"
+
+
+def _dump(data) -> str:
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+def _analyze(source: Path) -> Optional[dict]:
+    """Heading title, snippet text and body term counts of one file (None when it cannot be indexed)."""
+    try:
+        if source.stat().st_size > MAX_INDEX_BYTES:
+            return None
+        raw = source.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return None
+    text = plain_text(raw)
+    body_terms = tokenize(text)
+    match = _HEADING_RE.search(raw)
+    return {"heading": plain_text(match.group(1))[:200] if match else None, "text": text[:SNIPPET_TEXT_LIMIT],
+            "length": len(body_terms), "terms": Counter(body_terms)}
+
+
+def _read_json(path: Path):
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def _write_json(path: Path, data) -> None:
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_text(_dump(data), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def build_search_index(files: Iterable[Tuple[str, Path]], out_dir: Path, cache_dir: Optional[Path] = None,
+                       known_hashes: Optional[Mapping[str, str]] = None) -> dict:
+    """Index (repo-relative path, source file) pairs into out_dir; returns build stats.
+
+    Files that cannot be decoded as UTF-8 or are larger than MAX_INDEX_BYTES are skipped.
+    Files in out_dir that the new index no longer references are deleted.
+
+    With cache_dir, the analysis of each file is kept as cache_dir/<sha256>.json (known_hashes:
+    repo-relative path -> sha256 from the build manifest), so only changed files are read
+    again, and the index is not rewritten at all when no input changed.
+    """
+    files = list(files)
+    known_hashes = known_hashes or {}
+    digests: Dict[str, str] = {}
+    fingerprint = None
+    if cache_dir is not None:
+        digests = {rel: known_hashes.get(rel) or file_sha256(source) for rel, source in files}
+        fingerprint = hashlib.sha256(f"{INDEX_VERSION}:{_dump(sorted(digests.items()))}".encode("utf-8")).hexdigest()
+        previous = _read_json(cache_dir / SEARCH_STATE_NAME) or {}
+        if previous.get("fingerprint") == fingerprint \
+                and all((out_dir / name).is_file() for name in previous.get("written", ())):
+            return {**previous["stats"], "analyzed": 0, "reused": True}
+        cache_dir.mkdir(parents=True, exist_ok=True)
+
+    docs: List[list] = []
+    texts: List[str] = []
+    # term -> delta-encoded [doc, tf, ...] built as documents are added (doc ids only increase)
+    postings: Dict[str, List[int]] = defaultdict(list)
+    last_doc: Dict[str, int] = {}
+    skipped = 0
+    analyzed = 0
+    total_length = 0
+
+    # Identical files (same sha256) are read once
+    entries: Dict[str, dict] = {}
+    for rel, source in files:
+        entry = entries.get(digests.get(rel))
+        if entry is None and cache_dir is not None:
+            entry_path = cache_dir / f"{digests[rel]}.json"
+            entry = _read_json(entry_path)
+        if entry is None or entry.get("version") != INDEX_VERSION:
+            entry = {"version": INDEX_VERSION, **(_analyze(source) or {"skipped": True})}
+            analyzed += 1
+            if cache_dir is not None:
+                _write_json(entry_path, entry)
+        if rel in digests:
+            entries[digests[rel]] = entry
+        if entry.get("skipped"):
+            skipped += 1
+            continue
+        doc_id = len(docs)
+        title = entry["heading"] if entry["heading"] is not None else rel.rsplit("/", 1)[-1]
+        counts = Counter(entry["terms"])
+        for term in tokenize(f"{rel} {title}"):
+            counts[term] += TITLE_WEIGHT
+        for term, tf in counts.items():
+            postings[term] += (doc_id - last_doc.get(term, 0), tf)
+            last_doc[term] = doc_id
+        docs.append([rel, title, entry["length"]])
+        texts.append(entry["text"])
+        total_length += entry["length"]
+
+    shards: Dict[str, Dict[str, List[int]]] = defaultdict(dict)
+    for term in sorted(postings):
+        shards[shard_key(term)][term] = postings[term]
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    written = set()
+    shard_table: Dict[str, str] = {}
+    index_bytes = 0
+    for key in sorted(shards):
+        payload = _dump(shards[key])
+        name = _hashed_name(f"terms-{key}", payload)
+        write_if_changed(out_dir / name, payload)
+        shard_table[key] = name
+        written.add(name)
+        index_bytes += len(payload.encode("utf-8"))
+
+    text_shards: List[str] = []
+    for start in range(0, len(texts), TEXT_SHARD_SIZE):
+        payload = _dump(texts[start:start + TEXT_SHARD_SIZE])
+        name = _hashed_name(f"text-{start // TEXT_SHARD_SIZE}", payload)
+        write_if_changed(out_dir / name, payload)
+        text_shards.append(name)
+        written.add(name)
+
+    meta = {
+        "version": INDEX_VERSION,
+        "count": len(docs),
+        "avgdl": round(total_length / len(docs), 2) if docs else 0,
+        "title_weight": TITLE_WEIGHT,
+        "text_shard_size": TEXT_SHARD_SIZE,
+        "shards": shard_table,
+        "text_shards": text_shards,
+        "docs": docs,
+    }
+    write_if_changed(out_dir / "meta.json", _dump(meta))
+    written.add("meta.json")
+
+    # Precompressed siblings belong to publish(), which drops them once their source is gone
+    for stale in out_dir.iterdir():
+        if stale.is_file() and stale.name not in written and not stale.name.endswith(VARIANT_EXTS):
+            stale.unlink()
+
+    stats = {
+        "docs": len(docs),
+        "skipped": skipped,
+        "terms": len(postings),
+        "term_shards": len(shard_table),
+        "text_shards": len(text_shards),
+        "index_bytes": index_bytes,
+    }
+    if cache_dir is not None:
+        # Entries of sources that are no longer indexed (older versions of edited files)
+        used = {f"{digest}.json" for digest in digests.values()}
+        for entry_file in cache_dir.glob("*.json"):
+            if entry_file.name not in used and entry_file.name != SEARCH_STATE_NAME:
+                entry_file.unlink()
+        _write_json(cache_dir / SEARCH_STATE_NAME, {"fingerprint": fingerprint, "written": sorted(written),
+                                                    "stats": stats})
+    return {**stats, "analyzed": analyzed, "reused": False}
+
+
+SEARCH_JS = r"""/* Client for the static search index written by scripts/doctools/search_index.py */
+(function () {
+  'use strict';
+  var BASE = 'search/';
+  var HANGUL_FIRST = 0xac00, HANGUL_LAST = 0xd7a3, CHOSEONG_SPAN = 21 * 28;
+  var TOKEN_RE = /[a-z0-9]+|[가-힣]+/g;
+  var K1 = 1.2, B = 0.75;
+  var metaPromise = null, shardCache = {}, textCache = {};
+
+  function tokenize(text) {
+    var terms = [], runs = text.toLowerCase().match(TOKEN_RE) || [];
+    runs.forEach(function (run) {
+      var code = run.charCodeAt(0);
+      if (code >= HANGUL_FIRST && code <= HANGUL_LAST) {
+        if (run.length === 1) { terms.push(run); return; }
+        for (var i = 0; i < run.length - 1; i++) terms.push(run.slice(i, i + 2));
+      } else if (run.length >= 2) {
+        terms.push(run.slice(0, 32));
+      }
+    });
+    return terms;
+  }
+
+  function shardKey(term) {
+    var code = term.charCodeAt(0);
+    if (code >= HANGUL_FIRST && code <= HANGUL_LAST) return 'h' + Math.floor((code - HANGUL_FIRST) / CHOSEONG_SPAN);
+    return term.charAt(0);
+  }
+
+  function fetchJson(name, cache) {
+    return fetch(BASE + name, { cache: cache || 'default' }).then(function (r) {
+      if (!r.ok) throw new Error('검색 색인을 불러올 수 없습니다.');
+      return r.json();
+    });
+  }
+
+  function meta() {
+    if (!metaPromise) metaPromise = fetchJson('meta.json', 'no-cache');
+    return metaPromise;
+  }
+
+  function shard(m, key) {
+    var name = m.shards[key];
+    if (!name) return Promise.resolve({});
+    if (!shardCache[name]) shardCache[name] = fetchJson(name);
+    return shardCache[name];
+  }
+
+  function textShard(m, n) {
+    var name = m.text_shards[n];
+    if (!textCache[name]) textCache[name] = fetchJson(name);
+    return textCache[name];
+  }
+
+  function escapeHtml(s) {
+    return s.replace(/[&<>"]/g, function (ch) { return { '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;' }[ch]; });
+  }
+
+  function snippet(text, query, terms) {
+    // Highlight the whole query if present, else its longest word, else the first term that occurs
+    var lower = text.toLowerCase(), at = -1, len = 0;
+    var needles = [query.toLowerCase()].concat(query.toLowerCase().split(/\s+/).sort(function (a, b) { return b.length - a.length; }), terms);
+    for (var i = 0; at < 0 && i < needles.length; i++) { if (needles[i]) { at = lower.indexOf(needles[i]); len = needles[i].length; } }
+    if (at < 0) return escapeHtml(text.slice(0, 160)) + (text.length > 160 ? '…' : '');
+    var start = Math.max(0, at - 60), end = Math.min(text.length, at + len + 100);
+    return (start > 0 ? '…' : '') + escapeHtml(text.slice(start, at)) + '<mark>' + escapeHtml(text.slice(at, at + len)) +
+      '</mark>' + escapeHtml(text.slice(at + len, end)) + (end < text.length ? '…' : '');
+  }
+
+  /* Resolves to [{path, title, score, snippet}], best match first. */
+  function search(query, limit) {
+    var terms = Array.from(new Set(tokenize(query)));
+    if (!terms.length) return Promise.resolve([]);
+    return meta().then(function (m) {
+      var keys = Array.from(new Set(terms.map(shardKey)));
+      return Promise.all(keys.map(function (k) { return shard(m, k); })).then(function (loaded) {
+        var byKey = {}, scores = {}, hits = {};
+        keys.forEach(function (k, i) { byKey[k] = loaded[i]; });
+        terms.forEach(function (term) {
+          var list = byKey[shardKey(term)][term];
+          if (!list) return;
+          var df = list.length / 2, idf = Math.log(1 + (m.count - df + 0.5) / (df + 0.5)), doc = 0;
+          for (var i = 0; i < list.length; i += 2) {
+            doc += list[i];
+            var tf = list[i + 1], dl = m.docs[doc][2];
+            scores[doc] = (scores[doc] || 0) + idf * tf * (K1 + 1) / (tf + K1 * (1 - B + B * dl / (m.avgdl || 1)));
+            hits[doc] = (hits[doc] || 0) + 1;
+          }
+        });
+        // Documents containing more of the query's terms always rank first
+        var ranked = Object.keys(scores).map(Number).sort(function (a, b) {
+          return (hits[b] - hits[a]) || (scores[b] - scores[a]);
+        }).slice(0, limit || 20);
+        var shardIds = Array.from(new Set(ranked.map(function (d) { return Math.floor(d / m.text_shard_size); })));
+        return Promise.all(shardIds.map(function (n) { return textShard(m, n); })).then(function (texts) {
+          var byShard = {};
+          shardIds.forEach(function (n, i) { byShard[n] = texts[i]; });
+          return ranked.map(function (d) {
+            var text = byShard[Math.floor(d / m.text_shard_size)][d % m.text_shard_size] || '';
+            return { path: m.docs[d][0], title: m.docs[d][1], score: scores[d], snippet: snippet(text, query.trim(), terms) };
+          });
+        });
+      });
+    });
+  }
+
+  window.WikiSearch = { search: search, tokenize: tokenize };
+})();
+"""
@@ -9,13 +9,24 @@ import json
 import os
 import shutil
 import sys
+import time
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, List, Sequence
+from typing import Dict, Iterable, List, Sequence
+
+from doctools.docs_index import write_docs_index
+from doctools.gitfiles import add_enumeration_arguments, list_files, resolve_changes
+from doctools.images import clear_image_variants, optimize_images
+from doctools.incremental import LINK_MODES, BuildManifest, write_if_changed
+from doctools.prerender import clear_prerendered, prerender_markdown
+from doctools.publish import BUILD_CACHE_DIR, clear_published, content_hashed_name, publish
+from doctools.search_index import SEARCH_CACHE_SUBDIR, SEARCH_JS, SEARCH_SUBDIR, build_search_index
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 DEFAULT_OUTPUT = REPO_ROOT / "wiki-docs-build"
 SITE_SUBDIR = "wiki-docs"
 RAW_SUBDIR = "raw"
+BUILD_REPORT_NAME = ".build-report.json"
 
 EXCLUDED_DIR_NAMES = {".git", "node_modules", "__pycache__", "venv", ".venv", "env", ".mypy_cache", ".pytest_cache"}
 DOC_EXTS = {".md", ".markdown", ".mdx", ".txt", ".rst", ".adoc", ".html", ".htm", ".pdf", ".doc", ".docx", ".json", ".yaml", ".yml", ".csv", ".tsv", ".log"}
@@ -23,51 +34,57 @@ ASSET_EXTS = {".png", ".jpg", ".jpeg", ".svg", ".gif", ".bmp", ".webp", ".ico",
 ALLOWED_EXTS = DOC_EXTS | ASSET_EXTS
 TEXTUAL_PREVIEW_EXTS = {".md", ".markdown", ".mdx", ".txt", ".rst", ".adoc", ".json", ".yaml", ".yml", ".csv", ".tsv", ".log"}
 BASE_DOC_DIRS = [REPO_ROOT / "docs", REPO_ROOT / "DOCUMENTS", REPO_ROOT / ".windsurf/workflows"]
-README_GLOBS = ["README.md", "README-*.md", "**/README.md", "**/README-*.md"]
+BASE_DOC_DIR_PREFIXES = tuple(f"{path.relative_to(REPO_ROOT).as_posix()}/" for path in BASE_DOC_DIRS)
 
-INDEX_HTML = "<!DOCTYPE html>\n<html lang=\"en\">\n<head>\n  <meta charset=\"utf-8\" />\n  <meta name=\"viewport\" content=\"width=device-width, initial-scale=1\" />\n  <title>Wiki Docs Index</title>\n  <style>body{margin:0;padding:0 1.5rem 2rem;font-family:system-ui;color:#0f172a;background:#f8fafc;}table{width:100%;border-collapse:collapse;font-size:.94rem;}thead{background:rgba(15,23,42,.08);}th,td{padding:.6rem .5rem;border-bottom:1px solid rgba(15,23,42,.1);}tbody tr:hover{background:rgba(59,130,246,.1);}header{padding:1.5rem 0 1rem;}h1{margin:0 0 .5rem;font-size:clamp(1.6rem,2vw+1rem,2.2rem);}p.lead{margin:0 0 1.4rem;color:#475569;}input[type=search]{width:min(420px,100%);padding:.55rem .75rem;border-radius:8px;border:1px solid rgba(148,163,184,.6);}a{color:#2563eb;text-decoration:none;}a:hover{text-decoration:underline;}td.path{word-break:break-all;font-family:ui-monospace;}footer{margin-top:2rem;font-size:.82rem;color:#64748b;}</style>\n</head>\n<body>\n  <header>\n    <h1>Wiki Documentation Portal</h1>\n    <p class=\"lead\">Repository 문서를 한곳에서 검색하고 열람합니다.</p>\n    <input type=\"search\" id=\"filter\" placeholder=\"문서 경로 검색...\" />\n    <div class=\"stats\" id=\"stats\"></div>\n  </header>\n  <table>\n    <thead><tr><th>문서 경로</th><th>형식</th><th>크기</th></tr></thead>\n    <tbody id=\"docs-body\"></tbody>\n  </table>\n  <footer>docs-data.json 기준으로 최신 문서를 제공합니다.</footer>\n<script>async function loadDocs(){const r=await fetch('docs-data.json',{cache:'no-store'});if(!r.ok)throw new Error('문서 데이터를 불러올 수 없습니다.');return (await r.json()).files||[];}function fmt(b){if(!b)return'0 B';const u=['B','KB','MB','GB'],i=Math.floor(Math.log(b)/Math.log(1024));const v=b/Math.pow(1024,i);return`${v.toFixed(v<10&&i>0?1:0)} ${u[i]}`;}function render(fs){const b=document.getElementById('docs-body');b.innerHTML='';fs.forEach(f=>{const tr=document.createElement('tr');const tdPath=document.createElement('td');tdPath.className='path';const link=document.createElement('a');link.href=`viewer.html?path=${encodeURIComponent(f.path)}`;link.textContent=f.path;tdPath.appendChild(link);tr.appendChild(tdPath);const tdExt=document.createElement('td');tdExt.textContent=f.ext.toUpperCase();tr.appendChild(tdExt);const tdSize=document.createElement('td');tdSize.textContent=fmt(f.size);tr.appendChild(tdSize);b.appendChild(tr);});document.getElementById('stats').textContent=`${fs.length.toLocaleString()}개 문서`; }function setup(fs){const input=document.getElementById('filter');input.addEventListener('input',()=>{const v=input.value.trim().toLowerCase();if(!v)return render(fs);render(fs.filter(f=>f.path.toLowerCase().includes(v)));});}loadDocs().then(fs=>{const sorted=fs.slice().sort((a,b)=>a.path.localeCompare(b.path));render(sorted);setup(sorted);}).catch(err=>{document.getElementById('docs-body').innerHTML=`<tr><td colspan=\"3\">${err.message}</td></tr>`;});</script>\n</body>\n</html>\n"
+INDEX_HTML = "<!DOCTYPE html>\n<html lang=\"en\">\n<head>\n  <meta charset=\"utf-8\" />\n  <meta name=\"viewport\" content=\"width=device-width, initial-scale=1\" />\n  <title>Wiki Docs Index</title>\n  <style>body{margin:0;padding:0 1.5rem 2rem;font-family:system-ui;color:#0f172a;background:#f8fafc;}header{padding:1.5rem 0 1rem;}h1{margin:0 0 .5rem;font-size:clamp(1.6rem,2vw+1rem,2.2rem);}p.lead{margin:0 0 1.4rem;color:#475569;}input[type=search]{width:min(420px,100%);padding:.55rem .75rem;border-radius:8px;border:1px solid rgba(148,163,184,.6);}a{color:#2563eb;text-decoration:none;}a:hover{text-decoration:underline;}footer{margin-top:2rem;font-size:.82rem;color:#64748b;}.search-row{display:flex;flex-wrap:wrap;gap:.6rem;}ol.search-results{margin:0 0 1.5rem;padding:0;list-style:none;}ol.search-results li{padding:.7rem .2rem;border-bottom:1px solid rgba(15,23,42,.1);}ol.search-results .path{margin-left:.4rem;font-family:ui-monospace;font-size:.8rem;color:#64748b;}ol.search-results p{margin:.3rem 0 0;font-size:.88rem;color:#334155;}mark{background:#fde68a;}.grid{display:grid;grid-template-columns:minmax(0,1fr) 6rem 6rem;align-items:center;height:36px;padding:0 .5rem;font-size:.94rem;border-bottom:1px solid rgba(15,23,42,.1);box-sizing:border-box;}.grid.head{background:rgba(15,23,42,.08);font-weight:600;}.grid .path{overflow:hidden;white-space:nowrap;text-overflow:ellipsis;font-family:ui-monospace;}.grid:not(.head):hover{background:rgba(59,130,246,.1);}.grid.loading{color:#94a3b8;}#viewport{height:70vh;overflow-y:auto;position:relative;}#spacer{position:relative;}#rows{position:absolute;top:0;left:0;right:0;will-change:transform;}</style>\n</head>\n<body>\n  <header>\n    <h1>Wiki Documentation Portal</h1>\n    <p class=\"lead\">Repository 문서를 한곳에서 검색하고 열람합니다.</p>\n    <div class=\"search-row\">\n      <input type=\"search\" id=\"filter\" placeholder=\"문서 경로 검색...\" />\n      <input type=\"search\" id=\"content-search\" placeholder=\"본문 검색...\" />\n    </div>\n    <div class=\"stats\" id=\"stats\"></div>\n  </header>\n  <ol class=\"search-results\" id=\"search-results\" hidden></ol>\n  <div class=\"grid head\"><span>문서 경로</span><span>형식</span><span>크기</span></div>\n  <div id=\"viewport\"><div id=\"spacer\"><div id=\"rows\"></div></div></div>\n  <footer>docs-index.json 기준으로 최신 문서를 제공합니다.</footer>\n<script src=\"search.js\"></script>\n<script>const ROW_H=36,OVERSCAN=12;let index=null,offsets=[],shardRows=[],shardLoads=[],lowerPaths=null,view=null,drawPending=false;const viewport=document.getElementById('viewport'),spacer=document.getElementById('spacer'),rowsEl=document.getElementById('rows'),stats=document.getElementById('stats');function esc(s){return String(s).replace(/[&<>\"]/g,ch=>({'&':'&amp;','<':'&lt;','>':'&gt;','\"':'&quot;'}[ch]));}function fmt(b){if(!b)return'0 B';const u=['B','KB','MB','GB'],i=Math.floor(Math.log(b)/Math.log(1024));const v=b/Math.pow(1024,i);return`${v.toFixed(v<10&&i>0?1:0)} ${u[i]}`;}async function loadIndex(){const r=await fetch('docs-index.json',{cache:'no-cache'});if(!r.ok)throw new Error('문서 데이터를 불러올 수 없습니다.');return r.json();}function loadShard(i){if(!shardLoads[i])shardLoads[i]=fetch(index.shards[i].file).then(r=>{if(!r.ok)throw new Error('문서 데이터를 불러올 수 없습니다.');return r.json();}).then(rows=>{shardRows[i]=rows;schedule();return rows;});return shardLoads[i];}function loadAll(){return Promise.all(index.shards.map((_,i)=>loadShard(i)));}function shardOf(g){let lo=0,hi=offsets.length-1;while(lo<hi){const mid=(lo+hi+1)>>1;if(offsets[mid]<=g)lo=mid;else hi=mid-1;}return lo;}function rowAt(g){const s=shardOf(g),rows=shardRows[s];if(!rows){loadShard(s).catch(showError);return null;}return rows[g-offsets[s]];}function schedule(){if(drawPending)return;drawPending=true;requestAnimationFrame(()=>{drawPending=false;draw();});}function draw(){const n=view?view.length:index.count;spacer.style.height=`${n*ROW_H}px`;const first=Math.max(0,Math.floor(viewport.scrollTop/ROW_H)-OVERSCAN),last=Math.min(n,Math.ceil((viewport.scrollTop+viewport.clientHeight)/ROW_H)+OVERSCAN);let html='';for(let k=first;k<last;k++){const row=rowAt(view?view[k]:k);if(!row){html+='<div class=\"grid loading\"><span>불러오는 중…</span></div>';continue;}html+=`<div class=\"grid\"><a class=\"path\" title=\"${esc(row[0])}\" href=\"viewer.html?path=${encodeURIComponent(row[0])}\">${esc(row[0])}</a><span>${esc(row[1].toUpperCase())}</span><span>${fmt(row[2])}</span></div>`;}rowsEl.style.transform=`translateY(${first*ROW_H}px)`;rowsEl.innerHTML=html;stats.textContent=view?`${n.toLocaleString()} / ${index.count.toLocaleString()}개 문서`:`${n.toLocaleString()}개 문서`;}function applyFilter(v){if(!v){view=null;viewport.scrollTop=0;schedule();return;}loadAll().then(()=>{if(!lowerPaths)lowerPaths=shardRows.flat().map(row=>row[0].toLowerCase());const matches=[];for(let g=0;g<lowerPaths.length;g++){if(lowerPaths[g].includes(v))matches.push(g);}view=matches;viewport.scrollTop=0;schedule();}).catch(showError);}function setupFilter(){const input=document.getElementById('filter');let timer=null;input.addEventListener('input',()=>{clearTimeout(timer);timer=setTimeout(()=>applyFilter(input.value.trim().toLowerCase()),80);});}function showError(err){rowsEl.innerHTML=`<div class=\"grid\"><span>${esc(err.message)}</span></div>`;}function setupSearch(){const input=document.getElementById('content-search'),list=document.getElementById('search-results');let timer=null,seq=0;input.addEventListener('input',()=>{clearTimeout(timer);timer=setTimeout(()=>{const q=input.value.trim(),mine=++seq;if(!q){list.hidden=true;list.innerHTML='';return;}const t0=performance.now();WikiSearch.search(q,20).then(rs=>{if(mine!==seq)return;list.hidden=false;list.innerHTML=rs.length?rs.map(r=>`<li><a href=\"viewer.html?path=${encodeURIComponent(r.path)}\">${esc(r.title)}</a><span class=\"path\">${esc(r.path)}</span><p>${r.snippet}</p></li>`).join(''):'<li>검색 결과가 없습니다.</li>';stats.textContent=`본문 검색 ${rs.length}건 (${Math.round(performance.now()-t0)} ms)`;}).catch(err=>{if(mine!==seq)return;list.hidden=false;list.innerHTML=`<li>${esc(err.message)}</li>`;});},120);});}setupSearch();loadIndex().then(idx=>{index=idx;let total=0;offsets=idx.shards.map(s=>{const at=total;total+=s.count;return at;});viewport.addEventListener('scroll',schedule,{passive:true});window.addEventListener('resize',schedule);setupFilter();draw();}).catch(showError);</script>\n</body>\n</html>\n"
 
-VIEWER_HTML = "<!DOCTYPE html>\n<html lang=\"en\">\n<head>\n  <meta charset=\"utf-8\" />\n  <meta name=\"viewport\" content=\"width=device-width, initial-scale=1\" />\n  <title>문서 뷰어</title>\n  <script src=\"https://cdn.jsdelivr.net/npm/marked/marked.min.js\"></script>\n  <style>body{margin:0;background:#e2e8f0;font-family:system-ui;}header{position:sticky;top:0;display:flex;justify-content:space-between;align-items:center;padding:1rem 1.5rem;background:rgba(255,255,255,.9);border-bottom:1px solid rgba(148,163,184,.5);backdrop-filter:blur(8px);}h1{margin:0;font-size:1rem;word-break:break-all;font-family:ui-monospace;}main{max-width:1200px;margin:0 auto;padding:1.5rem;}#content{background:#fff;border-radius:12px;box-shadow:0 10px 35px rgba(15,23,42,.07);padding:1.5rem;min-height:70vh;overflow-x:auto;}a.button{display:inline-flex;align-items:center;padding:.45rem .85rem;border-radius:7px;text-decoration:none;font-size:.85rem;}a.primary{background:#2563eb;color:#fff;}a.secondary{background:rgba(148,163,184,.3);color:#1f2937;margin-right:.6rem;}pre{background:rgba(15,23,42,.08);padding:1rem;border-radius:10px;overflow:auto;}iframe.preview{width:100%;min-height:70vh;border:1px solid rgba(148,163,184,.4);border-radius:10px;background:#fff;}</style>\n</head>\n<body>\n  <header>\n    <h1 id=\"doc-path\">문서 로드 중...</h1>\n    <nav>\n      <a class=\"button secondary\" href=\"index.html\">← 목록</a>\n      <a class=\"button primary\" id=\"raw-link\" target=\"_blank\">Raw</a>\n    </nav>\n  </header>\n  <main>\n    <section id=\"content\">문서를 불러오는 중입니다...</section>\n  </main>\n<script>function qp(n){return new URLSearchParams(window.location.search).get(n);}function ext(p){const i=p.lastIndexOf('.');return i===-1?'':p.slice(i).toLowerCase();}async function load(){const path=qp('path');if(!path){document.getElementById('content').textContent='path 파라미터가 필요합니다.';return;}document.title=path+' – 문서 뷰어';document.getElementById('doc-path').textContent=path;const raw=`raw/${path}`;document.getElementById('raw-link').href=raw;const extension=ext(path);if(['.pdf','.doc','.docx'].includes(extension)){document.getElementById('content').innerHTML='<p>브라우저 미리보기를 지원하지 않는 형식입니다. Raw 링크를 통해 다운로드하세요.</p>';return;}if(['.html','.htm'].includes(extension)){document.getElementById('content').innerHTML=`<iframe class=\"preview\" src='${raw}'></iframe>`;return;}try{const res=await fetch(raw,{cache:'no-store'});if(!res.ok)throw new Error('문서 요청 실패');const text=await res.text();if(['.md','.markdown','.mdx'].includes(extension)){document.getElementById('content').innerHTML=marked.parse(text,{mangle:false,headerIds:true});return;}if(['.json','.yaml','.yml','.csv','.tsv','.txt','.rst','.adoc','.log'].includes(extension)){const escaped=text.replace(/[&<>]/g,ch=>({'&':'&amp;','<':'&lt;','>':'&gt;'}[ch]));document.getElementById('content').innerHTML=`<pre>${escaped}</pre>`;return;}document.getElementById('content').innerHTML='<p>이 형식은 기본 미리보기 대상이 아닙니다. Raw 링크를 통해 확인하세요.</p>'; }catch(err){document.getElementById('content').textContent=`문서를 불러오지 못했습니다: ${err.message}`;}}load();</script>\n</body>\n</html>\n"
+VIEWER_HTML = "<!DOCTYPE html>\n<html lang=\"en\">\n<head>\n  <meta charset=\"utf-8\" />\n  <meta name=\"viewport\" content=\"width=device-width, initial-scale=1\" />\n  <title>문서 뷰어</title>\n  <style>body{margin:0;background:#e2e8f0;font-family:system-ui;}header{position:sticky;top:0;display:flex;justify-content:space-between;align-items:center;padding:1rem 1.5rem;background:rgba(255,255,255,.9);border-bottom:1px solid rgba(148,163,184,.5);backdrop-filter:blur(8px);}h1{margin:0;font-size:1rem;word-break:break-all;font-family:ui-monospace;}main{max-width:1200px;margin:0 auto;padding:1.5rem;}#content{background:#fff;border-radius:12px;box-shadow:0 10px 35px rgba(15,23,42,.07);padding:1.5rem;min-height:70vh;overflow-x:auto;}a.button{display:inline-flex;align-items:center;padding:.45rem .85rem;border-radius:7px;text-decoration:none;font-size:.85rem;}a.primary{background:#2563eb;color:#fff;}a.secondary{background:rgba(148,163,184,.3);color:#1f2937;margin-right:.6rem;}pre{background:rgba(15,23,42,.08);padding:1rem;border-radius:10px;overflow:auto;}img.preview-image{max-width:100%;height:auto;}iframe.preview{width:100%;min-height:70vh;border:1px solid rgba(148,163,184,.4);border-radius:10px;background:#fff;}</style>\n</head>\n<body>\n  <header>\n    <h1 id=\"doc-path\">문서 로드 중...</h1>\n    <nav>\n      <a class=\"button secondary\" href=\"index.html\">← 목록</a>\n      <a class=\"button primary\" id=\"raw-link\" target=\"_blank\">Raw</a>\n    </nav>\n  </header>\n  <main>\n    <section id=\"content\">문서를 불러오는 중입니다...</section>\n  </main>\n<script>function qp(n){return new URLSearchParams(window.location.search).get(n);}function ext(p){const i=p.lastIndexOf('.');return i===-1?'':p.slice(i).toLowerCase();}function encPath(p){return p.split('/').map(encodeURIComponent).join('/');}let markedLoad=null;function ensureMarked(){if(window.marked)return Promise.resolve(window.marked);if(!markedLoad)markedLoad=new Promise((resolve,reject)=>{const s=document.createElement('script');s.src='https://cdn.jsdelivr.net/npm/marked/marked.min.js';s.onload=()=>resolve(window.marked);s.onerror=()=>reject(new Error('marked를 불러올 수 없습니다.'));document.head.appendChild(s);});return markedLoad;}async function load(){const path=qp('path');if(!path){document.getElementById('content').textContent='path 파라미터가 필요합니다.';return;}document.title=path+' – 문서 뷰어';document.getElementById('doc-path').textContent=path;const raw=`raw/${path}`;document.getElementById('raw-link').href=raw;const extension=ext(path);if(['.pdf','.doc','.docx'].includes(extension)){document.getElementById('content').innerHTML='<p>브라우저 미리보기를 지원하지 않는 형식입니다. Raw 링크를 통해 다운로드하세요.</p>';return;}if(['.html','.htm'].includes(extension)){document.getElementById('content').innerHTML=`<iframe class=\"preview\" src='${raw}'></iframe>`;return;}try{if(['.png','.jpg','.jpeg','.gif','.svg','.webp','.bmp'].includes(extension)){const info=await fetch('images.json',{cache:'no-cache'}).then(r=>r.ok?r.json():{}).catch(()=>({}));const meta=info[path]||{},full=`raw/${encPath(path)}`;const webp=meta.thumb?`${full}.thumb.webp`:meta.webp?`${full}.webp`:'';const size=meta.thumb?meta.thumb:meta.width?[meta.width,meta.height]:null;document.getElementById('content').innerHTML=`<a href=\"${meta.webp?full+'.webp':full}\" target=\"_blank\"><picture>${webp?`<source type=\"image/webp\" srcset=\"${webp}\">`:''}<img class=\"preview-image\" src=\"${full}\" alt=\"\"${size?` width=\"${size[0]}\" height=\"${size[1]}\"`:''}></picture></a>`;return;}if(['.md','.markdown'].includes(extension)){const pre=await fetch(`rendered/${encPath(path)}.html`,{cache:'no-cache'});if(pre.ok){document.getElementById('content').innerHTML=await pre.text();return;}}const res=await fetch(raw,{cache:'no-store'});if(!res.ok)throw new Error('문서 요청 실패');const text=await res.text();if(['.md','.markdown','.mdx'].includes(extension)){const md=await ensureMarked();document.getElementById('content').innerHTML=md.parse(text,{mangle:false,headerIds:true});return;}if(['.json','.yaml','.yml','.csv','.tsv','.txt','.rst','.adoc','.log'].includes(extension)){const escaped=text.replace(/[&<>]/g,ch=>({'&':'&amp;','<':'&lt;','>':'&gt;'}[ch]));document.getElementById('content').innerHTML=`<pre>${escaped}</pre>`;return;}document.getElementById('content').innerHTML='<p>이 형식은 기본 미리보기 대상이 아닙니다. Raw 링크를 통해 확인하세요.</p>'; }catch(err){document.getElementById('content').textContent=`문서를 불러오지 못했습니다: ${err.message}`;}}load();</script>\n</body>\n</html>\n"
 
 ROOT_REDIRECT_HTML = "<!DOCTYPE html>\n<html lang=\"en\">\n<head><meta charset=\"utf-8\" /><meta http-equiv=\"refresh\" content=\"0;url=wiki-docs/index.html\" /><title>Redirecting…</title></head>\n<body><p><a href=\"wiki-docs/index.html\">wiki-docs/index.html</a>로 이동합니다.</p></body>\n</html>\n"
 
 
-def should_exclude(path: Path) -> bool:
-    return any(part in EXCLUDED_DIR_NAMES for part in path.parts)
+@dataclass
+class DocScan:
+    doc_files: List[Path]
+    asset_files: List[Path]
+
+
+def is_allowed(name: str) -> bool:
+    suffix = os.path.splitext(name)[1].lower()
+    return not suffix or suffix in ALLOWED_EXTS
+
+
+def is_readme(name: str) -> bool:
+    return name == "README.md" or (name.startswith("README-") and name.endswith(".md"))
 
 
-def discover_doc_dirs(root: Path) -> List[Path]:
-    doc_dirs = {p for p in BASE_DOC_DIRS if p.exists()}
-    for dirpath, dirnames, _ in os.walk(root):
-        current = Path(dirpath)
-        if should_exclude(current):
-            dirnames[:] = []
+def classify_paths(rel_paths: Iterable[str], root: Path = REPO_ROOT) -> DocScan:
+    """Split repo-relative paths into doc files and doc-dir assets in a single pass.
+
+    Doc files: files under a docs/ (any case) or BASE_DOC_DIRS directory, README.md /
+    README-*.md at any depth, and *.md directly inside a top-level directory.
+    Assets: every allowed file under a doc directory.
+    """
+    docs = set()
+    assets = set()
+    for rel in rel_paths:
+        directory, _, name = rel.rpartition("/")
+        if not is_allowed(name):
             continue
-        for name in list(dirnames):
-            if name in EXCLUDED_DIR_NAMES:
-                dirnames.remove(name)
-        for name in dirnames:
-            if name.lower() == "docs":
-                doc_dirs.add(current / name)
-    return sorted(doc_dirs)
-
-
-def collect_doc_files(root: Path, doc_dirs: Sequence[Path]) -> List[Path]:
-    files = set()
-    for directory in doc_dirs:
-        for file in directory.rglob("*"):
-            if file.is_file() and not should_exclude(file) and (not file.suffix or file.suffix.lower() in ALLOWED_EXTS):
-                files.add(file)
-    for pattern in README_GLOBS:
-        for file in root.glob(pattern):
-            if file.is_file() and not should_exclude(file) and (not file.suffix or file.suffix.lower() in ALLOWED_EXTS):
-                files.add(file)
-    for child in root.iterdir():
-        if child.is_dir() and not should_exclude(child):
-            for file in child.glob("*.md"):
-                if file.is_file():
-                    files.add(file)
-    return sorted(files)
+        in_doc_dir = bool(directory) and (
+            rel.startswith(BASE_DOC_DIR_PREFIXES) or any(part.lower() == "docs" for part in directory.split("/"))
+        )
+        if in_doc_dir:
+            docs.add(rel)
+            assets.add(rel)
+        elif is_readme(name) or (directory and "/" not in directory and name.endswith(".md")):
+            docs.add(rel)
+    return DocScan(doc_files=[root / rel for rel in sorted(docs)], asset_files=[root / rel for rel in sorted(assets)])
+
+
+def scan_docs(root: Path, skip: Sequence[Path] = (), backend: str = "auto") -> DocScan:
+    """One listing of the repository (git index, or a pruned walk), classified in one pass."""
+    return classify_paths(list_files(root, EXCLUDED_DIR_NAMES, skip=skip, backend=backend), root)
 
 
 def is_textual(file: Path) -> bool:
@@ -82,65 +99,128 @@ def build_docs_payload(files: Iterable[Path]) -> List[dict]:
     return sorted(payload, key=lambda item: item["path"])
 
 
-def copy_file(src: Path, dest: Path) -> None:
-    dest.parent.mkdir(parents=True, exist_ok=True)
-    shutil.copy2(src, dest)
-
-
-def copy_doc_assets(doc_dirs: Sequence[Path], output_raw: Path) -> None:
-    for directory in doc_dirs:
-        for file in directory.rglob("*"):
-            if file.is_file() and not should_exclude(file):
-                if file.suffix and file.suffix.lower() not in ALLOWED_EXTS:
-                    continue
-                rel = file.relative_to(REPO_ROOT)
-                copy_file(file, output_raw / rel)
-
-
-def copy_doc_files(files: Sequence[Path], output_raw: Path) -> None:
-    for file in files:
-        rel = file.relative_to(REPO_ROOT)
-        copy_file(file, output_raw / rel)
+def raw_targets(files: Iterable[Path]) -> Dict[str, Path]:
+    """Output-relative raw/ path -> source file (each file listed once)."""
+    return {f"{SITE_SUBDIR}/{RAW_SUBDIR}/{file.relative_to(REPO_ROOT).as_posix()}": file for file in files}
 
 
 def write_site_assets(site_dir: Path) -> None:
     site_dir.mkdir(parents=True, exist_ok=True)
-    (site_dir / "index.html").write_text(INDEX_HTML, encoding="utf-8")
-    (site_dir / "viewer.html").write_text(VIEWER_HTML, encoding="utf-8")
+    # Static scripts get content-hashed names so hosts can cache them as immutable
+    search_js = content_hashed_name("search.js", SEARCH_JS.encode("utf-8"))
+    for stale in site_dir.glob("search.*.js"):
+        if stale.name != search_js:
+            stale.unlink()
+    write_if_changed(site_dir / search_js, SEARCH_JS)
+    write_if_changed(site_dir / "index.html", INDEX_HTML.replace('<script src="search.js">', f'<script src="{search_js}">'))
+    write_if_changed(site_dir / "viewer.html", VIEWER_HTML)
 
 
-def write_docs_data(site_dir: Path, files: Sequence[dict]) -> None:
-    payload = {"generated_at": dt.datetime.now(dt.timezone.utc).isoformat(), "files": files}
-    (site_dir / "docs-data.json").write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+def write_root_redirect(output_dir: Path) -> None:
+    write_if_changed(output_dir / "index.html", ROOT_REDIRECT_HTML)
 
 
-def write_root_redirect(output_dir: Path) -> None:
-    (output_dir / "index.html").write_text(ROOT_REDIRECT_HTML, encoding="utf-8")
+def write_build_report(output_dir: Path, report: dict) -> None:
+    (output_dir / BUILD_REPORT_NAME).write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
 
 
 def clean_output(output_dir: Path) -> None:
+    # Keeps the build cache (e.g. optimized images), which is keyed by content, not by build
     if output_dir.exists():
-        shutil.rmtree(output_dir)
+        for entry in output_dir.iterdir():
+            if entry.name == BUILD_CACHE_DIR:
+                continue
+            if entry.is_dir() and not entry.is_symlink():
+                shutil.rmtree(entry)
+            else:
+                entry.unlink()
     output_dir.mkdir(parents=True, exist_ok=True)
 
 
-def generate(output_dir: Path, include_assets: bool = True) -> int:
-    doc_dirs = discover_doc_dirs(REPO_ROOT)
-    doc_files = collect_doc_files(REPO_ROOT, doc_dirs)
+def generate(output_dir: Path, include_assets: bool = True, incremental: bool = False, link_mode: str = "auto",
+             since: str | None = None, backend: str = "auto", search_index: bool = True,
+             prerender: bool = True, jobs: int | None = None, compress: bool = True,
+             images: bool = False) -> int:
+    started = time.perf_counter()
+    changes = resolve_changes(REPO_ROOT, since)
+    # Never pick up a previous build as documentation input
+    scan = scan_docs(REPO_ROOT, skip=[output_dir], backend=backend)
+    doc_files = scan.doc_files
     if not doc_files:
         print("No documentation files discovered.")
         return 1
-    clean_output(output_dir)
+
+    manifest = BuildManifest.load(output_dir) if incremental or changes else None
+    if manifest is None:
+        if changes is not None:
+            print(f"No previous build in {output_dir}; --since {since} falls back to a full build.")
+            changes = None
+        # Full build (or no usable manifest yet): start from an empty directory
+        clean_output(output_dir)
+        manifest = BuildManifest(output_dir)
     site_dir = output_dir / SITE_SUBDIR
-    raw_dir = site_dir / RAW_SUBDIR
     write_site_assets(site_dir)
-    copy_doc_files(doc_files, raw_dir)
+
+    wanted = raw_targets(doc_files)
     if include_assets:
-        copy_doc_assets(doc_dirs, raw_dir)
+        for dest, file in raw_targets(scan.asset_files).items():
+            wanted.setdefault(dest, file)
+    # With --since only files git reports as changed are re-checked against the manifest
+    sync = manifest.sync(wanted, REPO_ROOT, mode=link_mode, only=changes.changed if changes else None)
+    manifest.save()
+    raw_prefix = f"{SITE_SUBDIR}/{RAW_SUBDIR}/"
+
+    image_stats = None
+    if images:
+        image_hashes = {dest: entry.get("sha256") for dest, entry in manifest.entries.items()}
+        image_stats = optimize_images(wanted, output_dir, site_dir, output_dir / BUILD_CACHE_DIR,
+                                      known_hashes=image_hashes, jobs=jobs).to_dict()
+    else:
+        clear_image_variants(output_dir, site_dir)
+
     docs_payload = build_docs_payload(doc_files)
-    write_docs_data(site_dir, docs_payload)
+    index_stats = write_docs_index(site_dir, docs_payload)
+    # Single-file listing of earlier builds
+    (site_dir / "docs-data.json").unlink(missing_ok=True)
+    # Repository-relative path -> sha256 from the sync manifest, so later stages do not re-hash sources
+    known_hashes = {dest[len(raw_prefix):]: entry.get("sha256") for dest, entry in manifest.entries.items()
+                    if dest.startswith(raw_prefix)}
+    render_stats = None
+    if prerender:
+        sources = {item["path"]: REPO_ROOT / item["path"] for item in docs_payload}
+        render_stats = prerender_markdown(sources, output_dir, site_dir, known_hashes=known_hashes, jobs=jobs).to_dict()
+    else:
+        clear_prerendered(output_dir, site_dir)
+    search_stats = None
+    if search_index:
+        textual = ((item["path"], REPO_ROOT / item["path"]) for item in docs_payload if item["textual"])
+        search_stats = build_search_index(textual, site_dir / SEARCH_SUBDIR,
+                                          cache_dir=output_dir / BUILD_CACHE_DIR / SEARCH_CACHE_SUBDIR,
+                                          known_hashes=known_hashes)
     write_root_redirect(output_dir)
-    print(f"Generated {len(docs_payload)} docs into {output_dir}")
+    publish_stats = None
+    if compress:
+        publish_stats = publish(output_dir, jobs=jobs).to_dict()
+    else:
+        clear_published(output_dir)
+    elapsed = time.perf_counter() - started
+    write_build_report(output_dir, {
+        "generated_at": dt.datetime.now(dt.timezone.utc).isoformat(),
+        "incremental": incremental,
+        "since": since if changes else None,
+        "docs": len(docs_payload),
+        "files": len(wanted),
+        "sync": sync.to_dict(),
+        "index": index_stats,
+        "render": render_stats,
+        "images": image_stats,
+        "search": search_stats,
+        "publish": publish_stats,
+        "seconds": round(elapsed, 4),
+    })
+    placed = ", ".join(f"{method}={count}" for method, count in sorted(sync.placed.items())) or "none"
+    print(f"Generated {len(docs_payload)} docs into {output_dir} "
+          f"(placed: {placed}, unchanged: {sync.unchanged}, removed: {sync.removed}, {elapsed:.3f}s)")
     return 0
 
 
@@ -148,12 +228,28 @@ def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Generate wiki docs bundle")
     parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help="Build output directory (default: repo/wiki-docs-build)")
     parser.add_argument("--no-assets", action="store_true", help="Skip copying additional assets")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Reuse the previous build: copy only new/changed files and delete removed ones")
+    parser.add_argument("--link-mode", choices=LINK_MODES, default="auto",
+                        help="How to place raw files: auto (reflink, else copy), reflink, hardlink (shares inodes with sources), copy")
+    parser.add_argument("--no-prerender", action="store_true",
+                        help="Do not render markdown at build time (the viewer renders it in the browser)")
+    parser.add_argument("--jobs", type=int, default=None, help="Workers for markdown rendering, image optimization and compression (default: CPU count)")
+    parser.add_argument("--no-compress", action="store_true",
+                        help="Skip .gz/.br precompressed variants and cache-manifest.json")
+    parser.add_argument("--optimize-images", action="store_true",
+                        help="Recompress PNGs losslessly and add WebP variants/thumbnails (needs Pillow; results are cached)")
+    parser.add_argument("--no-search-index", action="store_true", help="Skip building the full-text search index")
+    add_enumeration_arguments(parser)
     return parser.parse_args(argv)
 
 
 def main(argv: Sequence[str] | None = None) -> int:
     args = parse_args(argv)
-    return generate(args.output, include_assets=not args.no_assets)
+    return generate(args.output, include_assets=not args.no_assets, incremental=args.incremental, link_mode=args.link_mode,
+                    since=args.since, backend=args.file_backend, search_index=not args.no_search_index,
+                    prerender=not args.no_prerender, jobs=args.jobs, compress=not args.no_compress,
+                    images=args.optimize_images)
 
 
 if __name__ == "__main__":
@@ -9,7 +9,9 @@ import sys
 from collections import defaultdict
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Iterable, List
+from typing import Dict, Iterable, List, Optional
+
+from doctools.gitfiles import ChangeSet, add_enumeration_arguments, list_files, resolve_changes
 
 try:
     import yaml  # type: ignore
@@ -43,16 +45,35 @@ SKIP_DIR_NAMES = {
 }
 
 
-def find_markdown_files(root: Path) -> List[str]:
+def is_markdown(path: str) -> bool:
+    return path.endswith(".md")
+
+
+def is_skipped(path: str) -> bool:
+    return any(part in SKIP_DIR_NAMES for part in path.split("/")[:-1])
+
+
+def find_markdown_files(root: Path, backend: str = "auto") -> List[str]:
     """Return sorted list of markdown paths relative to repo root."""
 
-    files: List[str] = []
-    for path in root.rglob("*.md"):
-        if any(part in SKIP_DIR_NAMES for part in path.parts):
-            continue
-        relative = path.relative_to(root).as_posix()
-        files.append(relative)
-    return sorted(files)
+    return [path for path in list_files(root, SKIP_DIR_NAMES, backend=backend) if is_markdown(path)]
+
+
+def load_manifest_paths(path: Path = JSON_OUTPUT_PATH) -> Optional[List[str]]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return [entry["path"] for entry in data.get("files", []) if "path" in entry]
+
+
+def apply_changes(files: Iterable[str], changes: ChangeSet, root: Path = REPO_ROOT) -> List[str]:
+    """Update a previous file list with what git reports since the revision."""
+
+    # Untracked files never show up as deleted, so drop anything that is gone
+    current = {path for path in set(files) - changes.deleted if (root / path).is_file()}
+    current.update(path for path in changes.changed if is_markdown(path) and not is_skipped(path))
+    return sorted(current)
 
 
 def _format_title(name: str) -> str:
@@ -127,12 +148,19 @@ def parse_args() -> argparse.Namespace:
         default="json",
         help="Output format (json writes to docs/wiki/data/docs.json, yaml prints nav to stdout)",
     )
+    add_enumeration_arguments(parser)
     return parser.parse_args()
 
 
 def main() -> None:
     args = parse_args()
-    markdown_files = find_markdown_files(REPO_ROOT)
+    changes = resolve_changes(REPO_ROOT, args.since)
+    previous = load_manifest_paths() if changes else None
+    if previous is not None:
+        # Only added/removed paths matter: entries are derived from the path alone
+        markdown_files = apply_changes(previous, changes)
+    else:
+        markdown_files = find_markdown_files(REPO_ROOT, backend=args.file_backend)
 
     if args.format == "json":
         write_json_manifest(markdown_files)
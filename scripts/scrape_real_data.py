@@ -4,272 +4,269 @@
 진짜 URL과 실제 콘텐츠만 수집합니다.
 """
 
-import requests
-import json
-import time
-import hashlib
+import argparse
+import os
 from datetime import datetime
-from typing import List, Dict, Any
-from bs4 import BeautifulSoup
-import feedparser
+from itertools import zip_longest
+from typing import List, Dict, Any, Iterable, Optional
+
+from collectors.article import add_article_arguments
+from collectors.dedup import DedupIndex
+from collectors.embedding import add_embedding_arguments
+from collectors.feed_parser import fetch_feed_items
+from collectors.metrics import reset_metrics
+from collectors.pg_sink import add_sink_arguments
+from collectors.pipeline import Pipeline, Source, make_item_id, make_user_id, run_source, title_contains
+from collectors.portal_parser import parse_daum_results, parse_naver_results
+from collectors.portal_search import (
+    DAUM_SEARCH_URL, DEFAULT_DAYS, DEFAULT_PAGES, DEFAULT_PER_HOST, DEFAULT_TERMS, NAVER_SEARCH_URL,
+    PortalPage, SearchQuery, SeenUrls, add_portal_arguments, build_queries, daum_params, naver_params, parse_page,
+    search_pages
+)
+from collectors.ratelimit import HostConcurrencyLimiter
+from collectors.records import CollectedItem
+from collectors.runner import CollectionResult, add_pipeline_arguments, run_collection
+from collectors.transport import HttpTransport, add_transport_arguments, configure_transport, get_transport
+from collectors.watermark import shared_store
+
+# 교차 소스 중복 제거 인덱스 (collect_real_data.py와 공유)
+DEDUP_INDEX_PATH = os.environ.get(
+    "COLLECTOR_DEDUP_INDEX",
+    "/home/nodove/workspace/Capstone/data/dedup_index.sqlite3"
+)
+
+# 게시일(UTC) 기준 일자 파티션 저장 위치 (collect_real_data.py와 공유)
+PARTITION_DIR = os.environ.get(
+    "COLLECTOR_PARTITION_DIR",
+    "/home/nodove/workspace/Capstone/data/partitions"
+)
+
+# RSS 피드별 워터마크 (collect_real_data.py와 파일을 공유하지만 필터가 달라 키에 수집기 이름을 붙임)
+FEED_STATE_PATH = os.environ.get(
+    "COLLECTOR_FEED_STATE",
+    "/home/nodove/workspace/Capstone/data/feed_watermarks.json"
+)
+FEED_WATERMARKS = shared_store(FEED_STATE_PATH)
+NPS_RSS_URL = "https://www.nps.or.kr/jsppage/cyber_pr/news/rss.jsp"
+MOHW_RSS_URL = "https://www.mohw.go.kr/rss/news.xml"
+# scrape_* 메서드별 피드 (데몬이 저장 후 commit_feed_watermark()로 확정)
+FEED_SCRAPERS = {"scrape_nps_rss": NPS_RSS_URL, "scrape_mohw_rss": MOHW_RSS_URL}
+
+
+def feed_watermark_key(url: str) -> str:
+    return f"scrape_real_data:{url}"
+
+
+def commit_feed_watermark(url: str) -> None:
+    """수집한 항목을 저장한 뒤 보류 중인 피드 워터마크 확정"""
+    FEED_WATERMARKS.commit([feed_watermark_key(url)])
+
+# 포털 검색 결과 제목 필터 (동의어/관련 정책 용어 검색 결과 포함)
+PORTAL_TITLE_KEYWORDS = ('연금', '노후', '소득대체율', '보험료율')
 
 class RealDataScraper:
     """실제 데이터 스크래퍼"""
     
-    def __init__(self):
+    def __init__(self, transport: Optional[HttpTransport] = None, terms: Optional[List[str]] = None,
+                 pages: int = DEFAULT_PAGES, days: int = DEFAULT_DAYS, window_days: int = 1,
+                 per_host: int = DEFAULT_PER_HOST):
+        self.transport = transport or get_transport()
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
         self.collected_data = []
+        # 포털 검색: 검색어 × 기간 구간 × 페이지 (collectors/portal_search.py)
+        self.queries = build_queries(terms or DEFAULT_TERMS, days=days, window_days=window_days)
+        self.pages = pages
+        self.host_limiter = HostConcurrencyLimiter(per_host)
     
     def generate_user_id(self, author: str, platform: str) -> str:
         """사용자 ID 생성"""
-        return hashlib.md5(f"{platform}:{author}".encode()).hexdigest()[:16]
+        return make_user_id(author, platform)
     
-    def scrape_naver_news(self) -> List[Dict[str, Any]]:
-        """네이버 뉴스에서 국민연금 관련 기사 스크래핑"""
-        data = []
-        
-        try:
-            # 네이버 뉴스 검색 API 사용
-            search_url = "https://search.naver.com/search.naver"
-            params = {
-                "where": "news",
-                "query": "국민연금 개혁",
-                "sort": "1",  # 최신순
-                "pd": "1"     # 최근 1일
-            }
-            
-            response = requests.get(search_url, headers=self.headers, params=params, timeout=10)
-            if response.status_code != 200:
-                print(f"네이버 뉴스 접근 실패: {response.status_code}")
-                return data
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # 뉴스 기사 추출
-            news_items = soup.select('.list_news .news_area')[:10]  # 최대 10개
-            
-            for item in news_items:
-                try:
-                    title_elem = item.select_one('.news_tit')
-                    if not title_elem:
-                        continue
-                    
-                    title = title_elem.get('title', '')
-                    url = title_elem.get('href', '')
-                    
-                    # 언론사 정보
-                    press = item.select_one('.info_group .press')
-                    press_name = press.text if press else 'Unknown'
-                    
-                    # 요약
-                    summary = item.select_one('.api_txt_lines')
-                    content = summary.text if summary else ''
-                    
-                    # 시간
-                    time_elem = item.select_one('.info_group span')
-                    published = time_elem.text if time_elem else datetime.now().isoformat()
-                    
-                    if title and url and '국민연금' in title:
-                        data.append({
-                            "id": hashlib.md5(url.encode()).hexdigest()[:16],
-                            "source": "naver_news",
-                            "category": "news",
-                            "platform": "naver",
-                            "title": title.strip(),
-                            "content": content.strip()[:500],
-                            "url": url,
-                            "author": press_name.strip(),
-                            "author_id": self.generate_user_id(press_name, "naver_news"),
-                            "published_at": published,
-                            "collected_at": datetime.now().isoformat()
-                        })
-                        print(f"✅ 수집: {title[:50]}...")
-                        
-                except Exception as e:
-                    print(f"항목 파싱 오류: {e}")
-                    continue
-                    
-        except Exception as e:
-            print(f"네이버 뉴스 스크래핑 오류: {e}")
-        
-        return data
+    def _search(self, url: str, params_for, query: SearchQuery, label: str) -> Iterable[PortalPage]:
+        return search_pages(
+            self.transport, url, params_for, query, self.pages,
+            self.host_limiter, headers=self.headers, label=label
+        )
     
-    def scrape_nps_rss(self) -> List[Dict[str, Any]]:
-        """국민연금공단 RSS 피드 수집"""
-        data = []
-        
-        try:
-            # 국민연금공단 RSS (실제 URL)
-            rss_url = "https://www.nps.or.kr/jsppage/cyber_pr/news/rss.jsp"
-            
+    def naver_sources(self, seen: Optional[SeenUrls] = None) -> List[Source]:
+        """네이버 뉴스 검색 (검색어/기간별 소스, 국민연금 관련 기사)"""
+        seen = seen or SeenUrls()
+        return [
+            Source(
+                name=f"naver_news:{query.label}",
+                fetch=lambda query=query: self._search(NAVER_SEARCH_URL, naver_params, query, "네이버 뉴스"),
+                parse=lambda page: self.parse_naver_news(parse_page(page, parse_naver_results, seen)),
+                filter=title_contains(*PORTAL_TITLE_KEYWORDS)
+            )
+            for query in self.queries
+        ]
+    
+    def parse_naver_news(self, news_items) -> Iterable[CollectedItem]:
+        # 검색 결과 한 페이지 (URL 중복 제거 후)
+        for item in news_items:
+            if not item['title'] or not item['url']:
+                continue
+            press_name = item['press'] or 'Unknown'
+            yield CollectedItem(
+                id=make_item_id(item['url']),
+                source="naver_news",
+                category="news",
+                platform="naver",
+                title=item['title'].strip(),
+                content=(item['summary'] or '').strip()[:500],
+                url=item['url'],
+                author=press_name.strip(),
+                author_id=self.generate_user_id(press_name, "naver_news"),
+                published_at=item['published'] or datetime.now().isoformat(),
+                collected_at=datetime.now().isoformat()
+            )
+    
+    def nps_source(self) -> Source:
+        """국민연금공단 RSS 피드 (최대 20개, 이전 실행에서 본 항목에서 중단)"""
+        def fetch():
             print(f"국민연금공단 RSS 접근 중...")
-            feed = feedparser.parse(rss_url)
-            
-            if not feed.entries:
-                print("RSS 피드에 항목이 없습니다")
-                return data
-            
-            for entry in feed.entries[:20]:  # 최대 20개
-                try:
-                    title = entry.get('title', '')
-                    link = entry.get('link', '')
-                    summary = entry.get('summary', '')
-                    published = entry.get('published', datetime.now().isoformat())
-                    
-                    if title and link:
-                        data.append({
-                            "id": hashlib.md5(link.encode()).hexdigest()[:16],
-                            "source": "nps_official",
-                            "category": "official",
-                            "platform": "nps",
-                            "title": title.strip(),
-                            "content": summary.strip()[:500] if summary else '',
-                            "url": link,
-                            "author": "국민연금공단",
-                            "author_id": self.generate_user_id("국민연금공단", "nps"),
-                            "published_at": published,
-                            "collected_at": datetime.now().isoformat()
-                        })
-                        print(f"✅ 수집: {title[:50]}...")
-                        
-                except Exception as e:
-                    print(f"RSS 항목 파싱 오류: {e}")
-                    continue
-                    
-        except Exception as e:
-            print(f"국민연금공단 RSS 수집 오류: {e}")
+            # 국민연금공단 RSS (실제 URL)
+            yield from fetch_feed_items(
+                self.transport, NPS_RSS_URL, limit=20, watermarks=FEED_WATERMARKS,
+                headers=self.headers, key=feed_watermark_key(NPS_RSS_URL)
+            )
         
-        return data
+        return Source(
+            name="nps_official",
+            fetch=fetch,
+            parse=self.parse_nps_rss,
+            commit=lambda: commit_feed_watermark(NPS_RSS_URL)
+        )
     
-    def scrape_mohw_rss(self) -> List[Dict[str, Any]]:
-        """보건복지부 RSS 피드 수집"""
-        data = []
-        
-        try:
-            # 보건복지부 RSS (실제 URL)
-            rss_url = "https://www.mohw.go.kr/rss/news.xml"
-            
+    def parse_nps_rss(self, entry) -> Iterable[CollectedItem]:
+        title = entry['title']
+        link = entry['link']
+        if not title or not link:
+            return
+        yield CollectedItem(
+            id=make_item_id(link),
+            source="nps_official",
+            category="official",
+            platform="nps",
+            title=title,
+            content=(entry['summary'] or '')[:500],
+            url=link,
+            author="국민연금공단",
+            author_id=self.generate_user_id("국민연금공단", "nps"),
+            published_at=entry['published'] or datetime.now().isoformat(),
+            collected_at=datetime.now().isoformat()
+        )
+    
+    def mohw_source(self) -> Source:
+        """보건복지부 RSS 피드 (연금/노후/복지 관련 기사, 최대 10개)"""
+        def fetch():
             print(f"보건복지부 RSS 접근 중...")
-            response = requests.get(rss_url, headers=self.headers, timeout=10)
-            
-            if response.status_code != 200:
-                print(f"보건복지부 RSS 접근 실패: {response.status_code}")
-                return data
-            
-            # XML 파싱
-            from xml.etree import ElementTree
-            root = ElementTree.fromstring(response.content)
-            
-            # RSS 아이템 추출
-            items = root.findall('.//item')[:10]  # 최대 10개
-            
-            for item in items:
-                try:
-                    title = item.find('title')
-                    link = item.find('link')
-                    description = item.find('description')
-                    pubDate = item.find('pubDate')
-                    
-                    if title is not None and link is not None:
-                        title_text = title.text
-                        
-                        # 국민연금 관련 기사만 필터링
-                        if title_text and ('연금' in title_text or '노후' in title_text or '복지' in title_text):
-                            data.append({
-                                "id": hashlib.md5(link.text.encode()).hexdigest()[:16],
-                                "source": "mohw_official",
-                                "category": "government",
-                                "platform": "mohw",
-                                "title": title_text.strip(),
-                                "content": description.text.strip()[:500] if description is not None else '',
-                                "url": link.text,
-                                "author": "보건복지부",
-                                "author_id": self.generate_user_id("보건복지부", "mohw"),
-                                "published_at": pubDate.text if pubDate is not None else datetime.now().isoformat(),
-                                "collected_at": datetime.now().isoformat()
-                            })
-                            print(f"✅ 수집: {title_text[:50]}...")
-                            
-                except Exception as e:
-                    print(f"RSS 항목 파싱 오류: {e}")
-                    continue
-                    
-        except Exception as e:
-            print(f"보건복지부 RSS 수집 오류: {e}")
+            # 보건복지부 RSS (실제 URL)
+            yield from fetch_feed_items(
+                self.transport, MOHW_RSS_URL, limit=10, watermarks=FEED_WATERMARKS,
+                headers=self.headers, key=feed_watermark_key(MOHW_RSS_URL)
+            )
         
-        return data
+        return Source(
+            name="mohw_official",
+            fetch=fetch,
+            parse=self.parse_mohw_rss,
+            filter=title_contains('연금', '노후', '복지'),
+            commit=lambda: commit_feed_watermark(MOHW_RSS_URL)
+        )
     
-    def scrape_daum_news(self) -> List[Dict[str, Any]]:
-        """다음 뉴스 스크래핑"""
+    def parse_mohw_rss(self, entry) -> Iterable[CollectedItem]:
+        title = entry['title']
+        link = entry['link']
+        if not title or not link:
+            return
+        yield CollectedItem(
+            id=make_item_id(link),
+            source="mohw_official",
+            category="government",
+            platform="mohw",
+            title=title,
+            content=(entry['summary'] or '')[:500],
+            url=link,
+            author="보건복지부",
+            author_id=self.generate_user_id("보건복지부", "mohw"),
+            published_at=entry['published'] or datetime.now().isoformat(),
+            collected_at=datetime.now().isoformat()
+        )
+    
+    def daum_sources(self, seen: Optional[SeenUrls] = None) -> List[Source]:
+        """다음 뉴스 검색 (검색어/기간별 소스, 국민연금 관련 기사)"""
+        seen = seen or SeenUrls()
+        return [
+            Source(
+                name=f"daum_news:{query.label}",
+                fetch=lambda query=query: self._search(DAUM_SEARCH_URL, daum_params, query, "다음 뉴스"),
+                parse=lambda page: self.parse_daum_news(parse_page(page, parse_daum_results, seen)),
+                filter=title_contains(*PORTAL_TITLE_KEYWORDS)
+            )
+            for query in self.queries
+        ]
+    
+    def parse_daum_news(self, news_items) -> Iterable[CollectedItem]:
+        # 검색 결과 한 페이지 (URL 중복 제거 후)
+        for item in news_items:
+            if not item['title'] or not item['url']:
+                continue
+            # 언론사
+            press_name = item['press'].split('·')[0] if item['press'] else 'Unknown'
+            yield CollectedItem(
+                id=make_item_id(item['url']),
+                source="daum_news",
+                category="news",
+                platform="daum",
+                title=item['title'],
+                content=(item['summary'] or '').strip()[:500],
+                url=item['url'],
+                author=press_name.strip(),
+                author_id=self.generate_user_id(press_name, "daum_news"),
+                published_at=datetime.now().isoformat(),
+                collected_at=datetime.now().isoformat()
+            )
+    
+    def sources(self) -> List[Source]:
+        """스크래핑 대상 소스 목록 (RSS 먼저, 포털 쿼리는 네이버/다음을 번갈아 배치해 호스트 한도를 고르게 사용)"""
+        seen = SeenUrls()
+        portal = [
+            source
+            for pair in zip_longest(self.naver_sources(seen), self.daum_sources(seen))
+            for source in pair if source is not None
+        ]
+        return [self.nps_source(), self.mohw_source()] + portal
+    
+    def _run(self, sources: List[Source], label: str) -> List[CollectedItem]:
         data = []
-        
-        try:
-            search_url = "https://search.daum.net/search"
-            params = {
-                "w": "news",
-                "q": "국민연금",
-                "DA": "STC",  # 최신순
-                "p": 1
-            }
-            
-            response = requests.get(search_url, headers=self.headers, params=params, timeout=10)
-            if response.status_code != 200:
-                print(f"다음 뉴스 접근 실패: {response.status_code}")
-                return data
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # 뉴스 기사 추출
-            news_items = soup.select('.list_news .cont_inner')[:10]
-            
-            for item in news_items:
-                try:
-                    title_elem = item.select_one('.tit_main')
-                    if not title_elem:
-                        continue
-                    
-                    title_link = title_elem.find('a')
-                    if not title_link:
-                        continue
-                    
-                    title = title_link.text.strip()
-                    url = title_link.get('href', '')
-                    
-                    # 언론사
-                    press = item.select_one('.txt_info')
-                    press_name = press.text.split('·')[0] if press else 'Unknown'
-                    
-                    # 요약
-                    desc = item.select_one('.desc')
-                    content = desc.text if desc else ''
-                    
-                    if title and url and '국민연금' in title:
-                        data.append({
-                            "id": hashlib.md5(url.encode()).hexdigest()[:16],
-                            "source": "daum_news",
-                            "category": "news",
-                            "platform": "daum",
-                            "title": title,
-                            "content": content.strip()[:500],
-                            "url": url,
-                            "author": press_name.strip(),
-                            "author_id": self.generate_user_id(press_name, "daum_news"),
-                            "published_at": datetime.now().isoformat(),
-                            "collected_at": datetime.now().isoformat()
-                        })
-                        print(f"✅ 수집: {title[:50]}...")
-                        
-                except Exception as e:
-                    print(f"항목 파싱 오류: {e}")
-                    continue
-                    
-        except Exception as e:
-            print(f"다음 뉴스 스크래핑 오류: {e}")
-        
+        for source in sources:
+            try:
+                data.extend(run_source(source))
+            except Exception as e:
+                print(f"{label} 수집 오류: {e}")
+        for item in data:
+            print(f"✅ 수집: {item['title'][:50]}...")
         return data
     
+    def scrape_naver_news(self) -> List[CollectedItem]:
+        """네이버 뉴스에서 국민연금 관련 기사 스크래핑"""
+        return self._run(self.naver_sources(), "네이버 뉴스")
+    
+    def scrape_nps_rss(self) -> List[CollectedItem]:
+        """국민연금공단 RSS 피드 수집 (저장 후 commit_feed_watermark() 호출 필요)"""
+        return self._run([self.nps_source()], "국민연금공단 RSS")
+    
+    def scrape_mohw_rss(self) -> List[CollectedItem]:
+        """보건복지부 RSS 피드 수집 (저장 후 commit_feed_watermark() 호출 필요)"""
+        return self._run([self.mohw_source()], "보건복지부 RSS")
+    
+    def scrape_daum_news(self) -> List[CollectedItem]:
+        """다음 뉴스 스크래핑"""
+        return self._run(self.daum_sources(), "다음 뉴스")
+    
     def scrape_news_comments_from_api(self) -> List[Dict[str, Any]]:
         """실제 API로부터 뉴스 댓글 수집
         
@@ -291,49 +288,30 @@ class RealDataScraper:
         return []
     
     def collect_all(self) -> Dict[str, Any]:
-        """모든 실제 데이터 수집"""
+        """모든 실제 데이터 수집 (결과를 메모리에 모아 반환, 대량 수집은 main()의 스트리밍 실행 사용)"""
         all_data = []
         
         print("=" * 60)
         print("🔍 실제 웹사이트에서 데이터 수집 시작")
         print("=" * 60)
         
-        # 1. 네이버 뉴스
-        print("\n[1/5] 네이버 뉴스 스크래핑...")
-        naver_data = self.scrape_naver_news()
-        all_data.extend(naver_data)
-        print(f"✅ 수집 완료: {len(naver_data)}개")
-        time.sleep(1)  # 과도한 요청 방지
-        
-        # 2. 국민연금공단 RSS
-        print("\n[2/5] 국민연금공단 RSS 수집...")
-        nps_data = self.scrape_nps_rss()
-        all_data.extend(nps_data)
-        print(f"✅ 수집 완료: {len(nps_data)}개")
-        time.sleep(1)
-        
-        # 3. 보건복지부 RSS
-        print("\n[3/5] 보건복지부 RSS 수집...")
-        mohw_data = self.scrape_mohw_rss()
-        all_data.extend(mohw_data)
-        print(f"✅ 수집 완료: {len(mohw_data)}개")
-        time.sleep(1)
-        
-        # 4. 다음 뉴스
-        print("\n[4/5] 다음 뉴스 스크래핑...")
-        daum_data = self.scrape_daum_news()
-        all_data.extend(daum_data)
-        print(f"✅ 수집 완료: {len(daum_data)}개")
+        # 댓글 수집 시도 (비공개 API라 항상 스킵)
+        self.scrape_news_comments_from_api()
         
-        # 5. 댓글 수집 시도
-        print("\n[5/5] 댓글 수집 시도...")
-        comments = self.scrape_news_comments_from_api()
-        if comments:
-            all_data.extend(comments)
-            print(f"✅ 수집 완료: {len(comments)}개")
-        else:
-            print("⚠️  댓글 수집 스킵 (API 없음)")
-            print("   RSS 피드 기사와 Reddit 데이터를 사용하세요.")
+        # 네이버/국민연금공단/보건복지부/다음 → 정규화 → 필터 → 교차 소스 유사 중복 제거
+        os.makedirs(os.path.dirname(DEDUP_INDEX_PATH), exist_ok=True)
+        metrics = reset_metrics()
+        with DedupIndex(DEDUP_INDEX_PATH) as dedup_index:
+            sources = self.sources()
+            pipeline = Pipeline(dedup_index=dedup_index, sinks=[all_data.extend])
+            pipeline.run(sources)
+            # 결과는 메모리로 반환하므로 실행이 끝나면 확정
+            dedup_index.commit()
+            for source in sources:
+                if source.commit:
+                    source.commit()
+        pipeline.print_report()
+        metrics.print_summary()
         
         # 통계
         stats = self._generate_statistics(all_data)
@@ -387,27 +365,53 @@ class RealDataScraper:
         return stats
 
 
-def main():
-    """메인 실행"""
-    scraper = RealDataScraper()
-    result = scraper.collect_all()
+def parse_args(argv: List[str] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="실제 웹사이트 국민연금 데이터 스크래핑")
+    add_pipeline_arguments(parser)
+    add_transport_arguments(parser)
+    add_sink_arguments(parser)
+    add_embedding_arguments(parser)
+    add_article_arguments(parser)
+    add_portal_arguments(parser)
+    return parser.parse_args(argv)
+
+def main(argv: List[str] = None) -> CollectionResult:
+    """메인 실행 (소스 → 파이프라인 → 파일/파티션/Postgres로 스트리밍)"""
+    args = parse_args(argv)
+    configure_transport(args.http_cache, args.http_cache_dir)
+    scraper = RealDataScraper(
+        terms=args.queries, pages=args.pages, days=args.days,
+        window_days=args.window_days, per_host=args.per_host
+    )
     
-    # 저장
-    output_file = f"/home/nodove/workspace/Capstone/data/real_scraped_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    print("=" * 60)
+    print("🔍 실제 웹사이트에서 데이터 수집 시작")
+    print("=" * 60)
+    print(f"포털 검색: 쿼리 {len(scraper.queries)}개 × 최대 {scraper.pages}페이지 (네이버/다음)")
     
-    import os
-    os.makedirs(os.path.dirname(output_file), exist_ok=True)
+    output_file = f"/home/nodove/workspace/Capstone/data/real_scraped_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    result = run_collection(
+        scraper.sources(), args, output_file,
+        dedup_index_path=DEDUP_INDEX_PATH,
+        partition_dir=PARTITION_DIR,
+        partition_name="scrape_real_data"
+    )
+    analysis = result.stats.summary()
     
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(result, f, ensure_ascii=False, indent=2)
+    print("\n" + "=" * 60)
+    print("📊 수집 결과")
+    print("=" * 60)
+    print(f"총 수집 데이터: {result.total_count}개")
+    print(f"플랫폼별: {analysis['by_platform']}")
+    print(f"카테고리별: {analysis['by_category']}")
     
     print(f"\n💾 데이터 저장: {output_file}")
-    print(f"✨ 완료! {result['metadata']['total_count']}개의 실제 데이터 수집")
+    print(f"✨ 완료! {result.total_count}개의 실제 데이터 수집")
     
     # 데이터 검증
     print("\n✅ 데이터 검증:")
-    print(f"  - 실제 URL 수: {result['metadata']['statistics']['real_urls']}개")
-    print(f"  - 모든 URL이 http로 시작: {'예' if result['metadata']['statistics']['real_urls'] == len(result['data']) else '일부만'}")
+    print(f"  - 실제 URL 수: {result.real_urls}개")
+    print(f"  - 모든 URL이 http로 시작: {'예' if result.real_urls == result.total_count else '일부만'}")
     
     return result
 
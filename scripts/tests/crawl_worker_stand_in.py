@@ -0,0 +1,97 @@
+"""
+로컬 crawl-worker 대역 서버 (테스트/벤치마크 공용)
+
+crawl-worker와 같은 API(GET /health, POST /crawl)를 흉내 내는 HTTP 서버입니다.
+요청마다 delay만큼 지연하고, 요청한 URL과 전체/호스트별 최대 동시 요청 수를 기록합니다.
+URL이 /missing으로 끝나면 crawl-worker처럼 400(추출 실패)을 반환합니다.
+"""
+
+import json
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Tuple
+from urllib.parse import urlsplit
+
+
+class StandInState:
+    """대역 서버의 요청 수/동시 요청 수 기록"""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.urls: List[str] = []
+        self.active = 0
+        self.max_active = 0
+        self.active_by_host: Counter = Counter()
+        self.max_by_host: Counter = Counter()
+
+    def enter(self, url: str, host: str) -> None:
+        with self.lock:
+            self.requests += 1
+            self.urls.append(url)
+            self.active += 1
+            self.active_by_host[host] += 1
+            self.max_active = max(self.max_active, self.active)
+            self.max_by_host[host] = max(self.max_by_host[host], self.active_by_host[host])
+
+    def leave(self, host: str) -> None:
+        with self.lock:
+            self.active -= 1
+            self.active_by_host[host] -= 1
+
+
+def make_handler(state: StandInState):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def _send(self, status: int, body: dict) -> None:
+            payload = json.dumps(body, ensure_ascii=False).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def do_GET(self):
+            if self.path == "/health":
+                self._send(200, {"status": "ok"})
+            else:
+                self._send(404, {"detail": "Not Found"})
+
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            request = json.loads(self.rfile.read(length) or b"{}")
+            url = request.get("url", "")
+            host = urlsplit(url).netloc
+            state.enter(url, host)
+            try:
+                time.sleep(state.delay)
+                if url.endswith("/missing"):
+                    self._send(400, {"detail": "Crawl failed: 404"})
+                    return
+                self._send(200, {
+                    "url": url,
+                    "markdown": f"# {url}\n\n" + "국민연금 개혁안 본문 문단입니다. " * 40,
+                    "html": None,
+                    "status": "SUCCESS",
+                })
+            finally:
+                state.leave(host)
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+def start_stand_in(port: int = 0, delay: float = 0.05) -> Tuple[ThreadingHTTPServer, StandInState]:
+    """백그라운드 스레드로 대역 서버 실행 (port=0이면 빈 포트), server.shutdown()으로 종료"""
+    state = StandInState(delay)
+    server = ThreadingHTTPServer(("127.0.0.1", port), make_handler(state))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, state
@@ -0,0 +1,114 @@
+"""
+기사 본문 보강 단계(collectors.article.ArticleEnricher) 테스트
+
+로컬 crawl-worker 대역 서버(crawl_worker_stand_in.py)를 상대로 실행합니다.
+
+  python -m pytest -q scripts/tests/test_article_enrichment.py
+"""
+
+import os
+import sys
+
+import pytest
+
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, SCRIPTS_DIR)
+
+from collectors.article import ARTICLE_FIELD, ArticleCache, ArticleEnricher, CrawlWorkerClient  # noqa: E402
+from collectors.embedding import content_hash  # noqa: E402
+from collectors.records import CollectedItem  # noqa: E402
+from tests.crawl_worker_stand_in import start_stand_in  # noqa: E402
+
+CONCURRENCY = 6
+PER_HOST = 2
+DELAY = 0.05
+
+
+@pytest.fixture
+def stand_in():
+    server, state = start_stand_in(0, DELAY)
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}", state
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def enricher(stand_in):
+    base_url, _ = stand_in
+    enricher = ArticleEnricher(
+        CrawlWorkerClient(base_url, pool_size=CONCURRENCY),
+        ArticleCache(":memory:"),
+        max_concurrency=CONCURRENCY,
+        per_host=PER_HOST
+    )
+    try:
+        yield enricher
+    finally:
+        enricher.close()
+
+
+def make_item(i: int, host: int, path: str = None) -> CollectedItem:
+    return CollectedItem(
+        id=f"{i:016x}",
+        source="test",
+        title=f"국민연금 기사 {i}",
+        content=f"요약 {i}",
+        url=f"https://news{host}.example.com/{path or f'article/{i}'}",
+    )
+
+
+def test_health(stand_in, enricher):
+    assert enricher.client.health()
+
+
+def test_concurrency_limits(stand_in, enricher):
+    _, state = stand_in
+    # 절반을 한 호스트에 몰아 호스트별 한도가 전체 한도보다 먼저 걸리게 함
+    items = [make_item(i, 0 if i % 2 == 0 else 1 + i % 3) for i in range(40)]
+
+    enricher(items)
+
+    assert state.requests == len(items)
+    assert all(item.get(ARTICLE_FIELD) for item in items)
+    assert 1 < state.max_active <= CONCURRENCY
+    assert max(state.max_by_host.values()) <= PER_HOST
+
+
+def test_known_hashes_never_reach_worker(stand_in, enricher):
+    _, state = stand_in
+    items = [make_item(i, i % 3) for i in range(10)]
+    known = items[:6]
+    for item in known:
+        enricher.cache.put(content_hash(item), item['url'], f"cached {item['id']}")
+
+    enricher(items)
+
+    known_urls = {item['url'] for item in known}
+    assert not known_urls & set(state.urls)
+    assert sorted(state.urls) == sorted(item['url'] for item in items[6:])
+    assert [item[ARTICLE_FIELD] for item in known] == [f"cached {item['id']}" for item in known]
+    assert enricher.cached == len(known)
+    assert enricher.fetched == len(items) - len(known)
+
+
+def test_failures_are_not_cached(stand_in, enricher):
+    _, state = stand_in
+    items = [make_item(i, i % 2) for i in range(4)] + [make_item(4, 1, "missing")]
+    missing = items[-1]
+
+    enricher(items)
+
+    assert enricher.failed == 1
+    assert not missing.get(ARTICLE_FIELD)
+    assert enricher.cache.get_many([content_hash(missing)]) == {}
+
+    # 같은 항목을 다시 보강하면 실패했던 URL만 다시 요청
+    state.urls.clear()
+    again = [CollectedItem.from_dict({**item.to_dict(), ARTICLE_FIELD: None}) for item in items]
+    enricher(again)
+
+    assert state.urls == [missing['url']]
+    assert enricher.failed == 2
+    assert all(item.get(ARTICLE_FIELD) for item in again[:-1])
@@ -29,28 +29,53 @@ REPO_ROOT = Path(__file__).resolve().parents[2]
 REQUIRED_DOC = REPO_ROOT / ".windsurf/workflows/documentation-sync-workflow.md"
 FRONT_MATTER_PATTERN = re.compile(r"^---\n(.*?)\n---\n", re.DOTALL)
 ISO_FMT = "%Y-%m-%dT%H:%M:%S%z"
+SERVICE_DIR_NAMES = [
+    "BACKEND-ABSA-SERVICE",
+    "BACKEND-COLLECTOR-SERVICE",
+    "BACKEND-WEB-COLLECTOR",
+    "FRONTEND-DASHBOARD",
+]
+EXCLUDED_DIR_NAMES = {"node_modules", ".git", "venv", ".venv", "env", "__pycache__"}
 
 
 def is_excluded(path: Path) -> bool:
     """Exclude common non-doc directories."""
-    excluded = {"node_modules", ".git", "venv", ".venv", "env", "__pycache__"}
-    return any(part in excluded for part in path.parts)
+    return any(part in EXCLUDED_DIR_NAMES for part in path.parts)
 
 
-def get_target_docs() -> List[Path]:
-    """Collect target markdown docs across the repo.
+def _load_gitfiles():
+    """Import the shared doc-tools enumeration backend (scripts/doctools, stdlib only).
 
-    Includes:
-    - .windsurf/workflows/*.md (always, including REQUIRED_DOC)
-    - docs/**/*.md under repo root
-    - Service READMEs and service docs under known service directories
-    - Root README.md if present
+    Returns None when the scripts/ directory cannot be found next to this tool, in which
+    case the filesystem globs below are used.
     """
+    for base in Path(__file__).resolve().parents:
+        scripts_dir = base / "scripts"
+        if (scripts_dir / "doctools" / "gitfiles.py").is_file():
+            if str(scripts_dir) not in sys.path:
+                sys.path.insert(0, str(scripts_dir))
+            from doctools import gitfiles
+            return gitfiles
+    return None
+
+
+def is_target_path(rel: str) -> bool:
+    """Repo-relative POSIX path -> whether get_target_docs() would include it."""
+    if not rel.endswith(".md"):
+        return False
+    if rel == "README.md" or rel.startswith("docs/"):
+        return True
+    if rel.startswith(".windsurf/workflows/") and rel.count("/") == 2:
+        return True
+    for sdir in SERVICE_DIR_NAMES:
+        if rel == f"{sdir}/README.md" or rel.startswith(f"{sdir}/docs/"):
+            return True
+    return False
+
+
+def _glob_target_docs() -> List[Path]:
     targets: List[Path] = []
 
-    # Always include REQUIRED_DOC
-    targets.append(REQUIRED_DOC)
-
     # Root README
     readme = REPO_ROOT / "README.md"
     if readme.exists():
@@ -71,13 +96,7 @@ def get_target_docs() -> List[Path]:
                 targets.append(p)
 
     # Known service directories
-    service_dirs = [
-        REPO_ROOT / "BACKEND-ABSA-SERVICE",
-        REPO_ROOT / "BACKEND-COLLECTOR-SERVICE",
-        REPO_ROOT / "BACKEND-WEB-COLLECTOR",
-        REPO_ROOT / "FRONTEND-DASHBOARD",
-    ]
-    for sdir in service_dirs:
+    for sdir in (REPO_ROOT / name for name in SERVICE_DIR_NAMES):
         if not sdir.exists():
             continue
         # Service README
@@ -90,6 +109,40 @@ def get_target_docs() -> List[Path]:
             for p in s_docs.rglob("*.md"):
                 if p.is_file() and not is_excluded(p):
                     targets.append(p)
+    return targets
+
+
+def get_target_docs(since: Optional[str] = None, backend: str = "auto") -> List[Path]:
+    """Collect target markdown docs across the repo.
+
+    Includes:
+    - .windsurf/workflows/*.md (always, including REQUIRED_DOC)
+    - docs/**/*.md under repo root
+    - Service READMEs and service docs under known service directories
+    - Root README.md if present
+
+    Files come from one `git ls-files` call (scripts/doctools/gitfiles.py) when available.
+    With since, only targets changed since that git revision are returned (REQUIRED_DOC
+    included only if it changed).
+    """
+    gitfiles = _load_gitfiles()
+    targets: List[Path] = []
+
+    if since:
+        if gitfiles is None:
+            raise SystemExit("--since requires scripts/doctools/gitfiles.py")
+        changes = gitfiles.resolve_changes(REPO_ROOT, since)
+        rels = sorted(rel for rel in changes.changed if not is_excluded(Path(rel)) and is_target_path(rel))
+        return [REPO_ROOT / rel for rel in rels]
+
+    # Always include REQUIRED_DOC
+    targets.append(REQUIRED_DOC)
+
+    if gitfiles is None:
+        targets.extend(_glob_target_docs())
+    else:
+        rels = gitfiles.list_files(REPO_ROOT, EXCLUDED_DIR_NAMES, backend=backend)
+        targets.extend(REPO_ROOT / rel for rel in rels if is_target_path(rel))
 
     # Deduplicate while preserving order
     seen: set[Path] = set()
@@ -246,16 +299,28 @@ def check_required_docs(strict: bool = False) -> int:
     return check_docs([REQUIRED_DOC], strict=strict)
 
 
-def check_all_docs(strict: bool = False) -> int:
-    return check_docs(get_target_docs(), strict=strict)
+def check_all_docs(strict: bool = False, since: Optional[str] = None, backend: str = "auto") -> int:
+    return check_docs(get_target_docs(since, backend), strict=strict)
 
 
 def write_required_docs() -> int:
     return write_docs([REQUIRED_DOC])
 
 
-def write_all_docs() -> int:
-    return write_docs(get_target_docs())
+def write_all_docs(since: Optional[str] = None, backend: str = "auto") -> int:
+    return write_docs(get_target_docs(since, backend))
+
+
+def _add_enumeration_arguments(parser: argparse.ArgumentParser) -> None:
+    """--since / --file-backend from scripts/doctools/gitfiles.py (they apply with --all)."""
+    gitfiles = _load_gitfiles()
+    if gitfiles is not None:
+        gitfiles.add_enumeration_arguments(parser)
+        return
+    # Without gitfiles only the filesystem globs exist; --since then fails with a clear message
+    parser.add_argument("--since", metavar="REV", default=None,
+                        help="Only docs changed since this git revision (requires scripts/doctools)")
+    parser.set_defaults(file_backend="auto")
 
 
 def main(argv: list[str]) -> int:
@@ -265,19 +330,21 @@ def main(argv: list[str]) -> int:
     p_check = sub.add_parser("check", help="Verify DocSync headers and freshness")
     p_check.add_argument("--strict", action="store_true", help="Treat warnings as errors")
     p_check.add_argument("--all", action="store_true", help="Check all repo docs")
+    _add_enumeration_arguments(p_check)
 
     p_write = sub.add_parser("write", help="Initialize/update DocSync headers")
     p_write.add_argument("--all", action="store_true", help="Write headers for all repo docs")
+    _add_enumeration_arguments(p_write)
 
     args = parser.parse_args(argv)
 
     if args.cmd == "check":
         if getattr(args, "all", False):
-            return check_all_docs(strict=bool(getattr(args, "strict", False)))
+            return check_all_docs(strict=bool(getattr(args, "strict", False)), since=args.since, backend=args.file_backend)
         return check_required_docs(strict=bool(getattr(args, "strict", False)))
     if args.cmd == "write":
         if getattr(args, "all", False):
-            return write_all_docs()
+            return write_all_docs(since=args.since, backend=args.file_backend)
         return write_required_docs()
     return 2
 